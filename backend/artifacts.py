@@ -0,0 +1,65 @@
+"""
+Saving and loading of trained model artifacts.
+
+An artifact is a dictionary holding the fitted estimator plus everything
+needed to reproduce its inputs at prediction time:
+
+    model          fitted LinearRegression (GroupedLinearModel with group_by,
+                   BinnedGradientBoosting for hgb, SplineRegression for spline)
+    degree         polynomial degree, or None for a linear model
+    features       base feature names, in training order
+    target         target column name
+    imputer        fitted StreamingImputer (or None)
+    feature_names  design column names (polynomial terms)
+    design_means   training means of the design columns (explanation baseline)
+    terms          design column indices kept by stepwise selection (or None)
+    group_by       group column routing rows to per-cohort models (or None)
+    neighbors      SimilarStudents index of the training rows (or None)
+    intervals      Cholesky statistics for prediction intervals (or None)
+    intervals_unavailable
+                   why a model has no intervals (or None)
+"""
+import os
+from typing import Any, Dict
+
+import joblib
+
+
+def save_model_artifact(path: str, artifact: Dict[str, Any]) -> None:
+    """
+    Save a model artifact with joblib.
+
+    Args:
+        path: Output file path (.pkl)
+        artifact: Artifact dictionary
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    joblib.dump(artifact, path)
+
+
+def load_model_artifact(path: str) -> Dict[str, Any]:
+    """
+    Load a model artifact, upgrading older formats.
+
+    Models saved as a bare estimator (early linear models) are wrapped in an
+    artifact dictionary with unknown features.
+
+    Args:
+        path: Artifact file path
+
+    Returns:
+        Artifact dictionary
+    """
+    obj = joblib.load(path)
+    artifact = obj if isinstance(obj, dict) else {'model': obj}
+    artifact.setdefault('degree', None)
+    artifact.setdefault('features', None)
+    artifact.setdefault('target', None)
+    artifact.setdefault('imputer', None)
+    artifact.setdefault('terms', None)
+    artifact.setdefault('design_means', None)
+    artifact.setdefault('group_by', None)
+    artifact.setdefault('neighbors', None)
+    artifact.setdefault('intervals', None)
+    artifact.setdefault('intervals_unavailable', None)
+    return artifact
@@ -0,0 +1,241 @@
+"""
+Bagged least-squares ensembles built from reusable block Gram matrices.
+
+The training rows are shuffled once into contiguous blocks, copied into
+shared memory, and worker processes write the Gram matrix and moment vector
+of every block into a shared output array. A member trained on a bootstrap
+(or half-subsample) draw of blocks then only needs the count-weighted sum
+of the block statistics and one small solve, so its cost does not depend on
+the number of rows. Members of a linear model average to a single
+coefficient vector: the ensemble predicts at the cost of one model.
+
+Features are standardized before polynomial expansion (see solvers.py) and
+the averaged coefficients are mapped back to raw monomials.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .cohorts import solve_scaled
+from .config import (
+    BAGGING_BLOCK_ELEMENTS, BAGGING_BLOCKS, BAGGING_MAX_GRAM_ELEMENTS, BAGGING_METHOD,
+    RANDOM_STATE
+)
+from .features import default_feature_names, poly_term_index
+from .solvers import raw_poly_coefficients
+
+BAGGING_METHODS = ['bootstrap', 'subsample']
+
+# Shared array name -> (shared memory block name, shape)
+_Layout = Dict[str, Tuple[str, Tuple[int, ...]]]
+
+
+def _block_stats(
+    A: np.ndarray,
+    y: np.ndarray,
+    xtx: np.ndarray,
+    xty: np.ndarray,
+    bounds: np.ndarray,
+    blocks: Sequence[int]
+) -> None:
+    """Gram matrix and moment vector of every listed block of rows, written in place."""
+    for k in blocks:
+        rows = slice(bounds[k], bounds[k + 1])
+        xtx[k] = A[rows].T @ A[rows]
+        xty[k] = A[rows].T @ y[rows]
+
+
+def _shared_block_stats(layout: _Layout, bounds: np.ndarray, blocks: Sequence[int]) -> None:
+    """Worker: attach to the shared arrays and compute the statistics of some blocks."""
+    handles = {key: shared_memory.SharedMemory(name=name) for key, (name, _) in layout.items()}
+    try:
+        arrays = {key: np.ndarray(layout[key][1], dtype=float, buffer=shm.buf)
+                  for key, shm in handles.items()}
+        _block_stats(arrays['A'], arrays['y'], arrays['xtx'], arrays['xty'], bounds, blocks)
+        arrays.clear()  # Release the buffer views before closing
+    finally:
+        for shm in handles.values():
+            shm.close()
+
+
+@contextmanager
+def _shared_arrays(
+    shapes: Dict[str, Tuple[int, ...]]
+) -> Iterator[Tuple[_Layout, Dict[str, np.ndarray]]]:
+    """Allocate float arrays in shared memory; they are unlinked on exit."""
+    handles: Dict[str, shared_memory.SharedMemory] = {}
+    arrays: Dict[str, np.ndarray] = {}
+    try:
+        for key, shape in shapes.items():
+            handles[key] = shared_memory.SharedMemory(
+                create=True, size=max(int(np.prod(shape)) * 8, 1))
+            arrays[key] = np.ndarray(shape, dtype=float, buffer=handles[key].buf)
+        yield {key: (handles[key].name, shape) for key, shape in shapes.items()}, arrays
+    finally:
+        arrays.clear()
+        for shm in handles.values():
+            shm.close()
+            shm.unlink()
+
+
+def block_statistics(
+    A: np.ndarray,
+    y: np.ndarray,
+    n_blocks: int,
+    n_jobs: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-block normal-equation statistics of contiguous row blocks.
+
+    With more than one worker, A and y are placed once in shared memory and
+    the workers write their blocks' statistics into a shared output array.
+
+    Args:
+        A: Intercept-augmented design, shape (n, p)
+        y: Targets, shape (n,)
+        n_blocks: Number of row blocks
+        n_jobs: Worker processes (None for one per CPU)
+
+    Returns:
+        Tuple of (Gram matrices of shape (n_blocks, p, p), moment vectors of
+        shape (n_blocks, p))
+    """
+    n, p = A.shape
+    bounds = np.linspace(0, n, n_blocks + 1).astype(int)
+    workers = max(1, min(n_jobs or os.cpu_count() or 1, n_blocks))
+    if workers == 1:
+        xtx, xty = np.empty((n_blocks, p, p)), np.empty((n_blocks, p))
+        _block_stats(A, y, xtx, xty, bounds, range(n_blocks))
+        return xtx, xty
+
+    shapes = {'A': (n, p), 'y': (n,), 'xtx': (n_blocks, p, p), 'xty': (n_blocks, p)}
+    with _shared_arrays(shapes) as (layout, arrays):
+        arrays['A'][:] = A
+        arrays['y'][:] = y
+        chunks = [list(c) for c in np.array_split(np.arange(n_blocks), workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_shared_block_stats, [layout] * workers, [bounds] * workers, chunks))
+        return arrays['xtx'].copy(), arrays['xty'].copy()
+
+
+def _block_counts(
+    rng: np.random.Generator,
+    n_members: int,
+    n_blocks: int,
+    method: str
+) -> np.ndarray:
+    """How often every member draws every block, shape (n_members, n_blocks)."""
+    if method == 'bootstrap':
+        return rng.multinomial(n_blocks, np.full(n_blocks, 1.0 / n_blocks),
+                               size=n_members).astype(float)
+    chosen = rng.permuted(np.tile(np.arange(n_blocks), (n_members, 1)), axis=1)
+    counts = np.zeros((n_members, n_blocks))
+    np.put_along_axis(counts, chosen[:, :max(1, n_blocks // 2)], 1.0, axis=1)
+    return counts
+
+
+def _solve_members(xtx: np.ndarray, xty: np.ndarray) -> np.ndarray:
+    """Stacked solve of the members' normal equations (lstsq for singular draws)."""
+    try:
+        return solve_scaled(xtx, xty)
+    except np.linalg.LinAlgError:
+        return np.array([np.linalg.lstsq(g, b, rcond=None)[0] for g, b in zip(xtx, xty)])
+
+
+def _oob_rmse(
+    A: np.ndarray,
+    y: np.ndarray,
+    coefs: np.ndarray,
+    counts: np.ndarray,
+    bounds: np.ndarray
+) -> Optional[float]:
+    """RMSE of every row's average prediction by the members that did not draw its block."""
+    block_of_row = np.repeat(np.arange(len(bounds) - 1), np.diff(bounds))
+    total = np.zeros(len(A))
+    n_out = np.zeros(len(A))
+    step = max(1, BAGGING_BLOCK_ELEMENTS // max(len(coefs), 1))
+    for start in range(0, len(A), step):
+        rows = slice(start, start + step)
+        out = counts[:, block_of_row[rows]].T == 0
+        total[rows] = np.sum((A[rows] @ coefs.T) * out, axis=1)
+        n_out[rows] = out.sum(axis=1)
+    scored = n_out > 0
+    if not scored.any():
+        return None
+    return float(np.sqrt(np.mean((y[scored] - total[scored] / n_out[scored]) ** 2)))
+
+
+def fit_bagged(
+    X: np.ndarray,
+    y: np.ndarray,
+    n_members: int,
+    degree: Optional[int] = None,
+    method: str = BAGGING_METHOD,
+    n_blocks: int = BAGGING_BLOCKS,
+    random_state: int = RANDOM_STATE,
+    n_jobs: Optional[int] = None
+) -> Tuple[np.ndarray, float, Dict[str, Any]]:
+    """
+    Fit a bagged linear or polynomial least-squares ensemble.
+
+    Args:
+        X: Training features (the design of a linear model, or the base
+            features of a polynomial model)
+        y: Training targets
+        n_members: Number of ensemble members
+        degree: Polynomial degree (None for a linear model)
+        method: 'bootstrap' (blocks drawn with replacement) or 'subsample'
+            (half of the blocks drawn without replacement)
+        n_blocks: Row blocks resampled by the members (fewer if the block
+            Gram matrices would exceed BAGGING_MAX_GRAM_ELEMENTS)
+        random_state: Seed of the row shuffle and the member draws
+        n_jobs: Worker processes for the block statistics (None for one per CPU)
+
+    Returns:
+        Tuple of (averaged coefficients on the raw design as built by
+        build_poly, averaged intercept, ensemble diagnostics)
+    """
+    if method not in BAGGING_METHODS:
+        raise ValueError(f"Unknown bagging method '{method}'. Choose from {BAGGING_METHODS}")
+    if n_members < 1:
+        raise ValueError("Bagging needs at least one member")
+    start = time.perf_counter()
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    rng = np.random.default_rng(random_state)
+    order = rng.permutation(len(X))
+
+    mean = X.mean(axis=0)
+    scale = X.std(axis=0)
+    scale[scale == 0] = 1.0
+    index = poly_term_index(default_feature_names(X.shape[1]), degree or 1)
+    design = index.expand((X[order] - mean) / scale)
+    A = np.column_stack([np.ones(len(design)), design])
+    y = y[order]
+    del design
+
+    p = A.shape[1]
+    n_blocks = int(max(2, min(n_blocks, len(A), BAGGING_MAX_GRAM_ELEMENTS // (p * p))))
+    xtx, xty = block_statistics(A, y, n_blocks, n_jobs)
+    counts = _block_counts(rng, n_members, n_blocks, method)
+    coefs = _solve_members((counts @ xtx.reshape(n_blocks, -1)).reshape(n_members, p, p),
+                           counts @ xty)
+
+    bounds = np.linspace(0, len(A), n_blocks + 1).astype(int)
+    oob = _oob_rmse(A, y, coefs, counts, bounds)
+    averaged = coefs.mean(axis=0)
+    coef, intercept = raw_poly_coefficients(index, averaged[1:], averaged[0], mean, scale)
+    info = {
+        'n_members': n_members,
+        'method': method,
+        'n_blocks': n_blocks,
+        'oob_rmse': oob,
+        'member_coef_std': float(np.mean(coefs[:, 1:].std(axis=0))) if p > 1 else 0.0,
+        'seconds': time.perf_counter() - start,
+    }
+    return coef, intercept, info
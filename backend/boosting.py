@@ -0,0 +1,184 @@
+"""
+Histogram-based gradient boosting on pre-binned features.
+
+Features are quantile-binned once into uint8 codes. The codes of a training
+matrix are cached on disk (keyed by a hash of its contents), and the same
+codes are reused by every CV fold and hyperparameter, so the quantiles are
+computed only once. The boosting itself is scikit-learn's multithreaded
+HistGradientBoostingRegressor, fit directly on the codes.
+"""
+import hashlib
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.model_selection import KFold
+
+from .config import (
+    CACHE_DIR, CV_FOLDS, HGB_LEAF_NODES, HGB_LEARNING_RATE, HGB_MAX_BINS, HGB_MAX_ITER,
+    RANDOM_STATE
+)
+
+
+class FeatureBinner:
+    """
+    Per-feature quantile bins mapping values to uint8 codes.
+
+    Features with at most max_bins distinct values get one bin per value.
+    Missing values map to the reserved code 255.
+    """
+
+    def __init__(self, max_bins: int = HGB_MAX_BINS):
+        if not 2 <= max_bins <= 255:
+            raise ValueError(f"max_bins must be between 2 and 255, got {max_bins}")
+        self.max_bins = max_bins
+        self.edges: List[np.ndarray] = []
+
+    def fit(self, X: np.ndarray) -> "FeatureBinner":
+        """
+        Learn the bin edges of every column.
+
+        Args:
+            X: Training feature matrix
+
+        Returns:
+            self
+        """
+        X = np.asarray(X, dtype=float)
+        self.edges = []
+        for col in X.T:
+            col = col[~np.isnan(col)]
+            distinct = np.unique(col)
+            if len(distinct) <= self.max_bins:
+                edges = (distinct[:-1] + distinct[1:]) / 2
+            else:
+                quantiles = np.linspace(0, 1, self.max_bins + 1)[1:-1]
+                edges = np.unique(np.quantile(col, quantiles))
+            self.edges.append(edges)
+        return self
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Bin codes of a feature matrix.
+
+        Args:
+            X: Feature matrix with the fitted columns
+
+        Returns:
+            uint8 array of the same shape
+        """
+        X = np.asarray(X, dtype=float)
+        codes = np.empty(X.shape, dtype=np.uint8)
+        for j, edges in enumerate(self.edges):
+            codes[:, j] = np.searchsorted(edges, X[:, j], side='right')
+            codes[np.isnan(X[:, j]), j] = 255
+        return codes
+
+
+class BinnedGradientBoosting:
+    """
+    Gradient boosting model that bins raw features before predicting.
+
+    Attributes:
+        binner: Fitted FeatureBinner
+        model: HistGradientBoostingRegressor fit on the bin codes
+    """
+
+    def __init__(self, binner: FeatureBinner, model: HistGradientBoostingRegressor):
+        self.binner = binner
+        self.model = model
+        self.n_features_in_ = len(binner.edges)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predict from raw (imputed) features.
+
+        Args:
+            X: Feature matrix
+
+        Returns:
+            Predictions
+        """
+        return self.model.predict(self.binner.transform(X))
+
+
+def binned_training_data(
+    X: np.ndarray,
+    features: Sequence[str],
+    max_bins: int = HGB_MAX_BINS,
+    cache_dir: Optional[str] = CACHE_DIR
+) -> Tuple[FeatureBinner, np.ndarray]:
+    """
+    Bin a training matrix, reusing cached codes for identical data.
+
+    Args:
+        X: Training feature matrix
+        features: Feature names (part of the cache key)
+        max_bins: Maximum bins per feature
+        cache_dir: Directory of cached codes (None disables the cache)
+
+    Returns:
+        Tuple of (fitted binner, uint8 codes of X)
+    """
+    X = np.ascontiguousarray(X, dtype=float)
+    key = hashlib.blake2b(X.tobytes(), digest_size=16)
+    key.update(repr((X.shape, list(features), max_bins)).encode())
+    path = os.path.join(cache_dir, f"bins_{key.hexdigest()}.npz") if cache_dir else None
+
+    binner = FeatureBinner(max_bins)
+    if path and os.path.exists(path):
+        with np.load(path) as archive:
+            binner.edges = [archive[f"edges_{j}"] for j in range(X.shape[1])]
+            codes = archive['codes']
+        print(f"Loaded cached feature bins from {path}")
+        return binner, codes
+
+    codes = binner.fit(X).transform(X)
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        np.savez(path, codes=codes, **{f"edges_{j}": e for j, e in enumerate(binner.edges)})
+        print(f"Cached feature bins to {path}")
+    return binner, codes
+
+
+def make_hgb(max_leaf_nodes: int, random_state: int = RANDOM_STATE) -> HistGradientBoostingRegressor:
+    """Boosting estimator with the project's defaults (no internal early stopping)."""
+    return HistGradientBoostingRegressor(
+        max_iter=HGB_MAX_ITER, learning_rate=HGB_LEARNING_RATE, max_leaf_nodes=max_leaf_nodes,
+        max_bins=HGB_MAX_BINS, early_stopping=False, random_state=random_state
+    )
+
+
+def cv_select_hgb(
+    codes: np.ndarray,
+    y: np.ndarray,
+    leaf_nodes: Sequence[int] = HGB_LEAF_NODES,
+    k: int = CV_FOLDS,
+    random_state: int = RANDOM_STATE
+) -> Dict[str, Any]:
+    """
+    Select the number of leaves per tree by k-fold CV on pre-binned codes.
+
+    Args:
+        codes: Bin codes of the training features
+        y: Training targets
+        leaf_nodes: Candidate max_leaf_nodes values
+        k: Number of CV folds
+        random_state: Random seed of the estimator
+
+    Returns:
+        Dictionary with the best max_leaf_nodes and CV results
+    """
+    y = np.asarray(y, dtype=float)
+    folds = list(KFold(n_splits=k).split(codes))
+    cv_results = {}
+    for leaves in leaf_nodes:
+        scores = []
+        for train_idx, test_idx in folds:
+            model = make_hgb(leaves, random_state).fit(codes[train_idx], y[train_idx])
+            scores.append(np.sqrt(np.mean((y[test_idx] - model.predict(codes[test_idx])) ** 2)))
+        cv_results[leaves] = {'mean_rmse': float(np.mean(scores)), 'std_rmse': float(np.std(scores)),
+                              'scores': [float(s) for s in scores]}
+    best = min(cv_results, key=lambda leaves: cv_results[leaves]['mean_rmse'])
+    return {'best_max_leaf_nodes': best, 'cv_results': cv_results}
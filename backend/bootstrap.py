@@ -0,0 +1,146 @@
+"""
+Vectorized bootstrap confidence intervals for test metrics and coefficients.
+
+A batch of B resamples is drawn as a (B, n) matrix of multinomial row
+weights. Metrics of all resamples are then weighted sums (one matrix product
+per statistic), and the coefficients of all refits come from the weighted
+Gram matrices of the batch followed by one stacked solve. Batches use
+independently seeded RNG streams and are spread across processes; the
+results do not depend on the number of workers.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .cohorts import solve_scaled, weighted_gram
+from .config import (
+    BOOTSTRAP_BATCH, BOOTSTRAP_BLOCK_ELEMENTS, BOOTSTRAP_LEVEL, BOOTSTRAP_RESAMPLES, RANDOM_STATE
+)
+
+
+def _resample_weights(rng: np.random.Generator, n: int, n_resamples: int) -> np.ndarray:
+    """Bootstrap row counts, shape (n_resamples, n); each row sums to n."""
+    return rng.multinomial(n, np.full(n, 1.0 / n), size=n_resamples).astype(float)
+
+
+def _metric_batch(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    n_resamples: int,
+    seed: Any
+) -> np.ndarray:
+    """MAE, RMSE and R^2 of a batch of resamples, shape (3, n_resamples)."""
+    W = _resample_weights(np.random.default_rng(seed), len(y_true), n_resamples)
+    n = len(y_true)
+    err = y_true - y_pred
+    sse = W @ err ** 2
+    sst = W @ y_true ** 2 - (W @ y_true) ** 2 / n
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r2 = 1.0 - sse / sst
+    return np.vstack([W @ np.abs(err) / n, np.sqrt(sse / n), r2])
+
+
+def _coef_batch(A: np.ndarray, y: np.ndarray, n_resamples: int, seed: Any) -> np.ndarray:
+    """Intercept and coefficients refit on a batch of resamples, shape (n_resamples, p)."""
+    W = _resample_weights(np.random.default_rng(seed), len(y), n_resamples)
+    p = A.shape[1]
+    stats = weighted_gram(A, y, W, chunk_rows=max(1, BOOTSTRAP_BLOCK_ELEMENTS // (p * p)))
+    try:
+        return solve_scaled(stats['xtx'], stats['xty'])
+    except np.linalg.LinAlgError:
+        # A resample can drop enough rows to make its design singular
+        return np.array([np.linalg.lstsq(g, b, rcond=None)[0]
+                         for g, b in zip(stats['xtx'], stats['xty'])])
+
+
+def _run_batches(
+    func: Callable[..., np.ndarray],
+    data: Sequence[np.ndarray],
+    n_resamples: int,
+    random_state: int,
+    n_jobs: Optional[int]
+) -> List[np.ndarray]:
+    """Evaluate fixed-size, independently seeded batches of resamples, possibly in parallel."""
+    # Cap the (batch, n) weight matrix for very long inputs
+    batch = max(1, min(BOOTSTRAP_BATCH, BOOTSTRAP_BLOCK_ELEMENTS // len(data[-1])))
+    sizes = [min(batch, n_resamples - start) for start in range(0, n_resamples, batch)]
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+    args = [[d] * len(sizes) for d in data] + [sizes, seeds]
+
+    workers = max(1, min(n_jobs or os.cpu_count() or 1, len(sizes)))
+    if workers == 1:
+        return list(map(func, *args))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, *args))
+
+
+def _summarize(samples: np.ndarray, level: float) -> Dict[str, float]:
+    """Mean, standard deviation and percentile interval of bootstrap samples."""
+    samples = samples[np.isfinite(samples)]
+    lower, upper = np.percentile(samples, [50 * (1 - level), 50 * (1 + level)])
+    return {'mean': float(samples.mean()), 'std': float(samples.std()),
+            'lower': float(lower), 'upper': float(upper)}
+
+
+def bootstrap_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    level: float = BOOTSTRAP_LEVEL,
+    random_state: int = RANDOM_STATE,
+    n_jobs: Optional[int] = 1
+) -> Dict[str, Dict[str, float]]:
+    """
+    Bootstrap distributions of MAE, RMSE and R^2 over the test rows.
+
+    Args:
+        y_true: True test targets
+        y_pred: Test predictions
+        n_resamples: Number of bootstrap resamples
+        level: Confidence level of the percentile intervals
+        random_state: Base seed; batches use independent child seeds
+        n_jobs: Worker processes (None for one per CPU)
+
+    Returns:
+        Per metric: mean, std and the lower/upper interval bounds
+    """
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    samples = np.hstack(_run_batches(_metric_batch, [y_true, y_pred], n_resamples,
+                                     random_state, n_jobs))
+    return {name: _summarize(samples[i], level) for i, name in enumerate(['mae', 'rmse', 'r2'])}
+
+
+def bootstrap_coefficients(
+    X: np.ndarray,
+    y: np.ndarray,
+    names: Optional[Sequence[str]] = None,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    level: float = BOOTSTRAP_LEVEL,
+    random_state: int = RANDOM_STATE,
+    n_jobs: Optional[int] = 1
+) -> Dict[str, Dict[str, float]]:
+    """
+    Bootstrap distributions of OLS coefficients over the training rows.
+
+    Args:
+        X: Training design matrix (without intercept)
+        y: Training targets
+        names: Design column names (defaults to x0, x1, ...)
+        n_resamples: Number of bootstrap resamples
+        level: Confidence level of the percentile intervals
+        random_state: Base seed; batches use independent child seeds
+        n_jobs: Worker processes (None for one per CPU)
+
+    Returns:
+        Per coefficient (and 'intercept'): mean, std and interval bounds
+    """
+    X = np.asarray(X, dtype=float)
+    A = np.column_stack([np.ones(len(X)), X])
+    names = list(names) if names is not None else [f"x{j}" for j in range(X.shape[1])]
+    samples = np.vstack(_run_batches(_coef_batch, [A, np.asarray(y, dtype=float)], n_resamples,
+                                     random_state, n_jobs))
+    return {name: _summarize(samples[:, j], level)
+            for j, name in enumerate(['intercept'] + names)}
@@ -0,0 +1,262 @@
+"""
+Per-cohort (grouped) linear models fit in one pass.
+
+Rows are sorted by group once, the Gram matrix of every group is one BLAS
+matrix product over its contiguous rows, and all groups are solved together
+with one stacked ``np.linalg.solve``.
+Groups that are too small or rank-deficient, and groups unseen at
+prediction time, fall back to the pooled model.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from .config import GROUP_GRAM_BLOCK_ELEMENTS, GROUP_MIN_ROWS
+
+
+class GroupedLinearModel:
+    """
+    Table of linear models keyed by group label, with vectorized routed prediction.
+
+    Attributes:
+        group_column: Column holding the group label
+        groups: Group labels, one per row of coef_
+        coef_: Coefficients, shape (n_groups, n_features)
+        intercept_: Intercepts, shape (n_groups,)
+        n_rows: Training rows per group
+        pooled: Whether each group uses the pooled fallback
+        pooled_coef_: Coefficients of the model fit on all rows
+        pooled_intercept_: Intercept of the pooled model
+    """
+
+    def __init__(
+        self,
+        group_column: str,
+        groups: np.ndarray,
+        coef: np.ndarray,
+        intercept: np.ndarray,
+        n_rows: np.ndarray,
+        pooled: np.ndarray,
+        pooled_coef: np.ndarray,
+        pooled_intercept: float
+    ):
+        self.group_column = group_column
+        self.groups = np.asarray(groups, dtype=object)
+        self.coef_ = coef
+        self.intercept_ = intercept
+        self.n_rows = n_rows
+        self.pooled = pooled
+        self.pooled_coef_ = pooled_coef
+        self.pooled_intercept_ = pooled_intercept
+        self.n_features_in_ = coef.shape[1]
+
+    def group_codes(self, groups: Any) -> np.ndarray:
+        """
+        Row index into the model table for each label (-1 for unseen groups).
+
+        Args:
+            groups: Group label per row
+
+        Returns:
+            Integer codes
+        """
+        return pd.Index(self.groups).get_indexer(pd.Series(np.asarray(groups, dtype=object)))
+
+    def row_coef(self, groups: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Coefficients and intercept of the model routed to each row.
+
+        Args:
+            groups: Group label per row
+
+        Returns:
+            Tuple of (coef of shape (n_rows, n_features), intercept of shape (n_rows,))
+        """
+        codes = self.group_codes(groups)
+        codes[codes < 0] = len(self.groups)
+        coef = np.vstack([self.coef_, self.pooled_coef_])
+        intercept = np.append(self.intercept_, self.pooled_intercept_)
+        return coef[codes], intercept[codes]
+
+    def predict(self, X: np.ndarray, groups: Any) -> np.ndarray:
+        """
+        Predict every row with the model of its group.
+
+        Args:
+            X: Design matrix (already expanded for polynomial models)
+            groups: Group label per row
+
+        Returns:
+            Predictions
+        """
+        coef, intercept = self.row_coef(groups)
+        return np.einsum('ij,ij->i', np.asarray(X, dtype=float), coef) + intercept
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-group training rows and fallback flags, keyed by label."""
+        return {str(g): {'n_train': int(n), 'pooled_fallback': bool(p)}
+                for g, n, p in zip(self.groups, self.n_rows, self.pooled)}
+
+
+def weighted_gram(
+    A: np.ndarray,
+    y: np.ndarray,
+    W: Any,
+    chunk_rows: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Normal-equation statistics of many row weightings in one reduction.
+
+    Args:
+        A: Intercept-augmented design, shape (n, p)
+        y: Targets, shape (n,)
+        W: Row weights per system, dense or sparse, shape (m, n)
+        chunk_rows: Rows per block of outer products (default: as many as fit
+            in GROUP_GRAM_BLOCK_ELEMENTS, so a block holds at most that many floats)
+
+    Returns:
+        Dict with 'xtx' (m, p, p), 'xty' (m, p) and 'n' (total weight, shape (m,))
+    """
+    n, p = A.shape
+    if chunk_rows is None:
+        chunk_rows = max(1, GROUP_GRAM_BLOCK_ELEMENTS // (p * p))
+    xtx = np.zeros((W.shape[0], p * p))
+    for start in range(0, n, chunk_rows):
+        block = A[start:start + chunk_rows]
+        outer = (block[:, :, None] * block[:, None, :]).reshape(len(block), p * p)
+        xtx += W[:, start:start + chunk_rows] @ outer
+    return {
+        'xtx': xtx.reshape(W.shape[0], p, p),
+        'xty': np.asarray(W @ (A * y[:, None])),
+        'n': np.asarray(W.sum(axis=1)).ravel(),
+    }
+
+
+def grouped_gram(
+    A: np.ndarray,
+    y: np.ndarray,
+    codes: np.ndarray,
+    n_groups: int
+) -> Dict[str, np.ndarray]:
+    """
+    Per-group normal-equation statistics, one matrix product per group.
+
+    Rows are sorted by group, so every group's Gram matrix is computed from
+    a contiguous slice without materializing row-wise outer products.
+
+    Args:
+        A: Intercept-augmented design, shape (n, p)
+        y: Targets, shape (n,)
+        codes: Group code per row in [0, n_groups), or -1 to skip the row
+        n_groups: Number of groups
+
+    Returns:
+        Dict with 'xtx' (n_groups, p, p), 'xty' (n_groups, p) and 'n' (n_groups,)
+    """
+    p = A.shape[1]
+    order = np.argsort(codes, kind='stable')
+    order = order[codes[order] >= 0]
+    counts = np.bincount(codes[order], minlength=n_groups)
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+    xtx = np.zeros((n_groups, p, p))
+    xty = np.zeros((n_groups, p))
+    for g in np.flatnonzero(counts):
+        rows = A[order[bounds[g]:bounds[g + 1]]]
+        xtx[g] = rows.T @ rows
+        xty[g] = rows.T @ y[order[bounds[g]:bounds[g + 1]]]
+    return {'xtx': xtx, 'xty': xty, 'n': counts.astype(float)}
+
+
+def solve_scaled(xtx: np.ndarray, xty: np.ndarray) -> np.ndarray:
+    """Stacked solve of the normal equations with Jacobi (diagonal) scaling."""
+    diag = np.sqrt(np.einsum('...ii->...i', xtx))
+    diag[diag == 0] = 1.0
+    scaled = xtx / (diag[..., :, None] * diag[..., None, :])
+    z = np.linalg.solve(scaled, (xty / diag)[..., None])[..., 0]
+    return z / diag
+
+
+def fit_group_models(
+    X: np.ndarray,
+    y: np.ndarray,
+    groups: Any,
+    group_column: str,
+    min_rows: int = GROUP_MIN_ROWS
+) -> GroupedLinearModel:
+    """
+    Fit one least-squares model per group with a batched solve.
+
+    Args:
+        X: Design matrix (already expanded for polynomial models)
+        y: Targets
+        groups: Group label per row (missing labels only feed the pooled model)
+        group_column: Name of the group column (kept for routing at prediction)
+        min_rows: Groups with fewer rows (or fewer than the number of design
+            columns) use the pooled model
+
+    Returns:
+        GroupedLinearModel
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    codes, labels = pd.factorize(pd.Series(np.asarray(groups, dtype=object)), sort=True)
+    A = np.column_stack([np.ones(len(X)), X])
+    p = A.shape[1]
+
+    stats = grouped_gram(A, y, codes, len(labels))
+    pooled_beta = np.linalg.lstsq(A, y, rcond=None)[0]
+
+    solvable = stats['n'] >= max(min_rows, p)
+    if solvable.any():
+        ranks = np.linalg.matrix_rank(stats['xtx'][solvable])
+        solvable[np.flatnonzero(solvable)[ranks < p]] = False
+
+    beta = np.tile(pooled_beta, (len(labels), 1))
+    if solvable.any():
+        beta[solvable] = solve_scaled(stats['xtx'][solvable], stats['xty'][solvable])
+
+    n_fallback = int((~solvable).sum())
+    print(f"Fitted {int(solvable.sum())} group model(s) on '{group_column}'"
+          + (f"; {n_fallback} small or degenerate group(s) use the pooled model" if n_fallback else ""))
+
+    return GroupedLinearModel(
+        group_column=group_column,
+        groups=np.asarray(labels, dtype=object),
+        coef=beta[:, 1:],
+        intercept=beta[:, 0],
+        n_rows=stats['n'].astype(int),
+        pooled=~solvable,
+        pooled_coef=pooled_beta[1:],
+        pooled_intercept=float(pooled_beta[0]),
+    )
+
+
+def group_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    groups: Any,
+    model: Optional[GroupedLinearModel] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Test RMSE and MAE per group, vectorized with a groupby.
+
+    Args:
+        y_true: True targets
+        y_pred: Predictions
+        groups: Group label per row
+        model: If given, its per-group training summary is merged in
+
+    Returns:
+        Dict of per-group metrics keyed by label
+    """
+    err = pd.DataFrame({'g': np.asarray(groups, dtype=object), 'e': y_true - y_pred})
+    err['se'], err['ae'] = err['e'] ** 2, err['e'].abs()
+    agg = err.groupby('g')[['se', 'ae']].agg(['mean', 'size'])
+    result = {str(g): {'n_test': int(row[('se', 'size')]),
+                       'rmse': float(np.sqrt(row[('se', 'mean')])),
+                       'mae': float(row[('ae', 'mean')])}
+              for g, row in agg.iterrows()}
+    if model is not None:
+        for g, info in model.summary().items():
+            result.setdefault(g, {}).update(info)
+    return result
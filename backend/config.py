@@ -9,6 +9,56 @@ DEFAULT_DATA_PATH = "data/student_performance.csv"
 DEMO_DATA_PATH = "data/student_performance_demo.csv"
 DATA_PATH = os.getenv("DATA_PATH", DEFAULT_DATA_PATH)
 
+# Parallel CSV ingestion (None uses one worker per CPU)
+LOAD_WORKERS = None
+PARALLEL_READ_MIN_BYTES = 64 * 1024 * 1024
+READ_CHUNK_ROWS = 100_000
+
+# Synthetic data generation (rows per independently seeded chunk)
+SYNTH_CHUNK_ROWS = 1_000_000
+
+# Duplicate elimination (row hashing and Bloom filter sizing)
+DEDUP_DECIMALS = 6
+DEDUP_BLOOM_CAPACITY = 10_000_000
+DEDUP_BLOOM_ERROR_RATE = 1e-5
+
+# Declarative data schema (normalized column names). Numeric columns may set
+# 'min'/'max'; categorical columns list their allowed labels; 'unique' marks keys.
+_LEVELS = ["Low", "Medium", "High"]
+_YES_NO = ["Yes", "No"]
+DATA_SCHEMA = {
+    "id": {"type": "numeric", "unique": True},
+    "study_hours": {"type": "numeric", "min": 0, "max": 24},
+    "hours_studied": {"type": "numeric", "min": 0, "max": 168},
+    "attendance": {"type": "numeric", "min": 0, "max": 100},
+    "previous_scores": {"type": "numeric", "min": 0, "max": 100},
+    "tutoring_sessions": {"type": "numeric", "min": 0},
+    "sleep_hours": {"type": "numeric", "min": 0, "max": 24},
+    "physical_activity": {"type": "numeric", "min": 0},
+    "final_score": {"type": "numeric", "min": 0, "max": 100},
+    "exam_score": {"type": "numeric", "min": 0, "max": 100},
+    "parental_involvement": {"type": "category", "allowed": _LEVELS},
+    "access_to_resources": {"type": "category", "allowed": _LEVELS},
+    "extracurricular_activities": {"type": "category", "allowed": _YES_NO},
+    "motivation_level": {"type": "category", "allowed": _LEVELS},
+    "internet_access": {"type": "category", "allowed": _YES_NO},
+    "family_income": {"type": "category", "allowed": _LEVELS},
+    "teacher_quality": {"type": "category", "allowed": _LEVELS},
+    "school_type": {"type": "category", "allowed": ["Public", "Private"]},
+    "peer_influence": {"type": "category", "allowed": ["Positive", "Neutral", "Negative"]},
+    "learning_disabilities": {"type": "category", "allowed": _YES_NO},
+    "parental_education_level": {"type": "category",
+                                 "allowed": ["High School", "College", "Postgraduate"]},
+    "distance_from_home": {"type": "category", "allowed": ["Near", "Moderate", "Far"]},
+    "gender": {"type": "category", "allowed": ["Male", "Female"]},
+}
+
+# Fixed dtypes for known columns, used for projected reads
+COLUMN_DTYPES = {
+    col: "float64" if rule["type"] == "numeric" else "category"
+    for col, rule in DATA_SCHEMA.items()
+}
+
 # Model configuration
 RANDOM_STATE = 42
 TEST_SIZE = 0.2
@@ -24,11 +74,107 @@ DEFAULT_TARGET = "final_score"
 POLY_DEGREES = [2, 3, 4, 5]
 CV_FOLDS = 5
 
+CV_METHODS = ['analytic', 'loo', 'kfold']
+CV_METHOD = 'analytic'
+POLY_INDEX_CACHE_SIZE = 32
+
+# Least-squares solver selection by the estimated condition number of the
+# scaled design: Cholesky up to the first bound, QR up to the second, else SVD
+SOLVER = 'auto'
+SOLVER_CHOLESKY_MAX_COND = 1e5
+SOLVER_QR_MAX_COND = 1e10
+
+# Bagged ensembles (--bagging N): members resample shuffled row blocks whose
+# Gram matrices are computed once; their total size is capped in elements
+BAGGING_METHOD = 'bootstrap'
+BAGGING_BLOCKS = 64
+BAGGING_MAX_GRAM_ELEMENTS = 16_000_000
+BAGGING_BLOCK_ELEMENTS = 4_000_000
+
+# Histogram gradient boosting (--model hgb): features are binned once into
+# uint8 codes, cached under CACHE_DIR and reused by every CV fold
+HGB_MAX_BINS = 255
+HGB_MAX_ITER = 200
+HGB_LEARNING_RATE = 0.1
+HGB_LEAF_NODES = [15, 31, 63]
+
+# Additive B-spline regression (--model spline): cubic bases with knots at
+# feature quantiles; pairwise tensor terms use a coarser knot grid. The sparse
+# design is densified in blocks of at most this many elements for the Gram matrix
+SPLINE_DEGREE = 3
+SPLINE_KNOTS = 10
+SPLINE_TENSOR_KNOTS = 5
+SPLINE_ALPHA = 1e-6
+SPLINE_BLOCK_ELEMENTS = 4_000_000
+
+# Budgeted model search (--time-budget): successive halving over degree,
+# ridge strength and feature subsets on growing row subsamples
+SEARCH_ALPHAS = [0.0, 1e-4, 1e-2, 1.0]
+SEARCH_ETA = 3
+SEARCH_MIN_ROWS = 200
+SEARCH_VALIDATION_FRACTION = 0.2
+
+# Stepwise term selection (scored by LOO PRESS)
+SELECT_DIRECTIONS = ['forward', 'backward', 'both']
+STEPWISE_TOL = 1e-4
+STEPWISE_COLLINEAR_TOL = 1e-6
+STEPWISE_BLOCK_ELEMENTS = 4_000_000
+
+# Permutation importance (repeats evaluated per vectorized block)
+IMPORTANCE_REPEATS = 30
+IMPORTANCE_BATCH_REPEATS = 16
+
+# What-if surfaces and partial dependence
+WHATIF_GRID_POINTS = 20
+WHATIF_MAX_ROWS = 1_000_000
+WHATIF_MAX_STUDENTS = 1000
+
+# Counterfactual recommendations: features a student can change (all others
+# are held fixed) and the iteration limits of the non-linear solver
+COUNTERFACTUAL_FEATURES = [
+    "study_hours", "hours_studied", "attendance", "tutoring_sessions", "sleep_hours"
+]
+COUNTERFACTUAL_MAX_ITER = 50
+COUNTERFACTUAL_TOL = 1e-6
+COUNTERFACTUAL_BLOCK_ELEMENTS = 4_000_000
+
+# Bootstrap confidence intervals (resamples per vectorized batch)
+BOOTSTRAP_RESAMPLES = 1000
+BOOTSTRAP_LEVEL = 0.95
+BOOTSTRAP_BATCH = 100
+BOOTSTRAP_BLOCK_ELEMENTS = 4_000_000
+
+# OLS prediction intervals (rows per block of triangular solves)
+INTERVAL_LEVEL = 0.95
+INTERVAL_BLOCK_ROWS = 65536
+
+# Similar-student lookup: KD-tree up to this many features, blocked
+# brute-force (BLAS) distances beyond it
+NEIGHBORS_K = 5
+NEIGHBORS_LEAF_SIZE = 40
+NEIGHBORS_KDTREE_MAX_DIM = 16
+NEIGHBORS_BLOCK_ELEMENTS = 4_000_000
+
+# Per-cohort models (--group-by): smaller groups use the pooled model
+GROUP_MIN_ROWS = 30
+GROUP_GRAM_BLOCK_ELEMENTS = 4_000_000
+
+# Imputation (fit on the training split only)
+IMPUTE_STRATEGY = 'mean'
+IMPUTE_SKETCH_K = 256
+
+# Streaming dataset profile
+PROFILE_QUANTILES = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+PROFILE_SKETCH_K = 256
+PROFILE_TOP_K = 20
+
 # Output paths
 OUTPUT_DIR = "outputs"
 MODELS_DIR = os.path.join(OUTPUT_DIR, "models")
 FIGURES_DIR = os.path.join(OUTPUT_DIR, "figures")
+CACHE_DIR = os.path.join(OUTPUT_DIR, "cache")
 METRICS_DIR = OUTPUT_DIR
+QUARANTINE_PATH = os.path.join(OUTPUT_DIR, "quarantine.csv")
 
 # Plotting configuration
 FIGURE_SIZE = (10, 6)
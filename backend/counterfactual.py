@@ -0,0 +1,330 @@
+"""
+Counterfactual recommendations: the smallest change to a student's
+actionable features that reaches a target score.
+
+For a linear model the problem for every student is
+
+    minimize  sum_i (delta_i / s_i) ** 2
+    s.t.      w . delta = target - prediction,  lower <= delta <= upper
+
+whose solution is delta_i = clip(lambda * w_i * s_i ** 2, lower_i, upper_i)
+for the smallest lambda >= 0 meeting the target. The constraint sum is
+piecewise linear in lambda, so lambda is found for a whole roster at once by
+evaluating it at the sorted breakpoints where coordinates hit their bounds.
+Polynomial models repeat this projection on the model linearized at the
+current point (from the original features) until every student converges.
+Features that are not actionable are never changed.
+"""
+import argparse
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .artifacts import load_model_artifact
+from .config import (
+    COUNTERFACTUAL_BLOCK_ELEMENTS, COUNTERFACTUAL_FEATURES, COUNTERFACTUAL_MAX_ITER,
+    COUNTERFACTUAL_TOL, DATA_SCHEMA, METRICS_DIR
+)
+from .data import iter_partitions
+from .scoring import design_powers, predict_array
+
+
+def project_to_target(
+    w: np.ndarray,
+    gap: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    scale: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Minimum weighted-norm steps with w . delta = gap inside box bounds, for every row.
+
+    Args:
+        w: Per-row linear weights of the actionable features, shape (n, k)
+        gap: Required increase per row, shape (n,); rows with gap <= 0 do not move
+        lower: Lower bound of each step (<= 0), shape (n, k)
+        upper: Upper bound of each step (>= 0), shape (n, k)
+        scale: Per-feature cost scale s (a change of s costs 1), shape (k,)
+
+    Returns:
+        Tuple of (steps of shape (n, k), feasible flag per row). Infeasible
+        rows get the largest reachable increase (their moving features at bounds).
+    """
+    w = np.asarray(w, dtype=float)
+    gap = np.asarray(gap, dtype=float)
+    n, k = w.shape
+    scale2 = np.ones(k) if scale is None else np.asarray(scale, dtype=float) ** 2
+    a = w * scale2
+    moving = a != 0
+    rows = np.arange(n)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # lambda at which each coordinate reaches the bound it moves towards
+        limit = np.where(a > 0, upper, lower)
+        hits = np.where(moving, limit / np.where(moving, a, 1.0), np.inf)
+        breaks = np.sort(hits, axis=1)
+
+        # Constraint value at every breakpoint: (n, k breakpoints, k coordinates)
+        steps = np.where(moving[:, None, :],
+                         np.clip(breaks[:, :, None] * a[:, None, :], lower[:, None, :],
+                                 upper[:, None, :]), 0.0)
+        reached = np.einsum('nmk,nk->nm', steps, w) >= gap[:, None]
+        feasible = reached.any(axis=1) | (gap <= 0)
+
+        # Between breakpoints the constraint is linear in lambda
+        first = reached.argmax(axis=1)
+        lam_left = np.where(first > 0, breaks[rows, first - 1], 0.0)
+        at_left = np.where(moving, np.clip(lam_left[:, None] * a, lower, upper), 0.0)
+        free = moving & (hits > lam_left[:, None])
+        slope = np.einsum('nk,nk->n', np.where(free, w, 0.0), a)
+        lam = lam_left + (gap - np.einsum('nk,nk->n', at_left, w)) / slope
+
+        lam = np.where(gap <= 0, 0.0, np.where(feasible, lam, np.inf))
+        delta = np.where(moving, np.clip(lam[:, None] * a, lower, upper), 0.0)
+    return delta, feasible
+
+
+def model_gradient(
+    artifact: Dict[str, Any],
+    X: np.ndarray,
+    groups: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Gradient of a linear or polynomial model's prediction with respect to its base features.
+
+    Args:
+        artifact: Model artifact
+        X: Imputed base features in the artifact's feature order
+        groups: Group label per row (per-cohort models only)
+
+    Returns:
+        Array of shape (n_rows, n_features)
+    """
+    model = artifact['model']
+    if not hasattr(model, 'coef_'):
+        raise ValueError("Counterfactuals need a linear or polynomial model")
+    X = np.asarray(X, dtype=float)
+    n, n_features = X.shape
+    powers = design_powers(artifact)
+
+    if artifact['group_by'] is not None:
+        coef, _ = model.row_coef(groups)
+    else:
+        coef = np.broadcast_to(np.asarray(model.coef_, dtype=float), (n, len(powers)))
+
+    grad = np.empty((n, n_features))
+    block = max(1, COUNTERFACTUAL_BLOCK_ELEMENTS // (len(powers) * n_features))
+    for j in range(n_features):
+        # d/dx_j of prod_f x_f ** p_f is p_j * x_j ** (p_j - 1) * prod_{f != j} x_f ** p_f
+        lowered = powers.copy()
+        lowered[:, j] = np.maximum(powers[:, j] - 1, 0)
+        for start in range(0, n, block):
+            terms = np.prod(X[start:start + block, None, :] ** lowered[None], axis=2)
+            grad[start:start + block, j] = np.einsum('ij,ij->i', terms * powers[:, j],
+                                                     coef[start:start + block])
+    return grad
+
+
+def feature_bounds(features: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Value bounds of features from the data schema (infinite where unconstrained).
+
+    Args:
+        features: Feature names
+
+    Returns:
+        Tuple of (lower bounds, upper bounds)
+    """
+    lower = np.array([DATA_SCHEMA.get(f, {}).get('min', -np.inf) for f in features], dtype=float)
+    upper = np.array([DATA_SCHEMA.get(f, {}).get('max', np.inf) for f in features], dtype=float)
+    return lower, upper
+
+
+def counterfactuals(
+    artifact: Dict[str, Any],
+    X: np.ndarray,
+    target: Union[float, np.ndarray],
+    actionable: Optional[Sequence[str]] = None,
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    scale: Optional[Dict[str, float]] = None,
+    groups: Optional[np.ndarray] = None,
+    max_iter: int = COUNTERFACTUAL_MAX_ITER,
+    tol: float = COUNTERFACTUAL_TOL
+) -> Dict[str, Any]:
+    """
+    Smallest actionable change that brings every student's prediction up to a target.
+
+    Linear models are solved exactly with one batched projection; polynomial
+    models iterate the projection on the linearized model. Students already
+    at or above the target are left unchanged.
+
+    Args:
+        artifact: Model artifact (linear or polynomial)
+        X: Base features in the artifact's feature order (may contain NaNs)
+        target: Target score, scalar or one per student
+        actionable: Features that may change (default: COUNTERFACTUAL_FEATURES
+            present in the model); all other features are immutable
+        bounds: (min, max) per actionable feature (default: the data schema)
+        scale: Cost scale per actionable feature, e.g. its standard deviation
+            (default 1: changes are measured in the feature's own units)
+        groups: Group label per student (per-cohort models only)
+        max_iter: Maximum linearization steps for polynomial models
+        tol: Score tolerance for convergence of polynomial models
+
+    Returns:
+        Dictionary with the actionable features, the recommended feature
+        matrix and its change, the current and achieved predictions, a
+        feasibility flag per student and the number of iterations
+    """
+    names = list(artifact['features'])
+    if actionable is None:
+        actionable = [f for f in COUNTERFACTUAL_FEATURES if f in names]
+    missing = [f for f in actionable if f not in names]
+    if missing:
+        raise ValueError(f"Actionable features not in the model: {missing}")
+    if not actionable:
+        raise ValueError("The model has none of the actionable features")
+    idx = [names.index(f) for f in actionable]
+
+    X = np.asarray(X, dtype=float)
+    if artifact['imputer'] is not None:
+        X = artifact['imputer'].transform(X)
+    n = len(X)
+    target = np.broadcast_to(np.asarray(target, dtype=float), (n,))
+
+    lo, hi = feature_bounds(actionable)
+    for j, f in enumerate(actionable):
+        if bounds and f in bounds:
+            lo[j], hi[j] = bounds[f]
+    s = np.array([(scale or {}).get(f, 1.0) for f in actionable], dtype=float)
+    # Students already outside a bound are not pushed back inside it
+    lower = np.minimum(lo - X[:, idx], 0.0)
+    upper = np.maximum(hi - X[:, idx], 0.0)
+
+    predicted = predict_array(artifact, X, groups)
+    X_cf = X.copy()
+    active = np.flatnonzero(predicted < target)
+    linear = artifact['degree'] is None or artifact['degree'] == 1
+    iterations = 0
+
+    while len(active) and iterations < (1 if linear else max_iter):
+        iterations += 1
+        g = None if groups is None else np.asarray(groups)[active]
+        current = predict_array(artifact, X_cf[active], g) if iterations > 1 else predicted[active]
+        w = model_gradient(artifact, X_cf[active], g)[:, idx]
+        # Linearized requirement on the total change from the original features
+        moved = X_cf[np.ix_(active, idx)] - X[np.ix_(active, idx)]
+        gap = target[active] - current + np.einsum('ij,ij->i', w, moved)
+        delta, _ = project_to_target(w, gap, lower[active], upper[active], s)
+        X_cf[np.ix_(active, idx)] = X[np.ix_(active, idx)] + delta
+
+        if not linear:
+            # Keep iterating only students that moved and have not reached the target
+            step = np.abs(delta - moved).max(axis=1)
+            achieved = predict_array(artifact, X_cf[active], g)
+            active = active[(np.abs(achieved - target[active]) > tol) & (step > tol)]
+
+    achieved = predict_array(artifact, X_cf, groups)
+    return {
+        'features': list(actionable),
+        'X': X_cf,
+        'delta': X_cf - X,
+        'predicted': predicted,
+        'achieved': achieved,
+        'feasible': achieved >= target - max(tol, 1e-9),
+        'iterations': iterations,
+    }
+
+
+def recommend_file(
+    model_path: str,
+    data_path: str,
+    output_path: str,
+    target: float,
+    actionable: Optional[List[str]] = None,
+    id_column: Optional[str] = None,
+    n_jobs: Optional[int] = None
+) -> int:
+    """
+    Write counterfactual recommendations for every student predicted below a target.
+
+    Args:
+        model_path: Path of the saved model artifact
+        data_path: CSV partition(s) of students
+        output_path: Output CSV path
+        target: Target score
+        actionable: Features that may change (default: COUNTERFACTUAL_FEATURES)
+        id_column: Optional identifier column copied to the output
+        n_jobs: Number of parallel partition readers
+
+    Returns:
+        Number of students below the target
+    """
+    artifact = load_model_artifact(model_path)
+    features = artifact['features']
+    labels = [c for c in [id_column, artifact['group_by']] if c]
+    columns = list(dict.fromkeys(labels + features))
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    n_at_risk = n_feasible = 0
+    header = True
+    for df in iter_partitions(data_path, n_jobs=n_jobs, columns=columns, label_columns=labels):
+        groups = df[artifact['group_by']].to_numpy() if artifact['group_by'] else None
+        result = counterfactuals(artifact, df[features].to_numpy(dtype=float), target,
+                                 actionable=actionable, groups=groups)
+        at_risk = result['predicted'] < target
+        out = pd.DataFrame({
+            'predicted_score': result['predicted'][at_risk],
+            'achievable_score': result['achieved'][at_risk],
+            'feasible': result['feasible'][at_risk],
+        })
+        for f in result['features']:
+            j = features.index(f)
+            out[f"{f}_change"] = result['delta'][at_risk, j]
+            out[f"{f}_recommended"] = result['X'][at_risk, j]
+        if id_column:
+            out.insert(0, id_column, df[id_column].to_numpy()[at_risk])
+        out.to_csv(output_path, mode='w' if header else 'a', header=header, index=False)
+        header = False
+        n_at_risk += len(out)
+        n_feasible += int(out['feasible'].sum())
+
+    print(f"{n_at_risk} students below {target}; {n_feasible} can reach it "
+          f"-> {output_path}")
+    return n_at_risk
+
+
+def main():
+    """CLI for counterfactual recommendations with a saved model."""
+    parser = argparse.ArgumentParser(description='Counterfactual Recommendations for Students')
+    parser.add_argument('--model-path', type=str, required=True,
+                        help='Path of the saved model')
+    parser.add_argument('--data-path', type=str, required=True,
+                        help='CSV of students (file, directory or glob)')
+    parser.add_argument('--target-score', type=float, required=True,
+                        help='Score every student should reach')
+    parser.add_argument('--features', type=str, default=None,
+                        help='Comma-separated actionable features (default: from config)')
+    parser.add_argument('--id-column', type=str, default=None,
+                        help='Identifier column to copy to the output')
+    parser.add_argument('--output', type=str,
+                        default=os.path.join(METRICS_DIR, "counterfactuals.csv"),
+                        help='Output CSV path')
+    parser.add_argument('--n-jobs', type=int, default=None,
+                        help='Number of parallel partition readers')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model_path):
+        print(f"Error: model not found at {args.model_path}")
+        sys.exit(1)
+
+    actionable = [f.strip() for f in args.features.split(',')] if args.features else None
+    recommend_file(args.model_path, args.data_path, args.output, args.target_score,
+                   actionable=actionable, id_column=args.id_column, n_jobs=args.n_jobs)
+
+
+if __name__ == "__main__":
+    main()
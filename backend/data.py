@@ -4,11 +4,26 @@ Data loading, cleaning, and splitting functionality.
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from scipy.special import ndtr
+import glob
+import importlib.util
+import io
+import operator
 import os
+import re
+import shutil
 
-from .config import DEMO_DATA_PATH, DEFAULT_DATA_PATH
+from .config import (
+    DEMO_DATA_PATH, DEFAULT_DATA_PATH, LOAD_WORKERS, PARALLEL_READ_MIN_BYTES,
+    READ_CHUNK_ROWS, COLUMN_DTYPES, DEDUP_DECIMALS, DEDUP_BLOOM_CAPACITY,
+    DEDUP_BLOOM_ERROR_RATE, RANDOM_STATE, SYNTH_CHUNK_ROWS, DATA_SCHEMA
+)
 from .utils import file_exists
+from .imputation import StreamingImputer
+from .validation import ValidationReport, split_valid
 
 
 def maybe_create_demo_csv(path_demo: str) -> None:
@@ -63,6 +78,189 @@ def maybe_create_demo_csv(path_demo: str) -> None:
     print(f"Demo dataset created with {len(df)} samples")
 
 
+# Categorical columns of the StudentPerformanceFactors schema:
+# raw name -> (labels, sampling probabilities, additive exam score effects)
+_SYNTH_CATEGORIES = {
+    'Parental_Involvement': (['Low', 'Medium', 'High'], [0.2, 0.51, 0.29], [-2.0, 0.0, 2.0]),
+    'Access_to_Resources': (['Low', 'Medium', 'High'], [0.2, 0.5, 0.3], [-2.0, 0.0, 2.0]),
+    'Extracurricular_Activities': (['No', 'Yes'], [0.4, 0.6], [0.0, 0.5]),
+    'Motivation_Level': (['Low', 'Medium', 'High'], [0.29, 0.51, 0.2], [-1.0, 0.0, 1.0]),
+    'Internet_Access': (['No', 'Yes'], [0.08, 0.92], [-1.0, 0.0]),
+    'Family_Income': (['Low', 'Medium', 'High'], [0.4, 0.4, 0.2], [-1.0, 0.0, 1.0]),
+    'Teacher_Quality': (['Low', 'Medium', 'High'], [0.1, 0.6, 0.3], [-1.0, 0.0, 1.0]),
+    'School_Type': (['Public', 'Private'], [0.7, 0.3], [0.0, 0.0]),
+    'Peer_Influence': (['Negative', 'Neutral', 'Positive'], [0.21, 0.39, 0.4], [-1.0, 0.0, 1.0]),
+    'Learning_Disabilities': (['No', 'Yes'], [0.89, 0.11], [0.0, -1.0]),
+    'Parental_Education_Level': (['High School', 'College', 'Postgraduate'],
+                                 [0.5, 0.3, 0.2], [-0.5, 0.0, 0.5]),
+    'Distance_from_Home': (['Near', 'Moderate', 'Far'], [0.6, 0.3, 0.1], [0.5, 0.0, -0.5]),
+    'Gender': (['Male', 'Female'], [0.58, 0.42], [0.0, 0.0]),
+}
+
+# Column order of the original export
+_SYNTH_COLUMNS = [
+    'Hours_Studied', 'Attendance', 'Parental_Involvement', 'Access_to_Resources',
+    'Extracurricular_Activities', 'Sleep_Hours', 'Previous_Scores', 'Motivation_Level',
+    'Internet_Access', 'Tutoring_Sessions', 'Family_Income', 'Teacher_Quality',
+    'School_Type', 'Peer_Influence', 'Physical_Activity', 'Learning_Disabilities',
+    'Parental_Education_Level', 'Distance_from_Home', 'Gender', 'Exam_Score'
+]
+
+
+def _sample_labels(u: np.ndarray, labels: List[str], probs: List[float]) -> Tuple[pd.Categorical, np.ndarray]:
+    """Map uniform draws to category labels by inverse CDF; returns labels and codes."""
+    codes = np.searchsorted(np.cumsum(probs)[:-1], u, side='right')
+    return pd.Categorical.from_codes(codes, categories=labels), codes
+
+
+def generate_synthetic_data(
+    n_rows: int,
+    seed: Any = RANDOM_STATE,
+    missing_rate: float = 0.0
+) -> pd.DataFrame:
+    """
+    Generate synthetic records with the full StudentPerformanceFactors schema.
+    
+    Study hours, attendance and motivation share a latent engagement factor,
+    so they are positively correlated, and the exam score is a linear
+    function of the numeric columns plus category effects and noise.
+    Generation is fully vectorized and deterministic for a given seed.
+    
+    Args:
+        n_rows: Number of records
+        seed: Seed (or entropy sequence) for np.random.default_rng
+        missing_rate: Fraction of feature values replaced with missing values
+        
+    Returns:
+        DataFrame with the original (un-normalized) column names
+    """
+    rng = np.random.default_rng(seed)
+    engagement = rng.standard_normal(n_rows)
+    
+    def correlated(weight: float) -> np.ndarray:
+        return weight * engagement + np.sqrt(1 - weight ** 2) * rng.standard_normal(n_rows)
+    
+    numeric = {
+        'Hours_Studied': np.rint(20 + 6 * correlated(0.5)).clip(1, 44),
+        'Attendance': np.rint(80 + 11.5 * correlated(0.4)).clip(60, 100),
+        'Sleep_Hours': np.rint(rng.normal(7, 1.5, n_rows)).clip(4, 10),
+        'Previous_Scores': rng.integers(50, 101, n_rows).astype(float),
+        'Tutoring_Sessions': rng.poisson(1.5, n_rows).clip(0, 8).astype(float),
+        'Physical_Activity': np.rint(rng.normal(3, 1, n_rows)).clip(0, 6),
+    }
+    
+    columns: Dict[str, Any] = dict(numeric)
+    effect = np.zeros(n_rows)
+    for name, (labels, probs, effects) in _SYNTH_CATEGORIES.items():
+        if name == 'Motivation_Level':
+            u = ndtr(correlated(0.5))
+        else:
+            u = rng.random(n_rows)
+        columns[name], codes = _sample_labels(u, labels, probs)
+        effect += np.asarray(effects)[codes]
+    
+    score = (40 + 0.3 * numeric['Hours_Studied'] + 0.2 * numeric['Attendance']
+             + 0.05 * numeric['Previous_Scores'] + 0.5 * numeric['Tutoring_Sessions']
+             + 0.2 * numeric['Physical_Activity'] + effect + rng.normal(0, 2, n_rows))
+    columns['Exam_Score'] = np.rint(score).clip(55, 100)
+    
+    df = pd.DataFrame(columns)[_SYNTH_COLUMNS]
+    if missing_rate > 0:
+        for name in _SYNTH_COLUMNS[:-1]:
+            mask = rng.random(n_rows) < missing_rate
+            if name in numeric:
+                df.loc[mask, name] = np.nan
+            else:
+                df[name] = df[name].mask(mask)
+    return df
+
+
+def _write_synthetic_chunk(
+    path: str,
+    n_rows: int,
+    seed: int,
+    chunk_index: int,
+    missing_rate: float,
+    fmt: str,
+    header: bool
+) -> str:
+    """Generate one chunk (seeded by seed and chunk index) and write it to path."""
+    df = generate_synthetic_data(n_rows, seed=[seed, chunk_index], missing_rate=missing_rate)
+    if fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False, header=header)
+    return path
+
+
+def write_synthetic_dataset(
+    path: str,
+    n_rows: int,
+    seed: int = RANDOM_STATE,
+    fmt: str = 'csv',
+    chunk_rows: int = SYNTH_CHUNK_ROWS,
+    missing_rate: float = 0.0,
+    n_jobs: Optional[int] = LOAD_WORKERS
+) -> List[str]:
+    """
+    Write a synthetic dataset of any size, generating chunks in parallel.
+    
+    Chunk ``i`` is seeded with ``(seed, i)``, so the output depends only on
+    the seed, row count and chunk size, not on the number of workers. A path
+    ending in ``.csv`` produces a single CSV file; any other path is a
+    directory of ``part-NNNNN`` partition files (CSV or Parquet), which
+    ``load_data`` reads in parallel.
+    
+    Args:
+        path: Output .csv file or partition directory
+        n_rows: Total number of records
+        seed: Base random seed
+        fmt: 'csv' or 'parquet' (Parquet requires pyarrow)
+        chunk_rows: Records per generated chunk
+        missing_rate: Fraction of feature values replaced with missing values
+        n_jobs: Worker processes (None for one per CPU)
+        
+    Returns:
+        Paths of the written files
+    """
+    if fmt not in ('csv', 'parquet'):
+        raise ValueError(f"Unknown format '{fmt}'. Choose 'csv' or 'parquet'")
+    if fmt == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        raise ImportError("Parquet output requires pyarrow: pip install pyarrow")
+    
+    single_file = fmt == 'csv' and path.endswith('.csv')
+    out_dir = path + '.parts' if single_file else path
+    os.makedirs(out_dir, exist_ok=True)
+    
+    sizes = [min(chunk_rows, n_rows - start) for start in range(0, n_rows, chunk_rows)]
+    part_paths = [os.path.join(out_dir, f"part-{i:05d}.{fmt}") for i in range(len(sizes))]
+    # A single CSV keeps only the first chunk's header
+    headers = [not single_file or i == 0 for i in range(len(sizes))]
+    tasks = [part_paths, sizes, [seed] * len(sizes), list(range(len(sizes))),
+             [missing_rate] * len(sizes), [fmt] * len(sizes), headers]
+    
+    print(f"Generating {n_rows} synthetic rows in {len(sizes)} chunk(s)...")
+    workers = n_jobs or os.cpu_count() or 1
+    if workers == 1 or len(sizes) == 1:
+        list(map(_write_synthetic_chunk, *tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_write_synthetic_chunk, *tasks))
+    
+    if not single_file:
+        print(f"Synthetic dataset written to {out_dir}")
+        return part_paths
+    
+    with open(path, 'wb') as out:
+        for part in part_paths:
+            with open(part, 'rb') as f:
+                shutil.copyfileobj(f, out)
+            os.remove(part)
+    os.rmdir(out_dir)
+    print(f"Synthetic dataset written to {path}")
+    return [path]
+
+
 def resolve_data_path(env_or_default: str, path_demo: str) -> str:
     """
     Resolve which data path to use, creating demo if needed.
@@ -74,8 +272,8 @@ def resolve_data_path(env_or_default: str, path_demo: str) -> str:
     Returns:
         Resolved data path
     """
-    # First try the environment/default path
-    if file_exists(env_or_default):
+    # First try the environment/default path (a file, directory or glob of partitions)
+    if list_partitions(env_or_default):
         print(f"Using dataset: {env_or_default}")
         return env_or_default
     
@@ -90,30 +288,765 @@ def resolve_data_path(env_or_default: str, path_demo: str) -> str:
     return path_demo
 
 
-def load_data(path: str) -> pd.DataFrame:
+def normalize_columns(columns: pd.Index) -> pd.Index:
+    """
+    Normalize column names: strip whitespace, lowercase, replace spaces with underscores.
+    
+    Args:
+        columns: Raw column labels
+        
+    Returns:
+        Normalized column labels
+    """
+    return columns.str.strip().str.lower().str.replace(' ', '_')
+
+
+def list_partitions(path: str) -> List[str]:
+    """
+    Expand a data path into the CSV partitions it refers to.
+    
+    Args:
+        path: A CSV file, a directory of CSV files, or a glob pattern
+        
+    Returns:
+        Sorted list of CSV file paths (empty if nothing matches)
+    """
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, "*.csv")))
+    if glob.has_magic(path):
+        return sorted(p for p in glob.glob(path) if os.path.isfile(p))
+    return [path] if os.path.isfile(path) else []
+
+
+def encode_category(values: pd.Series, allowed: Sequence[str]) -> pd.Series:
+    """
+    Ordinal-encode labels by their position in a schema's allowed list.
+    
+    Labels are matched case- and whitespace-insensitively; unknown labels
+    become NaN. Only the distinct values are looked up, so this is cheap on
+    categorical columns.
+    
+    Args:
+        values: Label column
+        allowed: Allowed labels, in code order
+        
+    Returns:
+        Float codes
+    """
+    lookup = {label.strip().lower(): float(i) for i, label in enumerate(allowed)}
+    uniques = pd.unique(values.dropna())
+    mapping = {u: lookup.get(str(u).strip().lower(), np.nan) for u in uniques}
+    return values.map(mapping).astype(float)
+
+
+def _coerce_numeric(df: pd.DataFrame, exclude: Sequence[str] = ()) -> pd.DataFrame:
+    """
+    Convert non-numeric columns to numbers in place, coercing errors to NaN.
+    
+    Categorical columns of config.DATA_SCHEMA are ordinal-encoded by their
+    allowed labels instead of being coerced to NaN.
+    
+    Args:
+        df: Input DataFrame
+        exclude: Label columns to leave unconverted
+        
+    Returns:
+        The same DataFrame
+    """
+    numeric_columns = df.select_dtypes(include=[np.number]).columns
+    for col in df.columns:
+        if col in numeric_columns or col in exclude:
+            continue
+        rule = DATA_SCHEMA.get(col, {})
+        if rule.get('type') == 'category' and rule.get('allowed'):
+            df[col] = encode_category(df[col], rule['allowed'])
+        else:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+# Row predicate: (column, operator, value), e.g. ('school_type', '==', 'Public')
+Filter = Tuple[str, str, Any]
+
+_FILTER_OPS = {
+    '==': operator.eq, '!=': operator.ne,
+    '<': operator.lt, '<=': operator.le,
+    '>': operator.gt, '>=': operator.ge,
+}
+_FILTER_PATTERN = re.compile(r'^\s*([\w ]+?)\s*(==|!=|<=|>=|<|>)\s*(.+?)\s*$')
+
+
+def _parse_value(text: str) -> Any:
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def parse_filter(expr: str) -> Filter:
+    """
+    Parse a CLI row predicate such as ``school_type==Public`` or ``exam_score>=60``.
+    
+    ``a|b`` on the right of ``==`` means membership in {a, b}.
+    
+    Args:
+        expr: Predicate expression
+        
+    Returns:
+        Filter tuple of (normalized column, operator, value)
+    """
+    match = _FILTER_PATTERN.match(expr)
+    if not match:
+        raise ValueError(f"Invalid filter '{expr}'. Expected e.g. 'school_type==Public'")
+    column, op, value = match.groups()
+    column = normalize_columns(pd.Index([column]))[0]
+    if op == '==' and '|' in value:
+        return column, 'in', [_parse_value(v.strip()) for v in value.split('|')]
+    return column, op, _parse_value(value)
+
+
+def filter_mask(df: pd.DataFrame, filters: Sequence[Filter]) -> np.ndarray:
+    """
+    Evaluate row predicates on a (normalized) DataFrame.
+    
+    Numeric values compare against the column coerced to numbers; string
+    values compare against the raw labels.
+    
+    Args:
+        df: DataFrame with normalized column names
+        filters: Row predicates, all of which must hold
+        
+    Returns:
+        Boolean mask of rows to keep
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for column, op, value in filters:
+        col = df[column]
+        values = value if op == 'in' else [value]
+        if all(isinstance(v, (int, float)) for v in values):
+            col = pd.to_numeric(col, errors='coerce')
+        if op == 'in':
+            mask &= col.isin(values).to_numpy()
+        elif op in _FILTER_OPS:
+            mask &= _FILTER_OPS[op](col, value).fillna(False).to_numpy(dtype=bool)
+        else:
+            raise ValueError(f"Unsupported filter operator '{op}'")
+    return mask
+
+
+def _known_dtypes(raw_names: Sequence[str]) -> Dict[str, Any]:
+    """Map raw header names to the fixed dtypes known for their normalized names."""
+    normalized = normalize_columns(pd.Index(raw_names))
+    return {raw: COLUMN_DTYPES[norm] for raw, norm in zip(raw_names, normalized)
+            if norm in COLUMN_DTYPES}
+
+
+def _read_with_fallback(
+    read: Callable[[Dict[str, Any]], Iterable[pd.DataFrame]],
+    dtype: Dict[str, Any],
+    finish: Optional[Callable[[pd.DataFrame], Any]] = None,
+    coerce_numeric: bool = True
+) -> List[Any]:
+    """
+    Parse with fixed dtypes, re-parsing with numeric columns as text if values do not fit them.
+    
+    Args:
+        read: Parses the input with the given dtypes into one or more frames
+        dtype: Fixed dtypes by raw column name
+        finish: Applied to every frame as soon as it is parsed
+        coerce_numeric: Coerce the numeric columns of a fallback parse with
+            pd.to_numeric (unparseable values become NaN); False leaves them
+            as text for callers that validate before coercing
+        
+    Returns:
+        Parsed (and finished) frames
+    """
+    finish = finish or (lambda df: df)
+    try:
+        return [finish(df) for df in read(dtype)]
+    except ValueError:
+        pass
+    
+    numeric = [c for c, dt in dtype.items() if pd.api.types.is_numeric_dtype(dt)]
+    parts = []
+    for df in read({c: dt for c, dt in dtype.items() if c not in numeric}):
+        if coerce_numeric:
+            for col in numeric:
+                if col in df.columns:
+                    df[col] = pd.to_numeric(df[col], errors='coerce')
+        parts.append(finish(df))
+    return parts
+
+
+@dataclass(frozen=True)
+class _ReadOptions:
+    """Per-chunk work shipped to reader processes."""
+    projection: Optional[List[str]] = None
+    filters: Optional[Sequence[Filter]] = None
+    validate: bool = False
+    hash_rows: bool = False
+    hash_keys: Optional[List[str]] = None
+    coerce_numeric: bool = True
+    label_columns: Tuple[str, ...] = ()
+
+
+class _Chunk(NamedTuple):
+    """A finished chunk as returned by reader processes."""
+    frame: pd.DataFrame
+    quarantined: Optional[pd.DataFrame]
+    counts: Dict[str, int]
+    hashes: Optional[np.ndarray]
+
+
+def _finish_chunk(df: pd.DataFrame, options: _ReadOptions = _ReadOptions()) -> _Chunk:
+    """
+    Normalize names, apply row predicates, project, validate, hash and coerce a parsed chunk.
+    
+    Validation and row hashing run on the raw labels, before numeric
+    coercion, so category values are still visible.
+    
+    Args:
+        df: Raw parsed chunk
+        options: Projection, predicates, validation and hashing to apply
+        
+    Returns:
+        Finished chunk
+    """
+    df.columns = normalize_columns(df.columns)
+    if options.filters:
+        df = df[filter_mask(df, options.filters)]
+    
+    # Validate the projected columns, but hash full records (or their keys)
+    quarantined, counts = None, {}
+    if options.validate:
+        checked = df if options.projection is None else df[
+            [c for c in options.projection if c in df.columns]
+        ]
+        _, quarantined, counts = split_valid(checked)
+        if quarantined is not None and len(quarantined):
+            df = df.drop(index=quarantined.index)
+    
+    hashes = row_hashes(df, options.hash_keys) if options.hash_rows else None
+    
+    if options.projection is not None:
+        df = df[[c for c in options.projection if c in df.columns]]
+    
+    if not options.coerce_numeric:
+        return _Chunk(df, quarantined, counts, hashes)
+    copied = options.filters or options.projection is not None or options.validate
+    df = _coerce_numeric(df.copy() if copied else df, exclude=options.label_columns)
+    return _Chunk(df, quarantined, counts, hashes)
+
+
+def _concat_chunks(parts: List[_Chunk], columns: Optional[List[str]]) -> _Chunk:
+    """Concatenate finished chunks of one partition."""
+    if not parts:
+        return _Chunk(pd.DataFrame(columns=columns), None, {}, None)
+    if len(parts) == 1:
+        return parts[0]
+    
+    df = pd.concat([p.frame for p in parts], ignore_index=True)
+    quarantined = [p.quarantined for p in parts if p.quarantined is not None and len(p.quarantined)]
+    counts: Dict[str, int] = {}
+    for part in parts:
+        for name, n in part.counts.items():
+            counts[name] = counts.get(name, 0) + n
+    hashes = None
+    if parts[0].hashes is not None:
+        hashes = np.concatenate([p.hashes for p in parts])
+    return _Chunk(
+        df,
+        pd.concat(quarantined, ignore_index=True) if quarantined else None,
+        counts,
+        hashes,
+    )
+
+
+def _needed_raw_columns(raw_names: List[str], options: _ReadOptions) -> List[str]:
+    """Raw header names that must be parsed to serve a projected read."""
+    normalized = normalize_columns(pd.Index(raw_names))
+    if options.projection is None or (options.hash_rows and not options.hash_keys):
+        needed = set(normalized)
+    else:
+        needed = set(options.projection).union(options.hash_keys or [])
+    needed.update(f[0] for f in options.filters or [])
+    return [raw for raw, norm in zip(raw_names, normalized) if norm in needed]
+
+
+def _read_partition(
+    path: str, 
+    columns: Optional[List[str]] = None,
+    options: _ReadOptions = _ReadOptions()
+) -> _Chunk:
     """
-    Load dataset from CSV file with basic preprocessing.
+    Read and normalize a single CSV partition (runs in worker processes).
+    
+    With a projection or filters, only the needed columns are parsed (with
+    fixed dtypes where known) and predicates are applied chunk by chunk.
     
     Args:
         path: Path to CSV file
+        columns: Shared schema to align the partition to
+        options: Projection, predicates, validation and hashing to apply
+        
+    Returns:
+        Finished partition
+    """
+    projection, filters = options.projection, options.filters
+    if projection is None and not filters:
+        parts = [_finish_chunk(pd.read_csv(path), options)]
+    else:
+        raw_names = pd.read_csv(path, nrows=0).columns.tolist()
+        usecols = _needed_raw_columns(raw_names, options)
+        # Numeric text that does not fit the fixed dtypes is validated and
+        # coerced by _finish_chunk
+        parts = _read_with_fallback(
+            lambda dt: pd.read_csv(path, usecols=usecols, dtype=dt, chunksize=READ_CHUNK_ROWS),
+            _known_dtypes(usecols),
+            finish=lambda chunk: _finish_chunk(chunk, options),
+            coerce_numeric=False,
+        )
+    
+    chunk = _concat_chunks(parts, projection)
+    if projection is not None:
+        return chunk._replace(frame=chunk.frame.reindex(columns=projection))
+    if columns is not None:
+        return chunk._replace(frame=chunk.frame.reindex(columns=columns))
+    return chunk
+
+
+def csv_byte_ranges(path: str, n_ranges: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Split a CSV file into newline-aligned byte ranges after its header.
+    
+    Quoted fields must not contain embedded newlines.
+    
+    Args:
+        path: Path to CSV file
+        n_ranges: Desired number of ranges
+        
+    Returns:
+        Tuple of (header column names, list of (start, end) byte offsets)
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        header = f.readline()
+        data_start = f.tell()
+        
+        bounds = [data_start]
+        step = max(1, (size - data_start) // max(1, n_ranges))
+        for i in range(1, n_ranges):
+            target = data_start + i * step
+            if target <= bounds[-1]:
+                continue
+            f.seek(target)
+            f.readline()  # advance to the start of the next full line
+            pos = f.tell()
+            if pos >= size:
+                break
+            bounds.append(pos)
+        bounds.append(size)
+    
+    names = pd.read_csv(io.BytesIO(header), nrows=0).columns.tolist()
+    return names, [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def _read_byte_range(
+    path: str, 
+    start: int, 
+    end: int, 
+    names: List[str], 
+    dtype: Dict[str, Any],
+    usecols: Optional[List[str]] = None,
+    coerce_numeric: bool = True
+) -> pd.DataFrame:
+    """
+    Parse one byte range of a CSV file (runs in worker processes).
+    
+    The explicit dtypes are inferred from the head of the file, so a later
+    range may hold values that do not fit them: such a range is re-parsed
+    with its numeric columns as text, which are then coerced to numbers
+    (unparseable values become NaN), as the serial reader would.
+    
+    Args:
+        path: Path to CSV file
+        start: First byte of the range (start of a line)
+        end: One past the last byte of the range (end of a line)
+        names: Column names from the header
+        dtype: Explicit dtypes shared by every range
+        usecols: Raw column names to parse (None parses all)
+        coerce_numeric: Coerce numeric text of a re-parsed range (False
+            leaves it for validation)
+        
+    Returns:
+        Parsed DataFrame for the range
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        buf = f.read(end - start)
+    return _read_with_fallback(
+        lambda dt: [pd.read_csv(io.BytesIO(buf), header=None, names=names, dtype=dt,
+                                usecols=usecols)],
+        dtype,
+        coerce_numeric=coerce_numeric,
+    )[0]
+
+
+def infer_csv_dtypes(path: str, sample_rows: int = 10000) -> Dict[str, Any]:
+    """
+    Infer explicit dtypes from the head of a CSV file.
+    
+    Numeric columns are widened to float64 so later ranges with missing
+    values parse consistently; everything else is read as object.
+    
+    Args:
+        path: Path to CSV file
+        sample_rows: Number of leading rows to inspect
+        
+    Returns:
+        Mapping of column name to dtype
+    """
+    sample = pd.read_csv(path, nrows=sample_rows)
+    return {
+        col: np.float64 if pd.api.types.is_numeric_dtype(dt) else object
+        for col, dt in sample.dtypes.items()
+    }
+
+
+def iter_csv_parallel(
+    path: str, 
+    n_jobs: Optional[int] = LOAD_WORKERS, 
+    dtype: Optional[Dict[str, Any]] = None,
+    chunks_per_worker: int = 4,
+    usecols: Optional[List[str]] = None,
+    coerce_numeric: bool = True
+) -> Iterator[pd.DataFrame]:
+    """
+    Parse one large CSV in newline-aligned byte ranges across worker processes.
+    
+    Args:
+        path: Path to CSV file
+        n_jobs: Worker processes (None for one per CPU)
+        dtype: Explicit dtypes (inferred from the file head if None)
+        chunks_per_worker: Byte ranges per worker, for load balancing
+        usecols: Raw column names to parse (None parses all)
+        coerce_numeric: Coerce numeric text of ranges that do not fit the
+            dtypes (False leaves it for validation)
+        
+    Yields:
+        Parsed DataFrames in file order
+    """
+    workers = n_jobs or os.cpu_count() or 1
+    names, ranges = csv_byte_ranges(path, workers * chunks_per_worker)
+    if dtype is None:
+        dtype = infer_csv_dtypes(path)
+    
+    if workers == 1:
+        for start, end in ranges:
+            yield _read_byte_range(path, start, end, names, dtype, usecols, coerce_numeric)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            _read_byte_range,
+            [path] * len(ranges),
+            [a for a, _ in ranges],
+            [b for _, b in ranges],
+            [names] * len(ranges),
+            [dtype] * len(ranges),
+            [usecols] * len(ranges),
+            [coerce_numeric] * len(ranges),
+        )
+
+
+def read_csv_parallel(
+    path: str, 
+    n_jobs: Optional[int] = LOAD_WORKERS, 
+    dtype: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
+    """
+    Parallel drop-in for ``pd.read_csv`` on a single large file.
+    
+    Args:
+        path: Path to CSV file
+        n_jobs: Worker processes (None for one per CPU)
+        dtype: Explicit dtypes (inferred from the file head if None)
+        
+    Returns:
+        DataFrame with all rows in file order
+    """
+    frames = list(iter_csv_parallel(path, n_jobs=n_jobs, dtype=dtype))
+    if not frames:
+        return pd.read_csv(path, nrows=0)
+    return pd.concat(frames, ignore_index=True)
+
+
+def partition_schema(paths: List[str]) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Build the shared schema of several partitions from their headers.
+    
+    The shared schema is the union of all normalized columns, in first-seen
+    order. Partitions lacking some of those columns are reported.
+    
+    Args:
+        paths: CSV partition paths
+        
+    Returns:
+        Tuple of (shared columns, {path: missing columns}) for mismatching partitions
+    """
+    headers = {p: list(normalize_columns(pd.read_csv(p, nrows=0).columns)) for p in paths}
+    
+    columns: List[str] = []
+    for header in headers.values():
+        columns.extend(c for c in header if c not in columns)
+    
+    mismatches = {}
+    for p, header in headers.items():
+        missing = [c for c in columns if c not in header]
+        if missing:
+            mismatches[p] = missing
+    return columns, mismatches
+
+
+def _iter_chunks(
+    paths: List[str],
+    schema: List[str],
+    n_jobs: Optional[int],
+    options: _ReadOptions
+) -> Iterator[_Chunk]:
+    """Parse partitions (or byte ranges of one large file) into finished chunks."""
+    projection = options.projection
+    if len(paths) == 1 and n_jobs != 1 and os.path.getsize(paths[0]) >= PARALLEL_READ_MIN_BYTES:
+        # One monolithic file: split it into byte ranges instead
+        raw_names = pd.read_csv(paths[0], nrows=0).columns.tolist()
+        usecols = _needed_raw_columns(raw_names, options) if projection is not None else None
+        dtype = infer_csv_dtypes(paths[0])
+        dtype.update(_known_dtypes(raw_names))
+        for df in iter_csv_parallel(paths[0], n_jobs=n_jobs, dtype=dtype, usecols=usecols,
+                                    coerce_numeric=False):
+            chunk = _finish_chunk(df, options)
+            if projection is not None:
+                chunk = chunk._replace(frame=chunk.frame.reindex(columns=projection))
+            yield chunk
+        return
+    
+    if len(paths) == 1 or n_jobs == 1:
+        for p in paths:
+            yield _read_partition(p, schema, options)
+        return
+    
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        yield from executor.map(
+            _read_partition, paths, [schema] * len(paths), [options] * len(paths)
+        )
+
+
+def row_hashes(df: pd.DataFrame, key_columns: Optional[List[str]] = None) -> np.ndarray:
+    """
+    Vectorized 64-bit hashes of normalized rows.
+    
+    Labels are stripped and lowercased and numbers are rounded, so cosmetic
+    differences between re-exports do not hide duplicates.
+    
+    Args:
+        df: DataFrame with normalized column names (before numeric coercion)
+        key_columns: Columns identifying a record (None uses every column)
+        
+    Returns:
+        uint64 hash per row
+    """
+    cols = [c for c in key_columns if c in df.columns] if key_columns else list(df.columns)
+    normalized = {}
+    for col in cols:
+        values = df[col]
+        if pd.api.types.is_numeric_dtype(values):
+            normalized[col] = values.astype(float).round(DEDUP_DECIMALS)
+        else:
+            normalized[col] = values.astype(object).astype(str).str.strip().str.lower()
+    frame = pd.DataFrame(normalized, index=df.index)
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy(dtype=np.uint64)
+
+
+class Deduplicator:
+    """
+    Streaming duplicate-row filter over row hashes.
+    
+    'exact' keeps a sorted array of every hash seen (8 bytes per distinct
+    row). 'bloom' keeps a fixed-size Bloom filter sized for ``capacity`` rows
+    at ``error_rate`` false positives, for inputs that do not fit in memory;
+    a false positive drops a unique row, never keeps a duplicate.
+    """
+    
+    def __init__(
+        self, 
+        key_columns: Optional[List[str]] = None, 
+        method: str = 'exact',
+        capacity: int = DEDUP_BLOOM_CAPACITY,
+        error_rate: float = DEDUP_BLOOM_ERROR_RATE
+    ):
+        if method not in ('exact', 'bloom'):
+            raise ValueError(f"Unknown dedup method '{method}'. Choose 'exact' or 'bloom'")
+        self.key_columns = key_columns
+        self.method = method
+        self.rows_seen = 0
+        self.duplicates = 0
+        self._seen = np.empty(0, dtype=np.uint64)
+        if method == 'bloom':
+            self._n_bits = int(np.ceil(-capacity * np.log(error_rate) / np.log(2) ** 2))
+            self._n_hashes = max(1, int(round(self._n_bits / capacity * np.log(2))))
+            self._bits = np.zeros((self._n_bits + 7) // 8, dtype=np.uint8)
+    
+    def _bloom_positions(self, hashes: np.ndarray) -> np.ndarray:
+        # Double hashing: position_i = h1 + i * h2 (mod m)
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        i = np.arange(self._n_hashes, dtype=np.uint64)[:, None]
+        return ((h1[None, :] + i * h2[None, :]) % np.uint64(self._n_bits)).astype(np.int64)
+    
+    def keep_mask(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Mark rows whose hash has not been seen before, then remember them.
+        
+        Args:
+            hashes: Row hashes of the next chunk
+            
+        Returns:
+            Boolean mask of rows to keep
+        """
+        keep = ~pd.Series(hashes).duplicated(keep='first').to_numpy()
+        candidates = hashes[keep]
+        
+        if self.method == 'exact':
+            seen = np.isin(candidates, self._seen, assume_unique=True)
+            self._seen = np.union1d(self._seen, candidates[~seen])
+        else:
+            positions = self._bloom_positions(candidates)
+            bits = (self._bits[positions >> 3] >> (positions & 7).astype(np.uint8)) & 1
+            seen = bits.all(axis=0)
+            new_positions = positions[:, ~seen].ravel()
+            np.bitwise_or.at(self._bits, new_positions >> 3,
+                             (1 << (new_positions & 7)).astype(np.uint8))
+        
+        keep[np.flatnonzero(keep)[seen]] = False
+        self.rows_seen += len(hashes)
+        self.duplicates += int(len(hashes) - keep.sum())
+        return keep
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact JSON-serializable summary."""
+        return {
+            'method': self.method,
+            'rows_seen': self.rows_seen,
+            'duplicates_removed': self.duplicates,
+        }
+
+
+def iter_partitions(
+    path: str, 
+    n_jobs: Optional[int] = LOAD_WORKERS,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Sequence[Filter]] = None,
+    report: Optional[ValidationReport] = None,
+    dedup: Optional[Deduplicator] = None,
+    coerce_numeric: bool = True,
+    label_columns: Optional[Sequence[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Parse partitions concurrently and yield them in path order.
+    
+    Useful for streaming partitions straight into a training stage (e.g. the
+    incremental statistics in ``incremental.py``) without concatenating them.
+    
+    Args:
+        path: A CSV file, a directory of CSV files, or a glob pattern
+        n_jobs: Worker processes (None for one per CPU)
+        columns: Normalized columns to read (None reads all)
+        filters: Row predicates applied while reading
+        report: If given, rows are validated against config.DATA_SCHEMA and
+            violations are quarantined and counted in this report
+        dedup: If given, rows already seen (by normalized row hash) are dropped
+        coerce_numeric: Convert every column to numbers (False keeps category labels)
+        label_columns: Columns kept as labels when the others are converted
+        
+    Yields:
+        Normalized DataFrames aligned to the shared schema (or projection)
+    """
+    paths = list_partitions(path)
+    if not paths:
+        raise FileNotFoundError(f"Dataset not found at {path}")
+    
+    schema, mismatches = partition_schema(paths)
+    for p, missing in mismatches.items():
+        print(f"Warning: schema mismatch in {p}: missing columns {missing}")
+    
+    projection = list(dict.fromkeys(columns)) if columns is not None else None
+    requested = (projection or []) + [f[0] for f in filters or []]
+    missing_cols = [c for c in requested if c not in schema]
+    if missing_cols:
+        raise ValueError(f"Missing columns: {missing_cols}. Available columns: {schema}")
+    
+    options = _ReadOptions(
+        projection=projection,
+        filters=filters,
+        validate=report is not None,
+        hash_rows=dedup is not None,
+        hash_keys=dedup.key_columns if dedup is not None else None,
+        coerce_numeric=coerce_numeric,
+        label_columns=tuple(label_columns or ()),
+    )
+    for chunk in _iter_chunks(paths, schema, n_jobs, options):
+        df = chunk.frame
+        if report is not None:
+            n_quarantined = 0 if chunk.quarantined is None else len(chunk.quarantined)
+            report.add(len(df) + n_quarantined, chunk.quarantined, chunk.counts)
+        if dedup is not None:
+            df = df[dedup.keep_mask(chunk.hashes)]
+        if report is not None:
+            df = report.check_unique(df)
+        yield df
+
+
+def load_data(
+    path: str, 
+    n_jobs: Optional[int] = LOAD_WORKERS,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Sequence[Filter]] = None,
+    report: Optional[ValidationReport] = None,
+    dedup: Optional[Deduplicator] = None,
+    label_columns: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Load dataset from CSV file(s) with basic preprocessing.
+    
+    Args:
+        path: Path to a CSV file, a directory of CSV partitions, or a glob pattern
+        n_jobs: Worker processes used to parse multiple partitions
+        columns: Normalized columns to read (projection pushdown); None reads all
+        filters: Row predicates applied chunk by chunk while reading,
+            e.g. [('school_type', '==', 'Public'), ('exam_score', '>=', 0)]
+        report: Validate rows against config.DATA_SCHEMA, quarantining
+            violations into this report instead of loading them
+        dedup: Drop duplicate rows (by normalized row hash) across all partitions
+        label_columns: Columns kept as labels (e.g. a group column); all
+            others are converted to numbers
         
     Returns:
         Loaded and preprocessed DataFrame
     """
     try:
-        df = pd.read_csv(path)
+        frames = list(iter_partitions(path, n_jobs=n_jobs, columns=columns,
+                                      filters=filters, report=report, dedup=dedup,
+                                      label_columns=label_columns))
     except FileNotFoundError:
         raise FileNotFoundError(f"Dataset not found at {path}")
     
-    # Normalize column names: strip whitespace, lowercase, replace spaces with underscores
-    df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
-    
-    # Convert numeric columns, coercing errors to NaN
-    numeric_columns = df.select_dtypes(include=[np.number]).columns
-    for col in df.columns:
-        if col not in numeric_columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+    df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
     
+    n_files = len(list_partitions(path))
+    if n_files > 1:
+        print(f"Loaded {n_files} partitions")
+    if dedup is not None:
+        print(f"Removed {dedup.duplicates} duplicate rows")
     print(f"Loaded dataset: {df.shape[0]} rows, {df.shape[1]} columns")
     return df
 
@@ -155,17 +1088,23 @@ def split_data(
     features: List[str], 
     target: str, 
     test_size: float = 0.2, 
-    random_state: int = 42
+    random_state: int = 42,
+    imputer: Optional[StreamingImputer] = None
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Split data into training and testing sets.
     
+    Missing feature values are imputed after splitting, with statistics fit
+    on the training rows only, so the test set never leaks into the fill values.
+    
     Args:
         df: Input DataFrame
         features: List of feature column names
         target: Target column name
         test_size: Proportion of data for testing
         random_state: Random seed for reproducibility
+        imputer: Imputer to fit on the training split (and keep for inference);
+            a mean imputer is used if omitted and values are missing
         
     Returns:
         Tuple of (X_train, X_test, y_train, y_test)
@@ -173,18 +1112,22 @@ def split_data(
     X = df[features].values
     y = df[target].values
     
-    # Handle missing values by using mean imputation for features
-    if np.isnan(X).any():
-        print("Warning: Missing values found in features. Using mean imputation.")
-        from sklearn.impute import SimpleImputer
-        imputer = SimpleImputer(strategy='mean')
-        X = imputer.fit_transform(X)
-    
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=test_size, random_state=random_state
     )
     
+    has_missing = np.isnan(X_train.astype(float)).any() or np.isnan(X_test.astype(float)).any()
+    if has_missing and imputer is None:
+        imputer = StreamingImputer(strategy='mean')
+    if imputer is not None:
+        if has_missing:
+            print(f"Warning: Missing values found in features. "
+                  f"Using {imputer.strategy} imputation fit on the training split.")
+        imputer.fit(X_train)
+        X_train = imputer.transform(X_train)
+        X_test = imputer.transform(X_test)
+    
     print(f"Training set size: {len(X_train)}")
     print(f"Test set size: {len(X_test)}")
     
-    return X_train, X_test, y_train, y_test
\ No newline at end of file
+    return X_train, X_test, y_train, y_test
@@ -3,8 +3,158 @@ Feature selection and engineering functions.
 """
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import PolynomialFeatures
-from typing import List
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+from typing import List, Optional, Sequence, Tuple
+
+from scipy import sparse
+from scipy.interpolate import BSpline
+
+from .config import POLY_INDEX_CACHE_SIZE, SPLINE_DEGREE, SPLINE_KNOTS, SPLINE_TENSOR_KNOTS
+
+
+@dataclass(frozen=True)
+class PolyTermIndex:
+    """
+    Precomputed term layout of a polynomial design matrix.
+
+    Terms follow the ``PolynomialFeatures(include_bias=False)`` ordering:
+    graded by total degree, lexicographic within a degree. Because of that
+    ordering the degree-d design is always a column prefix of the degree-(d+1)
+    design, so one index serves every lower degree as well.
+
+    Attributes:
+        features: Base feature names
+        degree: Maximum total degree
+        names: Term names (e.g. ``study_hours^2``, ``study_hours attendance``)
+        powers: Exponent matrix of shape (n_terms, n_features)
+        parent: For every term, the column it is built from (-1 for base features)
+        factor: For every term, the base feature multiplied into ``parent``
+        degree_offsets: ``degree_offsets[d]`` is the number of terms of degree <= d
+    """
+    features: Tuple[str, ...]
+    degree: int
+    names: Tuple[str, ...]
+    powers: np.ndarray
+    parent: np.ndarray
+    factor: np.ndarray
+    degree_offsets: Tuple[int, ...]
+
+    @property
+    def n_terms(self) -> int:
+        return len(self.names)
+
+    def column_map(self, lower_degree: int) -> np.ndarray:
+        """
+        Column positions of the degree ``lower_degree`` design inside this design.
+
+        Args:
+            lower_degree: Degree of the smaller design (1 <= lower_degree <= degree)
+
+        Returns:
+            Integer array of column indices
+        """
+        if not 1 <= lower_degree <= self.degree:
+            raise ValueError(
+                f"lower_degree must be between 1 and {self.degree}, got {lower_degree}"
+            )
+        return np.arange(self.degree_offsets[lower_degree])
+
+    def expand(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Expand a feature matrix into this polynomial design.
+
+        Each higher-order column is one elementwise product of an earlier
+        column and a base feature, so the expansion costs one multiply per term.
+
+        Args:
+            X: Input feature matrix of shape (n_samples, n_features)
+            out: Optional preallocated output array of shape (n_samples, n_terms)
+
+        Returns:
+            Polynomial feature matrix
+        """
+        X = np.asarray(X, dtype=float)
+        if X.ndim != 2 or X.shape[1] != len(self.features):
+            raise ValueError(
+                f"Expected {len(self.features)} feature columns, got shape {X.shape}"
+            )
+        if out is None:
+            out = np.empty((X.shape[0], self.n_terms), dtype=float)
+        n_base = len(self.features)
+        out[:, :n_base] = X
+        for t in range(n_base, self.n_terms):
+            np.multiply(out[:, self.parent[t]], X[:, self.factor[t]], out=out[:, t])
+        return out
+
+
+def _term_name(features: Sequence[str], combo: Tuple[int, ...]) -> str:
+    parts = []
+    for j in sorted(set(combo)):
+        power = combo.count(j)
+        parts.append(features[j] if power == 1 else f"{features[j]}^{power}")
+    return " ".join(parts)
+
+
+@lru_cache(maxsize=POLY_INDEX_CACHE_SIZE)
+def poly_term_index(features: Tuple[str, ...], degree: int) -> PolyTermIndex:
+    """
+    Build (or fetch from the LRU cache) the polynomial term index.
+
+    Args:
+        features: Base feature names as a tuple
+        degree: Maximum total degree
+
+    Returns:
+        Shared PolyTermIndex for this (features, degree) pair
+    """
+    if degree < 1:
+        raise ValueError("Polynomial degree must be at least 1")
+    n_features = len(features)
+
+    combos: List[Tuple[int, ...]] = []
+    offsets = [0]
+    for d in range(1, degree + 1):
+        combos.extend(combinations_with_replacement(range(n_features), d))
+        offsets.append(len(combos))
+
+    position = {combo: i for i, combo in enumerate(combos)}
+    powers = np.zeros((len(combos), n_features), dtype=np.int64)
+    parent = np.full(len(combos), -1, dtype=np.int64)
+    factor = np.zeros(len(combos), dtype=np.int64)
+    for i, combo in enumerate(combos):
+        for j in combo:
+            powers[i, j] += 1
+        factor[i] = combo[-1]
+        if len(combo) > 1:
+            parent[i] = position[combo[:-1]]
+
+    for arr in (powers, parent, factor):
+        arr.setflags(write=False)
+
+    return PolyTermIndex(
+        features=tuple(features),
+        degree=degree,
+        names=tuple(_term_name(features, combo) for combo in combos),
+        powers=powers,
+        parent=parent,
+        factor=factor,
+        degree_offsets=tuple(offsets),
+    )
+
+
+def default_feature_names(n_features: int) -> Tuple[str, ...]:
+    """
+    Placeholder names (``x0``, ``x1``, ...) for unnamed feature matrices.
+
+    Args:
+        n_features: Number of input columns
+
+    Returns:
+        Tuple of feature names
+    """
+    return tuple(f"x{i}" for i in range(n_features))
 
 
 def select_features(df: pd.DataFrame, features: List[str]) -> pd.DataFrame:
@@ -39,8 +189,8 @@ def build_poly(X: np.ndarray, degree: int) -> np.ndarray:
     if degree < 2:
         raise ValueError("Polynomial degree must be at least 2")
     
-    poly = PolynomialFeatures(degree=degree, include_bias=False)
-    X_poly = poly.fit_transform(X)
+    index = poly_term_index(default_feature_names(X.shape[1]), degree)
+    X_poly = index.expand(X)
     
     print(f"Original features: {X.shape[1]}")
     print(f"Polynomial features (degree {degree}): {X_poly.shape[1]}")
@@ -59,9 +209,175 @@ def get_feature_names(features: List[str], degree: int) -> List[str]:
     Returns:
         List of polynomial feature names
     """
-    poly = PolynomialFeatures(degree=degree, include_bias=False)
-    # Create dummy data to get feature names
-    dummy_data = np.ones((1, len(features)))
-    poly.fit_transform(dummy_data)
-    
-    return poly.get_feature_names_out(features).tolist()
\ No newline at end of file
+    return list(poly_term_index(tuple(features), degree).names)
+
+
+class SplineBasis:
+    """
+    Sparse B-spline design: one basis per feature plus optional pairwise tensor products.
+
+    Knots sit at quantiles of the training values. Every row has exactly
+    degree + 1 nonzeros per feature block and (degree + 1)^2 per tensor
+    block, so the design is assembled directly in CSR form with a fixed row
+    width. Values outside the training range are clamped to the boundary
+    knots; constant features contribute no columns.
+
+    Attributes:
+        n_knots: Knots per feature, including both boundaries
+        degree: Spline degree
+        interactions: Whether pairwise tensor-product terms are included
+        tensor_knots: Knots per feature of the tensor-product bases
+        knots: Knot vectors of the per-feature bases
+        tensor_knot_vectors: Knot vectors of the tensor-product bases
+        pairs: Feature index pairs of the tensor-product terms
+    """
+
+    def __init__(
+        self,
+        n_knots: int = SPLINE_KNOTS,
+        degree: int = SPLINE_DEGREE,
+        interactions: bool = False,
+        tensor_knots: int = SPLINE_TENSOR_KNOTS
+    ):
+        if n_knots < 2 or tensor_knots < 2:
+            raise ValueError("Splines need at least 2 knots per feature")
+        if degree < 1:
+            raise ValueError("Spline degree must be at least 1")
+        self.n_knots = n_knots
+        self.degree = degree
+        self.interactions = interactions
+        self.tensor_knots = tensor_knots
+        self.knots: List[np.ndarray] = []
+        self.tensor_knot_vectors: List[np.ndarray] = []
+        self.pairs: List[Tuple[int, int]] = []
+
+    def _knot_vector(self, col: np.ndarray, n_knots: int) -> np.ndarray:
+        """Clamped knot vector with interior knots at quantiles (empty if constant)."""
+        lo, hi = col.min(), col.max()
+        if lo == hi:
+            return np.empty(0)
+        interior = np.unique(np.quantile(col, np.linspace(0, 1, n_knots)[1:-1]))
+        interior = interior[(interior > lo) & (interior < hi)]
+        return np.r_[np.full(self.degree + 1, lo), interior, np.full(self.degree + 1, hi)]
+
+    def _size(self, t: np.ndarray) -> int:
+        """Number of basis functions of a knot vector."""
+        return max(len(t) - self.degree - 1, 0)
+
+    def _block(self, x: np.ndarray, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Column indices and values of one basis, each of shape (n_samples, degree + 1)."""
+        if len(t) == 0:
+            return np.empty((len(x), 0), dtype=np.int64), np.empty((len(x), 0))
+        k = self.degree
+        m = BSpline.design_matrix(np.clip(x, t[k], t[-k - 1]), t, k)
+        return m.indices.reshape(len(x), k + 1), m.data.reshape(len(x), k + 1)
+
+    def fit(self, X: np.ndarray) -> "SplineBasis":
+        """
+        Place the knots of every feature (and feature pair).
+
+        Args:
+            X: Training feature matrix (imputed)
+
+        Returns:
+            self
+        """
+        X = np.asarray(X, dtype=float)
+        self.knots = [self._knot_vector(col, self.n_knots) for col in X.T]
+        self.tensor_knot_vectors = []
+        self.pairs = []
+        if self.interactions:
+            self.tensor_knot_vectors = [self._knot_vector(col, self.tensor_knots) for col in X.T]
+            varying = [j for j, t in enumerate(self.tensor_knot_vectors) if len(t)]
+            self.pairs = list(combinations(varying, 2))
+        return self
+
+    @property
+    def n_columns(self) -> int:
+        tensor = [self._size(t) for t in self.tensor_knot_vectors]
+        return (sum(self._size(t) for t in self.knots)
+                + sum(tensor[a] * tensor[b] for a, b in self.pairs))
+
+    def transform(self, X: np.ndarray) -> sparse.csr_matrix:
+        """
+        Sparse spline design of a feature matrix.
+
+        Args:
+            X: Feature matrix with the fitted columns (imputed)
+
+        Returns:
+            CSR matrix of shape (n_samples, n_columns)
+        """
+        X = np.asarray(X, dtype=float)
+        if X.ndim != 2 or X.shape[1] != len(self.knots):
+            raise ValueError(f"Expected {len(self.knots)} feature columns, got shape {X.shape}")
+        n = len(X)
+        indices, data = [], []
+        offset = 0
+        for j, t in enumerate(self.knots):
+            cols, vals = self._block(X[:, j], t)
+            indices.append(cols + offset)
+            data.append(vals)
+            offset += self._size(t)
+
+        tensor = {j: self._block(X[:, j], self.tensor_knot_vectors[j])
+                  for j in sorted({j for pair in self.pairs for j in pair})}
+        for a, b in self.pairs:
+            (cols_a, vals_a), (cols_b, vals_b) = tensor[a], tensor[b]
+            size_b = self._size(self.tensor_knot_vectors[b])
+            indices.append((cols_a[:, :, None] * size_b + cols_b[:, None, :]).reshape(n, -1) + offset)
+            data.append((vals_a[:, :, None] * vals_b[:, None, :]).reshape(n, -1))
+            offset += self._size(self.tensor_knot_vectors[a]) * size_b
+
+        indices = np.hstack(indices)
+        width = indices.shape[1]
+        return sparse.csr_matrix(
+            (np.hstack(data).ravel(), indices.ravel(), np.arange(0, n * width + 1, width)),
+            shape=(n, offset)
+        )
+
+    def names(self, features: Sequence[str]) -> List[str]:
+        """
+        Column names of the design (e.g. ``study_hours[3]``, ``study_hours[1] attendance[2]``).
+
+        Args:
+            features: Feature names of the fitted columns
+
+        Returns:
+            List of column names
+        """
+        names = [f"{f}[{i}]" for f, t in zip(features, self.knots) for i in range(self._size(t))]
+        for a, b in self.pairs:
+            names += [f"{features[a]}[{i}] {features[b]}[{j}]"
+                      for i in range(self._size(self.tensor_knot_vectors[a]))
+                      for j in range(self._size(self.tensor_knot_vectors[b]))]
+        return names
+
+
+class SplineRegression:
+    """
+    Penalized regression on a sparse B-spline basis of the raw features.
+
+    Attributes:
+        basis: Fitted SplineBasis
+        weights: Coefficients of the spline columns
+        intercept: Intercept
+    """
+
+    def __init__(self, basis: SplineBasis, weights: np.ndarray, intercept: float):
+        self.basis = basis
+        self.weights = weights
+        self.intercept = intercept
+        self.n_features_in_ = len(basis.knots)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predict from raw (imputed) features.
+
+        Args:
+            X: Feature matrix
+
+        Returns:
+            Predictions
+        """
+        return self.basis.transform(X) @ self.weights + self.intercept
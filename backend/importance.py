@@ -0,0 +1,164 @@
+"""
+Permutation feature importance.
+
+The importance of a base feature is the increase in RMSE when its column is
+shuffled. For linear and polynomial models the shuffled predictions are not
+recomputed: only the terms containing the feature change, so
+
+    delta_y = sum_p w_p * (x_perm ** p - x ** p)
+
+where ``w_p`` collects, per row, the coefficients times the rest of every
+term in which the feature has power ``p``. A batch of permutations is
+evaluated as one (n_rows, n_repeats) matrix, and batches are spread across
+processes.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import IMPORTANCE_BATCH_REPEATS, IMPORTANCE_REPEATS, RANDOM_STATE
+from .scoring import design_powers, predict_array
+
+# Per feature: list of (power, weight vector over rows)
+_Structure = List[List[Tuple[int, np.ndarray]]]
+
+
+def _linear_structure(
+    artifact: Dict[str, Any],
+    X: np.ndarray,
+    groups: Optional[np.ndarray]
+) -> Optional[_Structure]:
+    """Per-feature incremental update weights, or None for non-linear models."""
+    model = artifact['model']
+    if not hasattr(model, 'coef_'):
+        return None
+
+    n_features = X.shape[1]
+    powers = design_powers(artifact)
+
+    if artifact['group_by'] is not None:
+        coef, _ = model.row_coef(groups)
+    else:
+        coef = np.broadcast_to(np.asarray(model.coef_, dtype=float), (len(X), len(powers)))
+
+    structure: _Structure = []
+    for j in range(n_features):
+        updates = []
+        for p in np.unique(powers[:, j][powers[:, j] > 0]):
+            idx = np.flatnonzero(powers[:, j] == p)
+            rest = powers[idx].copy()
+            rest[:, j] = 0
+            rest_terms = np.prod(X[:, None, :] ** rest[None], axis=2)
+            updates.append((int(p), np.einsum('ij,ij->i', rest_terms, coef[:, idx])))
+        structure.append(updates)
+    return structure
+
+
+def _rmse_columns(y: np.ndarray, pred: np.ndarray) -> np.ndarray:
+    """RMSE of every column of a prediction matrix."""
+    return np.sqrt(np.mean((y[:, None] - pred) ** 2, axis=0))
+
+
+def _importance_batch(
+    X: np.ndarray,
+    y: np.ndarray,
+    y_hat: np.ndarray,
+    structure: Optional[_Structure],
+    artifact: Dict[str, Any],
+    groups: Optional[np.ndarray],
+    n_repeats: int,
+    seed: Any
+) -> np.ndarray:
+    """
+    Permuted RMSEs for every feature over one batch of repeats.
+
+    Returns:
+        Array of shape (n_features, n_repeats)
+    """
+    rng = np.random.default_rng(seed)
+    n, n_features = X.shape
+    perms = rng.permuted(np.tile(np.arange(n), (n_repeats, 1)), axis=1).T  # (n, repeats)
+    scores = np.empty((n_features, n_repeats))
+    for j in range(n_features):
+        x = X[:, j]
+        x_perm = x[perms]
+        if structure is not None:
+            delta = np.zeros((n, n_repeats))
+            for p, w in structure[j]:
+                delta += w[:, None] * (x_perm ** p - (x ** p)[:, None])
+            pred = y_hat[:, None] + delta
+        else:
+            # No linear structure: re-predict every permuted copy
+            pred = np.empty((n, n_repeats))
+            for k in range(n_repeats):
+                X_perm = X.copy()
+                X_perm[:, j] = x_perm[:, k]
+                pred[:, k] = predict_array(artifact, X_perm, groups)
+        scores[j] = _rmse_columns(y, pred)
+    return scores
+
+
+def permutation_importance(
+    artifact: Dict[str, Any],
+    X: np.ndarray,
+    y: np.ndarray,
+    groups: Optional[np.ndarray] = None,
+    n_repeats: int = IMPORTANCE_REPEATS,
+    random_state: int = RANDOM_STATE,
+    n_jobs: Optional[int] = 1
+) -> Dict[str, Any]:
+    """
+    Permutation importance of every base feature of a model.
+
+    Args:
+        artifact: Model artifact (see artifacts.py)
+        X: Base features in the artifact's feature order (e.g. the test split)
+        y: True targets
+        groups: Group label per row (per-cohort models only)
+        n_repeats: Number of permutations per feature
+        random_state: Base seed; repeat batches use independent child seeds
+        n_jobs: Worker processes for the repeat batches (None for one per CPU)
+
+    Returns:
+        Dictionary with the baseline RMSE and, per feature, the mean and
+        standard deviation of the RMSE increase, sorted by importance
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if artifact['imputer'] is not None:
+        X = artifact['imputer'].transform(X)
+    y_hat = predict_array(artifact, X, groups)
+    baseline = float(np.sqrt(np.mean((y - y_hat) ** 2)))
+    structure = _linear_structure(artifact, X, groups)
+
+    # Fixed-size, independently seeded batches: results do not depend on n_jobs
+    sizes = [min(IMPORTANCE_BATCH_REPEATS, n_repeats - start)
+             for start in range(0, n_repeats, IMPORTANCE_BATCH_REPEATS)]
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+    args = [[X] * len(sizes), [y] * len(sizes), [y_hat] * len(sizes), [structure] * len(sizes),
+            [artifact] * len(sizes), [groups] * len(sizes), sizes, seeds]
+
+    workers = max(1, min(n_jobs or os.cpu_count() or 1, len(sizes)))
+    if workers == 1:
+        batches = list(map(_importance_batch, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batches = list(executor.map(_importance_batch, *args))
+    increase = np.hstack(batches) - baseline
+
+    features = artifact['features']
+    order = np.argsort(-increase.mean(axis=1))
+    return {
+        'metric': 'rmse_increase',
+        'baseline_rmse': baseline,
+        'n_repeats': n_repeats,
+        'importances': {
+            features[j]: {
+                'mean': float(increase[j].mean()),
+                'std': float(increase[j].std()),
+            }
+            for j in order
+        },
+    }
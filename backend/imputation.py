@@ -0,0 +1,148 @@
+"""
+Missing-value imputation fit on training data only.
+
+The imputer learns its fill values from streaming summaries (running mean,
+KLL quantile sketch or heavy-hitter counts), so it can be fit chunk by chunk
+on inputs larger than memory. It is persisted with the model and applied at
+prediction time with a single vectorized ``np.where``.
+"""
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .config import IMPUTE_SKETCH_K, READ_CHUNK_ROWS
+from .sketches import FrequentItems, KLLSketch, RunningMoments
+
+IMPUTE_STRATEGIES = ['mean', 'median', 'most_frequent']
+
+
+class StreamingImputer:
+    """
+    Column-wise imputer with 'mean', 'median' (approximate) or 'most_frequent' fills.
+    """
+
+    def __init__(self, strategy: str = 'mean', sketch_k: int = IMPUTE_SKETCH_K):
+        if strategy not in IMPUTE_STRATEGIES:
+            raise ValueError(
+                f"Unknown imputation strategy '{strategy}'. Choose from {IMPUTE_STRATEGIES}"
+            )
+        self.strategy = strategy
+        self.sketch_k = sketch_k
+        self.n_features: Optional[int] = None
+        self.statistics_: Optional[np.ndarray] = None
+        self._moments: Optional[RunningMoments] = None
+        self._sketches = None
+
+    def partial_fit(self, X: np.ndarray) -> "StreamingImputer":
+        """
+        Update the fill statistics with another chunk of training rows.
+
+        Args:
+            X: Numeric feature chunk of shape (n_rows, n_features)
+
+        Returns:
+            self
+        """
+        X = np.asarray(X, dtype=float)
+        if self.n_features is None:
+            self.n_features = X.shape[1]
+            self._moments = RunningMoments(self.n_features)
+            if self.strategy == 'median':
+                self._sketches = [KLLSketch(self.sketch_k, seed=j) for j in range(self.n_features)]
+            elif self.strategy == 'most_frequent':
+                self._sketches = [FrequentItems(self.sketch_k) for _ in range(self.n_features)]
+        elif self._moments is None:
+            raise ValueError("A persisted imputer only stores its fill values; call fit() to refit")
+        elif X.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} feature columns, got {X.shape[1]}")
+
+        self._moments.update(X)
+        if self._sketches is not None:
+            for j, sketch in enumerate(self._sketches):
+                sketch.update(X[:, j])
+        self.statistics_ = None
+        return self
+
+    def fit(self, X: np.ndarray, chunk_rows: int = READ_CHUNK_ROWS) -> "StreamingImputer":
+        """
+        Fit on an in-memory training matrix, in row blocks.
+
+        Args:
+            X: Training feature matrix
+            chunk_rows: Rows per block
+
+        Returns:
+            self
+        """
+        self.n_features = None
+        for start in range(0, max(len(X), 1), chunk_rows):
+            self.partial_fit(X[start:start + chunk_rows])
+        self.finalize()
+        return self
+
+    def finalize(self) -> np.ndarray:
+        """
+        Compute the fill value of every column from the streamed statistics.
+
+        Columns never observed during fitting are filled with 0.
+
+        Returns:
+            Fill values, shape (n_features,)
+        """
+        if self._moments is None:
+            raise ValueError("Imputer has not been fit")
+        if self.strategy == 'mean':
+            fill = self._moments.mean.copy()
+        elif self.strategy == 'median':
+            fill = np.array([s.quantile(0.5)[0] for s in self._sketches])
+        else:
+            fill = np.array([np.nan if s.mode() is None else s.mode() for s in self._sketches],
+                            dtype=float)
+        unseen = self._moments.count == 0
+        if unseen.any():
+            print(f"Warning: {int(unseen.sum())} feature column(s) had no observed values; "
+                  "filling with 0")
+        fill[unseen] = 0.0
+        self.statistics_ = fill
+        return fill
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Fill missing values with the learned statistics.
+
+        Args:
+            X: Feature matrix
+
+        Returns:
+            New float matrix without NaNs
+        """
+        if self.statistics_ is None:
+            self.finalize()
+        X = np.asarray(X, dtype=float)
+        return np.where(np.isnan(X), self.statistics_, X)
+
+    def select(self, columns: Sequence[int]) -> "StreamingImputer":
+        """
+        Imputer for a subset of the fitted columns (fill values only).
+
+        Args:
+            columns: Indices of the columns to keep, in their new order
+
+        Returns:
+            New fitted imputer
+        """
+        if self.statistics_ is None:
+            self.finalize()
+        subset = StreamingImputer(strategy=self.strategy, sketch_k=self.sketch_k)
+        subset.n_features = len(columns)
+        subset.statistics_ = self.statistics_[list(columns)]
+        return subset
+
+    def __getstate__(self):
+        # Persist only what inference needs; the sketches are for fitting
+        if self.statistics_ is None and self._moments is not None:
+            self.finalize()
+        state = self.__dict__.copy()
+        state['_moments'] = None
+        state['_sketches'] = None
+        return state
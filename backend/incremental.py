@@ -0,0 +1,366 @@
+"""
+Incremental model updates from persisted normal-equation statistics.
+
+A trained linear or polynomial model can be refreshed with a new term's
+records (or have records removed for data-retention deletes) without
+revisiting the full history: only the sufficient statistics of the
+intercept-augmented design are kept and updated with rank-k updates.
+
+The statistics also keep the row hash of every folded record, so a delete
+downdates only records that were actually folded in (rows of the test
+split, or rows never seen, are skipped rather than subtracted).
+"""
+import argparse
+import os
+import sys
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Tuple
+
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
+from .artifacts import load_model_artifact, save_model_artifact
+from .data import iter_partitions, clean_data, row_hashes
+from .features import poly_term_index
+from .intervals import interval_stats
+
+
+@dataclass
+class SufficientStats:
+    """
+    Normal-equation statistics of an intercept-augmented design [1, X].
+
+    Attributes:
+        features: Base feature names
+        target: Target column name
+        degree: Polynomial degree (None for a plain linear model)
+        xtx: Augmented Gram matrix, shape (p + 1, p + 1)
+        xty: Augmented cross-product vector, shape (p + 1,)
+        yty: Sum of squared targets
+        n: Number of rows folded in
+        row_hashes: Sorted hashes of the folded rows (features and target,
+            see data.row_hashes), one per row; None if not tracked
+    """
+    features: List[str]
+    target: str
+    degree: Optional[int]
+    xtx: np.ndarray
+    xty: np.ndarray
+    yty: float
+    n: int
+    row_hashes: Optional[np.ndarray] = None
+
+    @property
+    def feature_means(self) -> np.ndarray:
+        """Column means of the design (expanded terms for polynomial models)."""
+        if self.n == 0:
+            return np.zeros(self.xtx.shape[0] - 1)
+        return self.xtx[0, 1:] / self.n
+
+
+def _design(X: np.ndarray, degree: Optional[int], features: List[str]) -> np.ndarray:
+    """Expand (if polynomial) and prepend the intercept column."""
+    X = np.asarray(X, dtype=float)
+    if degree is not None:
+        X = poly_term_index(tuple(features), degree).expand(X)
+    return np.column_stack([np.ones(X.shape[0]), X])
+
+
+def _remove_hashes(stored: np.ndarray, hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Remove one stored occurrence per given hash, where there is one left.
+    
+    Args:
+        stored: Sorted hashes (duplicates allowed)
+        hashes: Hashes to remove
+        
+    Returns:
+        Tuple of (mask of the given hashes that were found, remaining stored hashes)
+    """
+    order = np.argsort(hashes, kind='stable')
+    ordered = hashes[order]
+    # Occurrence number of every hash among equal ones, against the stored count
+    rank = np.arange(len(ordered)) - np.searchsorted(ordered, ordered, side='left')
+    left = np.searchsorted(stored, ordered, side='left')
+    found_sorted = rank < np.searchsorted(stored, ordered, side='right') - left
+    found = np.empty(len(hashes), dtype=bool)
+    found[order] = found_sorted
+    return found, np.delete(stored, left[found_sorted] + rank[found_sorted])
+
+
+def init_stats(
+    X: np.ndarray,
+    y: np.ndarray,
+    features: List[str],
+    target: str,
+    degree: Optional[int] = None,
+    hashes: Optional[np.ndarray] = None
+) -> SufficientStats:
+    """
+    Compute sufficient statistics from an initial training set.
+
+    Args:
+        X: Base feature matrix
+        y: Target vector
+        features: Base feature names
+        target: Target column name
+        degree: Polynomial degree, or None for a linear model
+        hashes: Row hashes of the data, to track which rows were folded in
+
+    Returns:
+        SufficientStats for the data
+    """
+    n_cols = _design(np.zeros((0, len(features))), degree, features).shape[1]
+    stats = SufficientStats(
+        features=list(features), target=target, degree=degree,
+        xtx=np.zeros((n_cols, n_cols)), xty=np.zeros(n_cols), yty=0.0, n=0,
+        row_hashes=None if hashes is None else np.empty(0, dtype=np.uint64)
+    )
+    return update_stats(stats, X, y, hashes)
+
+
+def update_stats(
+    stats: SufficientStats,
+    X: np.ndarray,
+    y: np.ndarray,
+    hashes: Optional[np.ndarray] = None
+) -> SufficientStats:
+    """
+    Fold new rows into the statistics with a rank-k update.
+
+    Args:
+        stats: Statistics to update in place
+        X: New base feature rows
+        y: New targets
+        hashes: Row hashes of the new rows (recorded if the statistics track rows)
+
+    Returns:
+        The updated statistics
+    """
+    A = _design(X, stats.degree, stats.features)
+    y = np.asarray(y, dtype=float)
+    stats.xtx += A.T @ A
+    stats.xty += A.T @ y
+    stats.yty += float(y @ y)
+    stats.n += len(y)
+    if stats.row_hashes is not None and hashes is not None:
+        stats.row_hashes = np.sort(np.concatenate([stats.row_hashes,
+                                                   np.asarray(hashes, dtype=np.uint64)]))
+    return stats
+
+
+def forget_stats(
+    stats: SufficientStats,
+    X: np.ndarray,
+    y: np.ndarray,
+    hashes: Optional[np.ndarray] = None
+) -> SufficientStats:
+    """
+    Remove previously folded rows from the statistics with a rank-k downdate.
+
+    With row hashes, only rows whose hash was folded in are removed (once
+    per folded occurrence); the others are skipped.
+
+    Args:
+        stats: Statistics to downdate in place
+        X: Base feature rows to forget (without hashes, they must have been
+            folded in before)
+        y: Their targets
+        hashes: Row hashes of the rows (required if the statistics track rows)
+
+    Returns:
+        The downdated statistics
+    """
+    y = np.asarray(y, dtype=float)
+    if stats.row_hashes is not None:
+        if hashes is None:
+            raise ValueError("The statistics track folded rows; pass the row hashes to forget")
+        found, stats.row_hashes = _remove_hashes(stats.row_hashes,
+                                                 np.asarray(hashes, dtype=np.uint64))
+        X, y = np.asarray(X)[found], y[found]
+    if len(y) > stats.n:
+        raise ValueError(f"Cannot forget {len(y)} rows from statistics over {stats.n} rows")
+    A = _design(X, stats.degree, stats.features)
+    stats.xtx -= A.T @ A
+    stats.xty -= A.T @ y
+    stats.yty -= float(y @ y)
+    stats.n -= len(y)
+    return stats
+
+
+def solve_stats(stats: SufficientStats) -> LinearRegression:
+    """
+    Solve the normal equations into a fitted LinearRegression.
+
+    Args:
+        stats: Sufficient statistics
+
+    Returns:
+        LinearRegression with coef_ and intercept_ set
+    """
+    if stats.n == 0:
+        raise ValueError("No rows left in the sufficient statistics")
+    try:
+        beta = np.linalg.solve(stats.xtx, stats.xty)
+    except np.linalg.LinAlgError:
+        beta = np.linalg.lstsq(stats.xtx, stats.xty, rcond=None)[0]
+
+    model = LinearRegression()
+    model.intercept_ = float(beta[0])
+    model.coef_ = beta[1:]
+    model.n_features_in_ = len(beta) - 1
+    return model
+
+
+def stats_path_for(model_path: str) -> str:
+    """
+    Location of the statistics file stored next to a saved model.
+
+    Args:
+        model_path: Path of the saved model (.pkl)
+
+    Returns:
+        Path of the matching .stats.npz file
+    """
+    return os.path.splitext(model_path)[0] + ".stats.npz"
+
+
+def save_stats(path: str, stats: SufficientStats) -> None:
+    """
+    Save sufficient statistics as a compressed NumPy archive.
+
+    Args:
+        path: Output file path
+        stats: Statistics to save
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    np.savez_compressed(
+        path,
+        features=np.array(stats.features),
+        target=np.array(stats.target),
+        degree=np.array(-1 if stats.degree is None else stats.degree),
+        xtx=stats.xtx,
+        xty=stats.xty,
+        yty=np.array(stats.yty),
+        n=np.array(stats.n),
+        feature_means=stats.feature_means,
+        **({} if stats.row_hashes is None else {'row_hashes': stats.row_hashes}),
+    )
+
+
+def load_stats(path: str) -> SufficientStats:
+    """
+    Load sufficient statistics saved by save_stats.
+
+    Args:
+        path: Statistics file path
+
+    Returns:
+        SufficientStats
+    """
+    with np.load(path) as archive:
+        degree = int(archive['degree'])
+        return SufficientStats(
+            features=archive['features'].tolist(),
+            target=str(archive['target']),
+            degree=None if degree < 0 else degree,
+            xtx=archive['xtx'].copy(),
+            xty=archive['xty'].copy(),
+            yty=float(archive['yty']),
+            n=int(archive['n']),
+            row_hashes=archive['row_hashes'].copy() if 'row_hashes' in archive.files else None,
+        )
+
+
+def _iter_partition_xy(
+    path: str, 
+    stats: SufficientStats, 
+    imputer: Optional[Any] = None
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Stream CSV partitions as (X, y, row hashes), imputing (or dropping incomplete rows)."""
+    columns = stats.features + [stats.target]
+    for df in iter_partitions(path, columns=columns):
+        df = clean_data(df, stats.target, stats.features)
+        if imputer is None:
+            df = df.dropna(subset=stats.features)
+            X = df[stats.features].values
+        else:
+            X = imputer.transform(df[stats.features].values)
+        yield X, df[stats.target].values, row_hashes(df, columns)
+
+
+def _save_model(model_path: str, model: LinearRegression, stats: SufficientStats) -> None:
+    """
+    Save a re-solved model, keeping the rest of its artifact.
+    
+    A similar-student index stores the training students' rows, which the
+    statistics cannot rebuild: it would keep forgotten students and miss new
+    ones, so it is dropped.
+    """
+    artifact = load_model_artifact(model_path) if os.path.exists(model_path) else {}
+    if artifact.get('neighbors') is not None:
+        artifact['neighbors'] = None
+        print("Dropped the similar-student index (it cannot be updated from the statistics); "
+              "retrain with --neighbors to rebuild it")
+    artifact.update({
+        'model': model,
+        'degree': stats.degree,
+        'features': stats.features,
+        'target': stats.target,
+        'design_means': stats.feature_means,
+        'intervals': interval_stats(stats.xtx, stats.yty - model.intercept_ * stats.xty[0]
+                                    - model.coef_ @ stats.xty[1:], stats.n),
+    })
+    save_model_artifact(model_path, artifact)
+
+
+def main():
+    """CLI for folding partitions into, or removing them from, a saved model."""
+    parser = argparse.ArgumentParser(description='Incremental Student Score Model Updates')
+    parser.add_argument('command', choices=['update', 'forget'],
+                        help='Fold a partition into the model or remove it')
+    parser.add_argument('--model-path', type=str, required=True,
+                        help='Path of the saved model (statistics are read from alongside it)')
+    parser.add_argument('--data-path', type=str, required=True,
+                        help='CSV partition (file, directory or glob) to fold in or forget')
+    args = parser.parse_args()
+
+    stats_path = stats_path_for(args.model_path)
+    if not os.path.exists(stats_path):
+        print(f"Error: no statistics found at {stats_path}. Retrain with --save-model first.")
+        sys.exit(1)
+
+    stats = load_stats(stats_path)
+    if args.command == 'forget' and stats.row_hashes is None:
+        print("Error: these statistics do not record which rows were folded in, so a delete "
+              "cannot be verified. Retrain with --save-model first.")
+        sys.exit(1)
+    n_before = stats.n
+    n_read = 0
+    imputer = None
+    if os.path.exists(args.model_path):
+        imputer = load_model_artifact(args.model_path).get('imputer')
+    for X, y, hashes in _iter_partition_xy(args.data_path, stats, imputer):
+        n_read += len(y)
+        if args.command == 'update':
+            update_stats(stats, X, y, hashes)
+        else:
+            forget_stats(stats, X, y, hashes)
+
+    if args.command == 'update':
+        print(f"Folded in {stats.n - n_before} rows ({stats.n} rows total)")
+    else:
+        skipped = n_read - (n_before - stats.n)
+        print(f"Forgot {n_before - stats.n} rows ({stats.n} rows remaining)")
+        if skipped:
+            print(f"Skipped {skipped} rows that were never folded into the model")
+
+    model = solve_stats(stats)
+    _save_model(args.model_path, model, stats)
+    save_stats(stats_path, stats)
+    print(f"Model saved to {args.model_path}")
+    print(f"Statistics saved to {stats_path}")
+
+
+if __name__ == "__main__":
+    main()
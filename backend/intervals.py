@@ -0,0 +1,105 @@
+"""
+Analytic OLS prediction intervals.
+
+For a new design row a = [1, x] the prediction interval is
+
+    y_hat +/- t_{dof, (1 + level) / 2} * sqrt(sigma^2 * (1 + a^T (A^T A)^{-1} a))
+
+The training Gram matrix is factored once (Cholesky, after Jacobi scaling)
+and stored with the model. At prediction time a^T (A^T A)^{-1} a is the
+squared norm of L^{-1} a, computed for a whole block of rows with a single
+triangular solve, so no inverse is ever formed.
+"""
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from scipy import stats
+from scipy.linalg import solve_triangular
+
+from .config import INTERVAL_BLOCK_ROWS, INTERVAL_LEVEL
+
+
+def interval_stats(xtx: np.ndarray, rss: float, n: int) -> Dict[str, Any]:
+    """
+    Factor an intercept-augmented Gram matrix for prediction intervals.
+
+    Args:
+        xtx: Gram matrix of [1, X], shape (p + 1, p + 1)
+        rss: Residual sum of squares of the fit
+        n: Number of training rows
+
+    Returns:
+        Dictionary with the lower Cholesky factor of the scaled Gram matrix,
+        the column scales, the residual variance and its degrees of freedom
+    """
+    scale = np.sqrt(np.diag(xtx))
+    scale[scale == 0] = 1.0
+    gram = xtx / np.outer(scale, scale)
+    # A tiny ridge keeps the factorization defined for collinear designs
+    for jitter in [0.0] + [10.0 ** e for e in range(-12, -2)]:
+        try:
+            chol = np.linalg.cholesky(gram + jitter * np.eye(len(gram)))
+            break
+        except np.linalg.LinAlgError:
+            continue
+    else:
+        raise ValueError("The Gram matrix could not be factored for prediction intervals")
+    dof = max(n - len(xtx), 1)
+    return {'chol': chol, 'scale': scale, 'sigma2': max(float(rss), 0.0) / dof, 'dof': dof,
+            'jitter': jitter}
+
+
+def fit_interval_stats(design: np.ndarray, residuals: np.ndarray) -> Dict[str, Any]:
+    """
+    Interval statistics of a fitted model from its training design and residuals.
+
+    Args:
+        design: Training design matrix (without intercept)
+        residuals: Training residuals y - y_hat
+
+    Returns:
+        Statistics for prediction_interval
+    """
+    A = np.column_stack([np.ones(len(design)), np.asarray(design, dtype=float)])
+    residuals = np.asarray(residuals, dtype=float)
+    return interval_stats(A.T @ A, float(residuals @ residuals), len(A))
+
+
+def prediction_interval(
+    artifact: Dict[str, Any],
+    design: np.ndarray,
+    predictions: np.ndarray,
+    level: float = INTERVAL_LEVEL,
+    block_rows: int = INTERVAL_BLOCK_ROWS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lower and upper prediction bounds for rows of a design matrix.
+
+    Args:
+        artifact: Model artifact holding 'intervals' statistics
+        design: Design matrix of the rows (as passed to the model)
+        predictions: Point predictions for the rows
+        level: Coverage probability, e.g. 0.95
+        block_rows: Rows per triangular solve
+
+    Returns:
+        Tuple of (lower bounds, upper bounds)
+    """
+    st = artifact['intervals']
+    if st is None:
+        raise ValueError("The model has no interval statistics (per-cohort models and "
+                         "older artifacts do not support prediction intervals)")
+    if not 0 < level < 1:
+        raise ValueError(f"Interval level must be in (0, 1), got {level}")
+    design = np.asarray(design, dtype=float)
+    t = stats.t.ppf(0.5 + level / 2, st['dof'])
+
+    leverage = np.empty(len(design))
+    for start in range(0, len(design), block_rows):
+        block = design[start:start + block_rows]
+        A = np.column_stack([np.ones(len(block)), block]) / st['scale']
+        V = solve_triangular(st['chol'], A.T, lower=True, check_finite=False)
+        leverage[start:start + block_rows] = np.einsum('ij,ij->j', V, V)
+
+    half = t * np.sqrt(st['sigma2'] * (1.0 + leverage))
+    return predictions - half, predictions + half
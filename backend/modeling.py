@@ -5,57 +5,222 @@ import argparse
 import json
 import os
 import sys
-import joblib
+import time
 import numpy as np
 import pandas as pd
 from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import cross_val_score
+from sklearn.model_selection import KFold, cross_val_score, train_test_split
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from typing import Dict, List, Tuple, Any
+from scipy.linalg import qr_delete, solve
+from typing import Dict, List, Optional, Tuple, Any
 import warnings
 warnings.filterwarnings('ignore')
 
 from .config import *
-from .data import resolve_data_path, load_data, clean_data, split_data
-from .features import select_features, build_poly
-from .plots import histograms, scatter_xy, pred_vs_actual, residuals, metrics_comparison
+from .data import (
+    resolve_data_path, load_data, clean_data, split_data, parse_filter, Deduplicator, row_hashes
+)
+from .features import (
+    select_features, build_poly, poly_term_index, default_feature_names, get_feature_names,
+    SplineBasis, SplineRegression
+)
+from .artifacts import save_model_artifact
+from .bagging import BAGGING_METHODS, fit_bagged
+from .boosting import BinnedGradientBoosting, binned_training_data, cv_select_hgb, make_hgb
+from .bootstrap import bootstrap_coefficients, bootstrap_metrics
+from .cohorts import fit_group_models, group_metrics
+from .intervals import fit_interval_stats, prediction_interval
+from .neighbors import SimilarStudents
+from .search import ridge_path, successive_halving
+from .solvers import SOLVERS, fit_poly_standardized, least_squares
+from .imputation import StreamingImputer, IMPUTE_STRATEGIES
+from .incremental import init_stats, save_stats, stats_path_for
+from .profiling import profile_dataset, print_profile
+from .importance import permutation_importance
+from .plots import (
+    histograms, scatter_xy, pred_vs_actual, residuals, metrics_comparison,
+    permutation_importance_plot
+)
+from .validation import ValidationReport
 from .utils import save_json, ensure_dirs, print_metrics, load_env_path
 
 
-def train_linear(X_train: np.ndarray, y_train: np.ndarray) -> LinearRegression:
+def _linear_model(
+    coef: np.ndarray,
+    intercept: float,
+    info: Optional[Dict[str, Any]] = None
+) -> LinearRegression:
+    """LinearRegression holding externally solved coefficients (and solver diagnostics)."""
+    model = LinearRegression()
+    model.coef_ = np.asarray(coef, dtype=float)
+    model.intercept_ = float(intercept)
+    model.n_features_in_ = len(model.coef_)
+    if info is not None:
+        model.solver_info_ = info
+    return model
+
+
+def train_linear(X_train: np.ndarray, y_train: np.ndarray, solver: str = SOLVER) -> LinearRegression:
     """
     Train linear regression model.
     
     Args:
         X_train: Training features
         y_train: Training targets
+        solver: Least-squares solver ('auto' chooses by conditioning, see solvers.py)
         
     Returns:
-        Fitted LinearRegression model
+        Fitted LinearRegression model (solver diagnostics in solver_info_)
     """
-    model = LinearRegression()
-    model.fit(X_train, y_train)
-    return model
+    coef, intercept, info = least_squares(X_train, y_train, solver)
+    return _linear_model(coef, intercept, info)
 
 
-def train_poly(X_train: np.ndarray, y_train: np.ndarray, degree: int) -> LinearRegression:
+def train_poly(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    degree: int,
+    solver: str = SOLVER
+) -> LinearRegression:
     """
     Train polynomial regression model.
     
+    The features are standardized before expansion for a well-conditioned
+    solve; the coefficients refer to the raw polynomial features.
+    
     Args:
         X_train: Training features
         y_train: Training targets
         degree: Polynomial degree
+        solver: Least-squares solver ('auto' chooses by conditioning, see solvers.py)
         
     Returns:
-        Fitted LinearRegression model on polynomial features
+        Fitted LinearRegression model on polynomial features (as built by build_poly)
     """
-    X_poly = build_poly(X_train, degree)
-    model = LinearRegression()
-    model.fit(X_poly, y_train)
+    coef, intercept, info = fit_poly_standardized(X_train, y_train, degree, solver)
+    return _linear_model(coef, intercept, info)
+
+
+def train_ridge(X_train: np.ndarray, y_train: np.ndarray, alpha: float) -> LinearRegression:
+    """
+    Train ridge regression on standardized columns (see search.ridge_path).
+    
+    Args:
+        X_train: Training features
+        y_train: Training targets
+        alpha: Ridge strength
+        
+    Returns:
+        LinearRegression with coef_ and intercept_ on the original column scale
+    """
+    coef, intercept = ridge_path(X_train, y_train, [alpha])
+    return _linear_model(coef[0], intercept[0])
+
+
+def train_bagged(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    n_members: int,
+    degree: Optional[int] = None,
+    method: str = BAGGING_METHOD,
+    random_state: int = RANDOM_STATE,
+    n_jobs: Optional[int] = None
+) -> LinearRegression:
+    """
+    Train a bagged linear or polynomial ensemble collapsed into one model.
+    
+    Args:
+        X_train: Training features (base features for a polynomial model)
+        y_train: Training targets
+        n_members: Number of ensemble members
+        degree: Polynomial degree (None for a linear model)
+        method: 'bootstrap' or 'subsample' draws (see bagging.py)
+        random_state: Random seed
+        n_jobs: Worker processes (None for one per CPU)
+        
+    Returns:
+        LinearRegression with the members' averaged coefficients (on the
+        build_poly design for a polynomial model); diagnostics in bagging_info_
+    """
+    coef, intercept, info = fit_bagged(X_train, y_train, n_members, degree=degree, method=method,
+                                       random_state=random_state, n_jobs=n_jobs)
+    model = _linear_model(coef, intercept)
+    model.bagging_info_ = info
     return model
 
 
+def train_hgb(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    max_leaf_nodes: int,
+    features: List[str],
+    random_state: int = RANDOM_STATE,
+    cache_dir: Optional[str] = CACHE_DIR
+) -> BinnedGradientBoosting:
+    """
+    Train histogram gradient boosting on (cached) pre-binned features.
+    
+    Args:
+        X_train: Training features
+        y_train: Training targets
+        max_leaf_nodes: Leaves per tree
+        features: Feature names (part of the bin cache key)
+        random_state: Random seed
+        cache_dir: Directory of cached bin codes (None disables the cache)
+        
+    Returns:
+        Fitted BinnedGradientBoosting (predicts from raw features)
+    """
+    binner, codes = binned_training_data(X_train, features, cache_dir=cache_dir)
+    return BinnedGradientBoosting(binner, make_hgb(max_leaf_nodes, random_state).fit(codes, y_train))
+
+
+def train_spline(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    n_knots: int = SPLINE_KNOTS,
+    interactions: bool = False,
+    alpha: float = SPLINE_ALPHA
+) -> SplineRegression:
+    """
+    Train additive (optionally pairwise tensor-product) spline regression.
+    
+    The design stays sparse; the normal equations are accumulated from
+    densified row blocks (every feature pair shares rows, so the Gram matrix
+    itself is mostly dense) and solved by Cholesky. The small ridge penalty
+    (on the Gram matrix divided by the number of rows, intercept unpenalized)
+    removes the redundancy between the per-feature bases, which each sum to one.
+    
+    Args:
+        X_train: Training features
+        y_train: Training targets
+        n_knots: Knots per feature, including both boundaries
+        interactions: Add pairwise tensor-product terms
+        alpha: Ridge strength
+        
+    Returns:
+        Fitted SplineRegression (predicts from raw features)
+    """
+    basis = SplineBasis(n_knots=n_knots, interactions=interactions).fit(X_train)
+    B = basis.transform(X_train)
+    y_train = np.asarray(y_train, dtype=float)
+    n, m = B.shape
+    print(f"Spline features: {m} columns, {B.nnz / max(n, 1):.0f} nonzeros per row")
+    
+    gram = np.zeros((m + 1, m + 1))
+    rhs = np.zeros(m + 1)
+    block = max(1, SPLINE_BLOCK_ELEMENTS // (m + 1))
+    for start in range(0, n, block):
+        A = np.empty((min(block, n - start), m + 1))
+        A[:, 0] = 1.0
+        A[:, 1:] = B[start:start + block].toarray()
+        gram += A.T @ A
+        rhs += A.T @ y_train[start:start + block]
+    gram[np.arange(1, m + 1), np.arange(1, m + 1)] += alpha * n
+    beta = solve(gram, rhs, assume_a='pos')
+    return SplineRegression(basis, beta[1:], float(beta[0]))
+
+
 def predict(model: LinearRegression, X_test: np.ndarray) -> np.ndarray:
     """
     Make predictions using trained model.
@@ -89,12 +254,95 @@ def compute_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
     }
 
 
+def _ols_svd(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Thin SVD of the intercept-augmented design, truncated to its numerical rank.
+    
+    Args:
+        X: Feature matrix (without intercept column)
+        
+    Returns:
+        Tuple of (U, s, Vt) restricted to the non-negligible singular values
+    """
+    X_design = np.column_stack([np.ones(X.shape[0]), X])
+    U, s, Vt = np.linalg.svd(X_design, full_matrices=False)
+    tol = s.max() * max(X_design.shape) * np.finfo(float).eps
+    rank = int((s > tol).sum())
+    return U[:, :rank], s[:rank], Vt[:rank]
+
+
+def ols_leverages(X: np.ndarray) -> np.ndarray:
+    """
+    Diagonal of the OLS hat matrix (with intercept) without forming it.
+    
+    Args:
+        X: Feature matrix
+        
+    Returns:
+        Leverage h_ii for every row
+    """
+    U, _, _ = _ols_svd(X)
+    return np.einsum('ij,ij->i', U, U)
+
+
+def loo_residuals(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Exact leave-one-out residuals of OLS from a single fit (PRESS residuals).
+    
+    Args:
+        X: Feature matrix
+        y: Target vector
+        
+    Returns:
+        Residuals e_i / (1 - h_ii)
+    """
+    U, _, _ = _ols_svd(X)
+    y = np.asarray(y, dtype=float)
+    fitted = U @ (U.T @ y)
+    leverage = np.einsum('ij,ij->i', U, U)
+    return (y - fitted) / np.clip(1.0 - leverage, np.finfo(float).eps, None)
+
+
+def analytic_kfold_rmse(X: np.ndarray, y: np.ndarray, k: int = 5) -> np.ndarray:
+    """
+    Exact per-fold RMSE of OLS k-fold CV from a single factorization.
+    
+    The design is factored once as X = U S V^T. In the U coordinates the Gram
+    matrix is the identity, so dropping fold S is the block downdate
+    I - U_S^T U_S, solved in the (rank x rank) space instead of refitting.
+    Folds match ``KFold(n_splits=k)`` as used by ``cross_val_score``.
+    
+    Args:
+        X: Feature matrix
+        y: Target vector
+        k: Number of folds
+        
+    Returns:
+        RMSE for each fold
+    """
+    U, _, _ = _ols_svd(X)
+    y = np.asarray(y, dtype=float)
+    Uty = U.T @ y
+    rank = U.shape[1]
+    
+    scores = []
+    for _, test_idx in KFold(n_splits=k).split(U):
+        U_s = U[test_idx]
+        gram_rest = np.eye(rank) - U_s.T @ U_s
+        rhs = Uty - U_s.T @ y[test_idx]
+        coef = np.linalg.lstsq(gram_rest, rhs, rcond=None)[0]
+        fold_resid = y[test_idx] - U_s @ coef
+        scores.append(np.sqrt(np.mean(fold_resid ** 2)))
+    return np.array(scores)
+
+
 def cv_select_poly_degree(
     X: np.ndarray, 
     y: np.ndarray, 
     degrees: List[int] = None, 
     k: int = 5, 
-    random_state: int = 42
+    random_state: int = 42,
+    method: str = CV_METHOD
 ) -> Dict[str, Any]:
     """
     Select best polynomial degree using cross-validation.
@@ -105,26 +353,44 @@ def cv_select_poly_degree(
         degrees: List of degrees to test
         k: Number of CV folds
         random_state: Random seed
+        method: 'analytic' (closed-form k-fold), 'loo' (PRESS leave-one-out)
+            or 'kfold' (refit the model on every fold)
         
     Returns:
         Dictionary with best degree and CV results
     """
     if degrees is None:
         degrees = POLY_DEGREES
+    if method not in CV_METHODS:
+        raise ValueError(f"Unknown CV method '{method}'. Choose from {CV_METHODS}")
     
     cv_results = {}
     
+    # Expand once at the highest degree; every lower degree is a column prefix
+    index = poly_term_index(default_feature_names(X.shape[1]), max(degrees))
+    X_poly_max = index.expand(X)
+    
     for degree in degrees:
-        X_poly = build_poly(X, degree)
-        model = LinearRegression()
+        X_poly = X_poly_max[:, index.column_map(degree)]
+        
+        if method == 'loo':
+            loo_resid = loo_residuals(X_poly, y)
+            cv_results[degree] = {
+                'mean_rmse': float(np.sqrt(np.mean(loo_resid ** 2))),
+                'std_rmse': float(np.abs(loo_resid).std()),
+                'press': float(np.sum(loo_resid ** 2))
+            }
+            continue
         
-        # Use negative RMSE for cross_val_score (higher is better)
-        scores = cross_val_score(model, X_poly, y, cv=k, 
-                               scoring='neg_root_mean_squared_error', 
-                               random_state=random_state)
+        if method == 'analytic':
+            rmse_scores = analytic_kfold_rmse(X_poly, y, k=k)
+        else:
+            # Use negative RMSE for cross_val_score (higher is better)
+            scores = cross_val_score(LinearRegression(), X_poly, y, cv=KFold(n_splits=k),
+                                   scoring='neg_root_mean_squared_error')
+            # Convert back to positive RMSE
+            rmse_scores = -scores
         
-        # Convert back to positive RMSE
-        rmse_scores = -scores
         cv_results[degree] = {
             'mean_rmse': rmse_scores.mean(),
             'std_rmse': rmse_scores.std(),
@@ -140,6 +406,263 @@ def cv_select_poly_degree(
     }
 
 
+def _loo_press(e: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """PRESS (sum of squared LOO residuals) per column of residuals and leverages."""
+    return np.sum((e / np.clip(1.0 - h, np.finfo(float).eps, None)) ** 2, axis=0)
+
+
+def stepwise_select(
+    X: np.ndarray,
+    y: np.ndarray,
+    names: List[str] = None,
+    direction: str = 'both',
+    max_terms: int = None,
+    tol: float = STEPWISE_TOL
+) -> Dict[str, Any]:
+    """
+    Stepwise term selection scored by leave-one-out CV error (PRESS).
+    
+    The current design [1, X_S] is kept as a thin QR factorization. Every
+    candidate addition is scored at once from the rank-one update of the
+    residuals and leverages along the candidate's component orthogonal to
+    Q, and every candidate removal from the column's unique direction
+    Q R^{-T} e_j, so no candidate model is ever refit. The accepted move
+    updates Q and R in place (column append or ``qr_delete``).
+    
+    Args:
+        X: Candidate term matrix (base features or polynomial terms)
+        y: Target vector
+        names: Term names (defaults to x0, x1, ...)
+        direction: 'forward' (start empty, only add), 'backward' (start
+            full, only remove) or 'both' (start empty, add or remove)
+        max_terms: Maximum number of selected terms
+        tol: Minimum relative PRESS improvement to accept a move
+        
+    Returns:
+        Dictionary with selected term indices and names, LOO RMSE and the
+        step-by-step path
+    """
+    if direction not in SELECT_DIRECTIONS:
+        raise ValueError(f"Unknown direction '{direction}'. Choose from {SELECT_DIRECTIONS}")
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n, m = X.shape
+    names = list(names) if names is not None else list(default_feature_names(m))
+    max_terms = m if max_terms is None else min(max_terms, m)
+    
+    # Standardize so the collinearity threshold is scale-free
+    scale = X.std(axis=0)
+    usable = scale > 0
+    C = (X - X.mean(axis=0)) / np.where(usable, scale, 1.0)
+    block = max(1, STEPWISE_BLOCK_ELEMENTS // max(n, 1))
+    
+    if direction == 'backward':
+        selected = list(np.flatnonzero(usable))
+        Q, R = np.linalg.qr(np.column_stack([np.ones(n), C[:, selected]]))
+    else:
+        selected = []
+        Q, R = np.ones((n, 1)) / np.sqrt(n), np.array([[np.sqrt(n)]])
+    e = y - Q @ (Q.T @ y)
+    h = np.einsum('ij,ij->i', Q, Q)
+    press = float(_loo_press(e, h))
+    path = [{'action': 'start', 'term': None, 'loo_rmse': float(np.sqrt(press / n))}]
+    
+    for _ in range(2 * m):
+        best_press, best_move = press * (1.0 - tol), None
+        
+        if direction != 'backward' and len(selected) < max_terms:
+            candidates = np.array([j for j in np.flatnonzero(usable) if j not in selected], dtype=int)
+            for start in range(0, len(candidates), block):
+                idx = candidates[start:start + block]
+                P = Q.T @ C[:, idx]
+                resid = C[:, idx] - Q @ P
+                correction = Q.T @ resid  # second Gram-Schmidt pass for stability
+                resid -= Q @ correction
+                P += correction
+                norms = np.linalg.norm(resid, axis=0)
+                ok = norms > STEPWISE_COLLINEAR_TOL * np.sqrt(n)
+                if not ok.any():
+                    continue
+                q = resid[:, ok] / norms[ok]
+                scores = _loo_press(e[:, None] - q * (q.T @ e), h[:, None] + q ** 2)
+                k = int(np.argmin(scores))
+                if scores[k] < best_press:
+                    j = int(np.flatnonzero(ok)[k])
+                    best_press = float(scores[k])
+                    best_move = ('add', int(idx[j]), q[:, k], P[:, j], norms[j])
+        
+        if direction != 'forward' and selected:
+            # Unique direction of design column c (column 0 is the intercept)
+            R_inv = np.linalg.solve(R, np.eye(R.shape[0]))
+            U = Q @ R_inv[1:].T
+            U /= np.linalg.norm(U, axis=0)
+            scores = _loo_press(e[:, None] + U * (U.T @ y), h[:, None] - U ** 2)
+            k = int(np.argmin(scores))
+            if scores[k] < best_press:
+                best_press = float(scores[k])
+                best_move = ('remove', selected[k], U[:, k], k + 1, None)
+        
+        if best_move is None:
+            break
+        
+        action, term, u, pos, norm = best_move
+        if action == 'add':
+            R = np.block([[R, pos[:, None]], [np.zeros((1, R.shape[1])), np.array([[norm]])]])
+            Q = np.column_stack([Q, u])
+            e = e - u * (u @ e)
+            h = h + u ** 2
+            selected.append(term)
+        else:
+            Q, R = qr_delete(Q, R, pos, which='col')
+            e = e + u * (u @ y)
+            h = h - u ** 2
+            selected.remove(term)
+        press = best_press
+        path.append({'action': action, 'term': names[term], 'loo_rmse': float(np.sqrt(press / n))})
+        print(f"  {action} {names[term]}: LOO RMSE = {np.sqrt(press / n):.4f}")
+    
+    selected = sorted(selected)
+    return {
+        'selected': selected,
+        'names': [names[j] for j in selected],
+        'loo_rmse': float(np.sqrt(press / n)),
+        'path': path
+    }
+
+
+def _select_design(
+    args: argparse.Namespace,
+    X_train: np.ndarray,
+    X_test: np.ndarray,
+    y_train: np.ndarray,
+    names: List[str]
+) -> Tuple[np.ndarray, np.ndarray, List[str], Dict[str, Any]]:
+    """Apply --select to a design; returns the reduced designs, names and selection."""
+    if args.select == 'none':
+        return X_train, X_test, names, None
+    print(f"\nStepwise ({args.select}) selection over {len(names)} candidate terms...")
+    selection = stepwise_select(X_train, y_train, names=names, direction=args.select,
+                                max_terms=args.max_terms)
+    print(f"Selected {len(selection['selected'])} terms (LOO RMSE = {selection['loo_rmse']:.4f})")
+    terms = selection['selected']
+    return X_train[:, terms], X_test[:, terms], selection['names'], selection
+
+
+def _report_importance(
+    args: argparse.Namespace,
+    artifact: Dict[str, Any],
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    groups_test: np.ndarray,
+    name: str
+) -> None:
+    """Compute permutation importance on the test split, save it as JSON and plot it."""
+    print(f"\nComputing permutation importance ({args.importance_repeats} repeats)...")
+    importance = permutation_importance(artifact, X_test, y_test, groups=groups_test,
+                                        n_repeats=args.importance_repeats,
+                                        random_state=args.random_state, n_jobs=None)
+    for feature, value in list(importance['importances'].items())[:10]:
+        print(f"  {feature}: +{value['mean']:.4f} RMSE (± {value['std']:.4f})")
+    importance_path = os.path.join(METRICS_DIR, f"importance_{name}.json")
+    save_json(importance_path, importance)
+    print(f"Importance saved to {importance_path}")
+    permutation_importance_plot(importance,
+                                os.path.join(FIGURES_DIR, f"permutation_importance_{name}.png"))
+
+
+def _neighbor_index(
+    args: argparse.Namespace,
+    df: pd.DataFrame,
+    X_train: np.ndarray,
+    y_train: np.ndarray
+) -> SimilarStudents:
+    """Similar-student index of the training split, keyed by the schema's key column."""
+    key = next((c for c in df.columns if DATA_SCHEMA.get(c, {}).get('unique')), None)
+    ids = df[key].to_numpy() if key else df.index.to_numpy()
+    # Same test_size and seed give the same row permutation as split_data
+    ids_train, _ = train_test_split(ids, test_size=args.test_size, random_state=args.random_state)
+    index = SimilarStudents(X_train, y_train, ids=ids_train)
+    print(f"Indexed {len(X_train)} training students for similar-student lookup ({index.method})")
+    return index
+
+
+def _train_row_hashes(args: argparse.Namespace, df: pd.DataFrame, features: List[str]) -> np.ndarray:
+    """Row hashes (features and target) of the training split, for incremental deletes."""
+    hashes = row_hashes(df, features + [args.target])
+    # Same test_size and seed give the same row permutation as split_data
+    hashes_train, _ = train_test_split(hashes, test_size=args.test_size,
+                                       random_state=args.random_state)
+    return hashes_train
+
+
+def _report_bootstrap(
+    args: argparse.Namespace,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    y_test: np.ndarray,
+    y_pred: np.ndarray,
+    names: List[str]
+) -> Dict[str, Any]:
+    """Bootstrap intervals of the test metrics (and of the coefficients of a pooled model)."""
+    print(f"\nBootstrapping {args.bootstrap} resamples ({BOOTSTRAP_LEVEL:.0%} intervals)...")
+    result = {
+        'n_resamples': args.bootstrap,
+        'level': BOOTSTRAP_LEVEL,
+        'metrics': bootstrap_metrics(y_test, y_pred, n_resamples=args.bootstrap,
+                                     random_state=args.random_state, n_jobs=None),
+    }
+    for name, value in result['metrics'].items():
+        print(f"  {name.upper()}: [{value['lower']:.4f}, {value['upper']:.4f}]")
+    if not args.group_by and args.model in ('linear', 'poly'):
+        result['coefficients'] = bootstrap_coefficients(
+            X_train, y_train, names, n_resamples=args.bootstrap,
+            random_state=args.random_state, n_jobs=None
+        )
+    return result
+
+
+def _interval_coverage(
+    intervals: Dict[str, Any],
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    y_pred: np.ndarray
+) -> Dict[str, float]:
+    """Test-split coverage and mean width of the model's prediction intervals."""
+    lower, upper = prediction_interval({'intervals': intervals}, X_test, y_pred, INTERVAL_LEVEL)
+    coverage = float(np.mean((y_test >= lower) & (y_test <= upper)))
+    print(f"{INTERVAL_LEVEL:.0%} prediction interval: test coverage {coverage:.1%}, "
+          f"mean width {np.mean(upper - lower):.3f}")
+    return {'level': INTERVAL_LEVEL, 'test_coverage': coverage,
+            'mean_width': float(np.mean(upper - lower))}
+
+
+def _interval_unavailable(args: argparse.Namespace, alpha: float) -> Optional[str]:
+    """Why the OLS prediction interval does not describe the fitted estimator (None if it does)."""
+    if args.group_by:
+        return "per-cohort models (--group-by)"
+    if alpha:
+        return f"ridge fits (the model search chose alpha={alpha:g})"
+    if args.bagging:
+        return "bagged ensembles (--bagging)"
+    return None
+
+
+def _report_solver(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Print the least-squares solver diagnostics of a fit and return them for the metrics."""
+    print(f"Solver: {info['solver']} (estimated condition number {info['condition_number']:.3g}"
+          f"{', standardized before expansion' if info.get('standardized') else ''}, "
+          f"{info['seconds']:.3f}s)")
+    return info
+
+
+def _report_bagging(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Print the diagnostics of a bagged ensemble and return them for the metrics."""
+    oob = f", out-of-bag RMSE = {info['oob_rmse']:.4f}" if info['oob_rmse'] is not None else ""
+    print(f"Bagging: {info['n_members']} {info['method']} members over {info['n_blocks']} row blocks"
+          f"{oob} ({info['seconds']:.2f}s)")
+    return info
+
+
 def main():
     """Main CLI interface."""
     parser = argparse.ArgumentParser(description='Student Score Prediction Modeling')
@@ -152,12 +675,51 @@ def main():
                        help='Target column name')
     parser.add_argument('--features', type=str, default=','.join(DEFAULT_FEATURES),
                        help='Comma-separated feature column names')
+    parser.add_argument('--validate', action='store_true',
+                       help='Check rows against the data schema and quarantine violations')
+    parser.add_argument('--dedup', type=str, choices=['exact', 'bloom'], default=None,
+                       help='Drop duplicate rows by normalized row hash (bloom for out-of-core inputs)')
+    parser.add_argument('--dedup-keys', type=str, default=None,
+                       help='Comma-separated columns identifying a record (default: all columns)')
+    parser.add_argument('--filter', type=str, action='append', default=[],
+                       help='Row predicate applied while reading, e.g. "school_type==Public" '
+                            'or "exam_score>=60" (repeatable)')
     
     # Model arguments
-    parser.add_argument('--model', type=str, choices=['linear', 'poly'], required=True,
+    parser.add_argument('--model', type=str, choices=['linear', 'poly', 'hgb', 'spline'], required=True,
                        help='Model type to train')
     parser.add_argument('--degree', type=str, default='auto',
                        help='Polynomial degree (int) or "auto" for CV selection')
+    parser.add_argument('--cv', type=str, choices=CV_METHODS, default=CV_METHOD,
+                       help='Degree selection CV: closed-form k-fold, leave-one-out, or refit k-fold')
+    parser.add_argument('--solver', type=str, choices=SOLVERS, default=SOLVER,
+                       help='Least-squares solver; auto picks Cholesky, QR or SVD by conditioning')
+    parser.add_argument('--bagging', type=int, default=0,
+                       help='Train a bagged ensemble of N linear/poly members, averaged into one model')
+    parser.add_argument('--bagging-method', type=str, choices=BAGGING_METHODS, default=BAGGING_METHOD,
+                       help='Member draws: bootstrap or half-subsample of row blocks')
+    parser.add_argument('--spline-knots', type=int, default=SPLINE_KNOTS,
+                       help='Knots per feature of --model spline (including both boundaries)')
+    parser.add_argument('--interactions', action='store_true',
+                       help='Add pairwise tensor-product terms to --model spline')
+    
+    parser.add_argument('--time-budget', type=float, default=None,
+                       help='Seconds for a successive-halving search over degree, ridge strength '
+                            'and feature subsets (replaces --degree auto)')
+    parser.add_argument('--select', type=str, choices=['none'] + SELECT_DIRECTIONS, default='none',
+                       help='Stepwise term selection scored by LOO CV error')
+    parser.add_argument('--max-terms', type=int, default=None,
+                       help='Maximum number of terms kept by --select')
+    parser.add_argument('--importance-repeats', type=int, default=0,
+                       help='Permutation importance repeats on the test split (0 disables)')
+    parser.add_argument('--group-by', type=str, default=None,
+                       help='Fit one model per value of this column (e.g. school_type)')
+    parser.add_argument('--impute', type=str, choices=IMPUTE_STRATEGIES, default=IMPUTE_STRATEGY,
+                       help='Missing-value strategy (fit on the training split, saved with the model)')
+    parser.add_argument('--bootstrap', type=int, default=0,
+                       help='Bootstrap resamples for metric and coefficient intervals (0 disables)')
+    parser.add_argument('--neighbors', action='store_true',
+                       help='Save a similar-student index of the training split with the model')
     
     # Training arguments
     parser.add_argument('--test-size', type=float, default=TEST_SIZE,
@@ -172,17 +734,25 @@ def main():
                        help='Generate and save plots')
     parser.add_argument('--no-train', action='store_true',
                        help='Only run EDA plots, skip training')
+    parser.add_argument('--profile', action='store_true',
+                       help='Write a streaming profile of the dataset to data_profile.json')
     
     args = parser.parse_args()
+    if args.model in ('hgb', 'spline') and (args.group_by or args.select != 'none' or args.time_budget):
+        parser.error("--group-by, --select and --time-budget apply to linear and poly models only")
+    if args.bagging and (args.model in ('hgb', 'spline') or args.group_by or args.select != 'none'
+                         or args.time_budget):
+        parser.error("--bagging applies to pooled linear and poly models without --select or --time-budget")
     
-    # Parse features
-    features = [f.strip() for f in args.features.split(',')]
+    # Parse features ('all' uses every column except the target, group and key columns)
+    use_all = args.features.strip().lower() == 'all'
+    features = [] if use_all else [f.strip() for f in args.features.split(',')]
     
     print("="*60)
     print("STUDENT SCORE PREDICTION")
     print("="*60)
     print(f"Model: {args.model}")
-    print(f"Features: {features}")
+    print(f"Features: {args.features if use_all else features}")
     print(f"Target: {args.target}")
     
     # Ensure output directories exist
@@ -195,7 +765,30 @@ def main():
     # Load and prepare data
     print("\nLoading and cleaning data...")
     try:
-        df = load_data(data_path)
+        filters = [parse_filter(expr) for expr in args.filter]
+        if args.profile:
+            print("\nProfiling dataset...")
+            profile = profile_dataset(data_path, filters=filters)
+            print_profile(profile)
+            save_json(os.path.join(METRICS_DIR, "data_profile.json"), profile)
+        report = ValidationReport(QUARANTINE_PATH) if args.validate else None
+        dedup = None
+        if args.dedup:
+            keys = [k.strip() for k in args.dedup_keys.split(',')] if args.dedup_keys else None
+            dedup = Deduplicator(key_columns=keys, method=args.dedup)
+        group_cols = [args.group_by] if args.group_by else []
+        columns = None if use_all else features + [args.target] + group_cols
+        df = load_data(data_path, columns=columns, filters=filters,
+                       report=report, dedup=dedup, label_columns=group_cols)
+        if use_all:
+            features = [c for c in df.columns if c not in [args.target] + group_cols
+                        and not DATA_SCHEMA.get(c, {}).get('unique')]
+            print(f"Features: {features}")
+        if report is not None:
+            report.print_summary()
+            save_json(os.path.join(METRICS_DIR, "validation_report.json"), report.to_dict())
+        if dedup is not None:
+            save_json(os.path.join(METRICS_DIR, "dedup_report.json"), dedup.to_dict())
         df_clean = clean_data(df, args.target, features)
         
         # Generate EDA plots if requested
@@ -222,52 +815,162 @@ def main():
             print("\nEDA complete. Exiting (--no-train flag set).")
             sys.exit(0)
         
-        # Split data
+        # Split data (imputation is fit on the training split only)
+        imputer = StreamingImputer(strategy=args.impute)
         X_train, X_test, y_train, y_test = split_data(
             df_clean, features, args.target, 
             test_size=args.test_size, 
-            random_state=args.random_state
+            random_state=args.random_state,
+            imputer=imputer
         )
+        groups_train = groups_test = None
+        if args.group_by:
+            # Same test_size and seed give the same row permutation as split_data
+            groups_train, groups_test = train_test_split(
+                df_clean[args.group_by].to_numpy(dtype=object),
+                test_size=args.test_size, random_state=args.random_state
+            )
         
     except Exception as e:
         print(f"Error loading/processing data: {e}")
         sys.exit(1)
     
+    search = None
+    alpha = 0.0
+    model_kind = args.model
+    if args.time_budget:
+        if args.model == 'linear':
+            degrees = [1]
+        else:
+            degrees = [1] + POLY_DEGREES if args.degree == 'auto' else [int(args.degree)]
+        print(f"\nSearching models for up to {args.time_budget:g}s...")
+        search = successive_halving(X_train, y_train, features, degrees,
+                                    time_budget=args.time_budget, random_state=args.random_state)
+        best = search['best']
+        print(f"Best: degree={best['degree']}, alpha={best['alpha']}, features={best['features']} "
+              f"(validation RMSE = {best['val_rmse']:.4f})")
+        keep = [features.index(f) for f in best['features']]
+        X_train, X_test = X_train[:, keep], X_test[:, keep]
+        features, imputer, alpha = best['features'], imputer.select(keep), best['alpha']
+        if best['degree'] == 1 and args.model == 'poly':
+            # build_poly needs degree >= 2; the linear fit is saved under poly naming
+            print("Search selected degree 1; training it as a linear model")
+            model_kind = 'linear'
+    
+    neighbors = _neighbor_index(args, df_clean, X_train, y_train) if args.neighbors else None
+    
     # Train model
-    print(f"\nTraining {args.model} model...")
+    print(f"\nTraining {model_kind} model...")
     
-    if args.model == 'linear':
-        model = train_linear(X_train, y_train)
-        y_pred = predict(model, X_test)
+    if model_kind == 'linear':
+        X_train_fit, X_test_fit, design_names, selection = _select_design(
+            args, X_train, X_test, y_train, features
+        )
+        if args.group_by:
+            model = fit_group_models(X_train_fit, y_train, groups_train, args.group_by)
+            y_pred = model.predict(X_test_fit, groups_test)
+        elif alpha:
+            model = train_ridge(X_train_fit, y_train, alpha)
+            y_pred = predict(model, X_test_fit)
+        elif args.bagging:
+            model = train_bagged(X_train_fit, y_train, args.bagging, method=args.bagging_method,
+                                 random_state=args.random_state)
+            y_pred = predict(model, X_test_fit)
+        else:
+            model = train_linear(X_train_fit, y_train, solver=args.solver)
+            y_pred = predict(model, X_test_fit)
         
+        # A poly search that selected degree 1 keeps the poly artifact and metrics names
+        searched_poly = args.model == 'poly'
+        name = "poly" if searched_poly else "linear"
         metrics = compute_metrics(y_test, y_pred)
-        print_metrics(metrics, "Linear Regression Results")
+        if searched_poly:
+            metrics['degree'] = 1
+        print_metrics(metrics, "Polynomial Regression Results (degree=1)" if searched_poly
+                      else "Linear Regression Results")
+        if hasattr(model, 'solver_info_'):
+            metrics['solver'] = _report_solver(model.solver_info_)
+        if hasattr(model, 'bagging_info_'):
+            metrics['bagging'] = _report_bagging(model.bagging_info_)
+        if selection:
+            metrics['selection'] = {'direction': args.select, 'terms': design_names,
+                                    'loo_rmse': selection['loo_rmse'], 'path': selection['path']}
+        if search:
+            metrics['search'] = search
+        if args.group_by:
+            metrics['group_by'] = args.group_by
+            metrics['groups'] = group_metrics(y_test, y_pred, groups_test, model)
         
         # Save outputs
-        model_path = os.path.join(MODELS_DIR, "linear_model.pkl")
-        metrics_path = os.path.join(METRICS_DIR, "metrics_linear.json")
+        suffix = f"_by_{args.group_by}" if args.group_by else ""
+        stem = "linear_model"
+        if searched_poly:
+            stem = "poly_best" if args.degree == 'auto' else "poly_degree_1"
+        model_path = os.path.join(MODELS_DIR, f"{stem}{suffix}.pkl")
+        metrics_path = os.path.join(METRICS_DIR, f"metrics_{name}{suffix}.json")
+        
+        if args.bootstrap:
+            metrics['bootstrap'] = _report_bootstrap(args, X_train_fit, y_train, y_test, y_pred,
+                                                     design_names)
         
+        intervals = None
+        no_intervals = _interval_unavailable(args, alpha)
+        if no_intervals is None:
+            intervals = fit_interval_stats(X_train_fit, y_train - predict(model, X_train_fit))
+            metrics['prediction_interval'] = _interval_coverage(intervals, X_test_fit, y_test, y_pred)
+        elif not args.group_by:
+            print(f"No prediction intervals: the OLS formula does not hold for {no_intervals}")
+        
+        artifact = {
+            'model': model,
+            'degree': None,
+            'features': features,
+            'target': args.target,
+            'imputer': imputer,
+            'feature_names': design_names,
+            'terms': selection['selected'] if selection else None,
+            'design_means': X_train_fit.mean(axis=0),
+            'group_by': args.group_by,
+            'neighbors': neighbors,
+            'intervals': intervals,
+            'intervals_unavailable': no_intervals,
+        }
         if args.save_model:
-            joblib.dump(model, model_path)
+            save_model_artifact(model_path, artifact)
             print(f"Model saved to {model_path}")
+            if not args.group_by and not selection and not alpha and not args.bagging:
+                save_stats(stats_path_for(model_path),
+                           init_stats(X_train, y_train, features, args.target,
+                                      hashes=_train_row_hashes(args, df_clean, features)))
         
         save_json(metrics_path, metrics)
         print(f"Metrics saved to {metrics_path}")
         
+        if args.importance_repeats:
+            _report_importance(args, artifact, X_test, y_test, groups_test, f"{name}{suffix}")
+        
         if args.make_plots:
+            plot_name = "poly_deg_1" if searched_poly else "linear"
+            title = "Polynomial Regression (degree=1)" if searched_poly else "Linear Regression"
             pred_vs_actual(y_test, y_pred, 
-                          os.path.join(FIGURES_DIR, "pred_vs_actual_linear.png"),
-                          "Linear Regression: Predictions vs Actual")
+                          os.path.join(FIGURES_DIR, f"pred_vs_actual_{plot_name}.png"),
+                          f"{title}: Predictions vs Actual")
             residuals(y_test, y_pred,
-                     os.path.join(FIGURES_DIR, "residuals_linear.png"),
-                     "Linear Regression: Residual Plot")
+                     os.path.join(FIGURES_DIR, f"residuals_{plot_name}.png"),
+                     f"{title}: Residual Plot")
     
-    elif args.model == 'poly':
+    elif model_kind == 'poly':
         # Determine degree
-        if args.degree == 'auto':
+        if search is not None:
+            best_degree = search['best']['degree']
+            cv_result = None
+            print(f"Using searched polynomial degree: {best_degree}")
+        elif args.degree == 'auto':
             print("Selecting optimal polynomial degree using cross-validation...")
             cv_result = cv_select_poly_degree(X_train, y_train, 
-                                            random_state=args.random_state)
+                                            k=CV_FOLDS,
+                                            random_state=args.random_state,
+                                            method=args.cv)
             best_degree = cv_result['best_degree']
             print(f"Best degree selected: {best_degree}")
             print("CV Results:")
@@ -281,33 +984,96 @@ def main():
         # Train polynomial model
         X_train_poly = build_poly(X_train, best_degree)
         X_test_poly = build_poly(X_test, best_degree)
+        X_train_poly, X_test_poly, design_names, selection = _select_design(
+            args, X_train_poly, X_test_poly, y_train, get_feature_names(features, best_degree)
+        )
         
-        model = train_linear(X_train_poly, y_train)  # Linear on poly features
-        y_pred = predict(model, X_test_poly)
+        if args.group_by:
+            model = fit_group_models(X_train_poly, y_train, groups_train, args.group_by)
+            y_pred = model.predict(X_test_poly, groups_test)
+        elif alpha:
+            model = train_ridge(X_train_poly, y_train, alpha)
+            y_pred = predict(model, X_test_poly)
+        elif args.bagging:
+            model = train_bagged(X_train, y_train, args.bagging, degree=best_degree,
+                                 method=args.bagging_method, random_state=args.random_state)
+            y_pred = predict(model, X_test_poly)
+        elif selection is None:
+            model = train_poly(X_train, y_train, best_degree, solver=args.solver)
+            y_pred = predict(model, X_test_poly)
+        else:
+            model = train_linear(X_train_poly, y_train, solver=args.solver)  # Linear on selected terms
+            y_pred = predict(model, X_test_poly)
         
         metrics = compute_metrics(y_test, y_pred)
         metrics['degree'] = best_degree
         if cv_result:
+            metrics['cv_method'] = args.cv
             metrics['cv_results'] = cv_result['cv_results']
         
         print_metrics(metrics, f"Polynomial Regression Results (degree={best_degree})")
+        if hasattr(model, 'solver_info_'):
+            metrics['solver'] = _report_solver(model.solver_info_)
+        if hasattr(model, 'bagging_info_'):
+            metrics['bagging'] = _report_bagging(model.bagging_info_)
+        if selection:
+            metrics['selection'] = {'direction': args.select, 'terms': design_names,
+                                    'loo_rmse': selection['loo_rmse'], 'path': selection['path']}
+        if search:
+            metrics['search'] = search
+        if args.group_by:
+            metrics['group_by'] = args.group_by
+            metrics['groups'] = group_metrics(y_test, y_pred, groups_test, model)
         
         # Save outputs
-        model_path = os.path.join(MODELS_DIR, f"poly_degree_{best_degree}.pkl")
+        suffix = f"_by_{args.group_by}" if args.group_by else ""
+        model_path = os.path.join(MODELS_DIR, f"poly_degree_{best_degree}{suffix}.pkl")
         if args.degree == 'auto':
-            model_path = os.path.join(MODELS_DIR, "poly_best.pkl")
+            model_path = os.path.join(MODELS_DIR, f"poly_best{suffix}.pkl")
+        
+        metrics_path = os.path.join(METRICS_DIR, f"metrics_poly{suffix}.json")
+        
+        if args.bootstrap:
+            metrics['bootstrap'] = _report_bootstrap(args, X_train_poly, y_train, y_test, y_pred,
+                                                     design_names)
         
-        metrics_path = os.path.join(METRICS_DIR, "metrics_poly.json")
+        intervals = None
+        no_intervals = _interval_unavailable(args, alpha)
+        if no_intervals is None:
+            intervals = fit_interval_stats(X_train_poly, y_train - predict(model, X_train_poly))
+            metrics['prediction_interval'] = _interval_coverage(intervals, X_test_poly, y_test, y_pred)
+        elif not args.group_by:
+            print(f"No prediction intervals: the OLS formula does not hold for {no_intervals}")
         
+        # The model with the degree and preprocessing needed for proper prediction
+        artifact = {
+            'model': model,
+            'degree': best_degree,
+            'features': features,
+            'target': args.target,
+            'imputer': imputer,
+            'feature_names': design_names,
+            'terms': selection['selected'] if selection else None,
+            'design_means': X_train_poly.mean(axis=0),
+            'group_by': args.group_by,
+            'neighbors': neighbors,
+            'intervals': intervals,
+            'intervals_unavailable': no_intervals,
+        }
         if args.save_model:
-            # Save both the model and the degree for proper prediction
-            model_data = {'model': model, 'degree': best_degree}
-            joblib.dump(model_data, model_path)
+            save_model_artifact(model_path, artifact)
             print(f"Model saved to {model_path}")
+            if not args.group_by and not selection and not alpha and not args.bagging:
+                save_stats(stats_path_for(model_path),
+                           init_stats(X_train, y_train, features, args.target, degree=best_degree,
+                                      hashes=_train_row_hashes(args, df_clean, features)))
         
         save_json(metrics_path, metrics)
         print(f"Metrics saved to {metrics_path}")
         
+        if args.importance_repeats:
+            _report_importance(args, artifact, X_test, y_test, groups_test, f"poly{suffix}")
+        
         if args.make_plots:
             pred_vs_actual(y_test, y_pred,
                           os.path.join(FIGURES_DIR, f"pred_vs_actual_poly_deg_{best_degree}.png"),
@@ -327,6 +1093,109 @@ def main():
                 except Exception as e:
                     print(f"Warning: Could not generate comparison plot: {e}")
     
+    elif model_kind == 'hgb':
+        binner, codes = binned_training_data(X_train, features)
+        print("Selecting max_leaf_nodes using cross-validation on the binned features...")
+        cv_result = cv_select_hgb(codes, y_train, k=CV_FOLDS, random_state=args.random_state)
+        leaves = cv_result['best_max_leaf_nodes']
+        for n_leaves, result in cv_result['cv_results'].items():
+            print(f"  max_leaf_nodes={n_leaves}: RMSE = {result['mean_rmse']:.4f} ± {result['std_rmse']:.4f}")
+        
+        model = train_hgb(X_train, y_train, leaves, features, random_state=args.random_state)
+        y_pred = predict(model, X_test)
+        
+        metrics = compute_metrics(y_test, y_pred)
+        print_metrics(metrics, f"Gradient Boosting Results (max_leaf_nodes={leaves})")
+        metrics['max_leaf_nodes'] = leaves
+        metrics['cv_results'] = cv_result['cv_results']
+        if args.bootstrap:
+            metrics['bootstrap'] = _report_bootstrap(args, X_train, y_train, y_test, y_pred, features)
+        
+        model_path = os.path.join(MODELS_DIR, "hgb_model.pkl")
+        metrics_path = os.path.join(METRICS_DIR, "metrics_hgb.json")
+        artifact = {
+            'model': model,
+            'degree': None,
+            'features': features,
+            'target': args.target,
+            'imputer': imputer,
+            'feature_names': features,
+            'terms': None,
+            'design_means': None,
+            'group_by': None,
+            'neighbors': neighbors,
+            'intervals': None,
+            'intervals_unavailable': "hgb models",
+        }
+        if args.save_model:
+            save_model_artifact(model_path, artifact)
+            print(f"Model saved to {model_path}")
+        
+        save_json(metrics_path, metrics)
+        print(f"Metrics saved to {metrics_path}")
+        
+        if args.importance_repeats:
+            _report_importance(args, artifact, X_test, y_test, None, "hgb")
+        
+        if args.make_plots:
+            pred_vs_actual(y_test, y_pred,
+                          os.path.join(FIGURES_DIR, "pred_vs_actual_hgb.png"),
+                          "Gradient Boosting: Predictions vs Actual")
+            residuals(y_test, y_pred,
+                     os.path.join(FIGURES_DIR, "residuals_hgb.png"),
+                     "Gradient Boosting: Residual Plot")
+    
+    elif model_kind == 'spline':
+        start = time.perf_counter()
+        model = train_spline(X_train, y_train, n_knots=args.spline_knots,
+                             interactions=args.interactions)
+        fit_seconds = time.perf_counter() - start
+        y_pred = predict(model, X_test)
+        
+        metrics = compute_metrics(y_test, y_pred)
+        print_metrics(metrics, f"Spline Regression Results (knots={args.spline_knots}"
+                               f"{', interactions' if args.interactions else ''})")
+        metrics['n_knots'] = args.spline_knots
+        metrics['interactions'] = args.interactions
+        metrics['n_columns'] = model.basis.n_columns
+        metrics['fit_seconds'] = fit_seconds
+        if args.bootstrap:
+            metrics['bootstrap'] = _report_bootstrap(args, X_train, y_train, y_test, y_pred, features)
+        
+        model_path = os.path.join(MODELS_DIR, "spline_model.pkl")
+        metrics_path = os.path.join(METRICS_DIR, "metrics_spline.json")
+        artifact = {
+            'model': model,
+            'degree': None,
+            'features': features,
+            'target': args.target,
+            'imputer': imputer,
+            'feature_names': features,
+            'terms': None,
+            'design_means': None,
+            'group_by': None,
+            'neighbors': neighbors,
+            'intervals': None,
+            'intervals_unavailable': "spline models",
+        }
+        if args.save_model:
+            save_model_artifact(model_path, artifact)
+            print(f"Model saved to {model_path}")
+        
+        save_json(metrics_path, metrics)
+        print(f"Metrics saved to {metrics_path}")
+        
+        if args.importance_repeats:
+            _report_importance(args, artifact, X_test, y_test, None, "spline")
+        
+        if args.make_plots:
+            pred_vs_actual(y_test, y_pred,
+                          os.path.join(FIGURES_DIR, "pred_vs_actual_spline.png"),
+                          "Spline Regression: Predictions vs Actual")
+            residuals(y_test, y_pred,
+                     os.path.join(FIGURES_DIR, "residuals_spline.png"),
+                     "Spline Regression: Residual Plot")
+    
     print("\n" + "="*60)
     print("ANALYSIS COMPLETE")
     print("="*60)
@@ -4,7 +4,7 @@ Plotting functions using matplotlib for visualizations.
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 import os
 
 
@@ -210,4 +210,81 @@ def metrics_comparison(
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     plt.savefig(out_path, dpi=150, bbox_inches='tight')
     plt.close()
-    print(f"Saved metrics comparison plot to {out_path}")
\ No newline at end of file
+    print(f"Saved metrics comparison plot to {out_path}")
+
+def permutation_importance_plot(
+    importance: Dict[str, Any],
+    out_path: str,
+    title: str = "Permutation Feature Importance"
+) -> None:
+    """
+    Create horizontal bar chart of permutation importances with error bars.
+    
+    Args:
+        importance: Result of importance.permutation_importance
+        out_path: Output file path
+        title: Plot title
+    """
+    items = list(importance['importances'].items())[::-1]
+    names = [name.replace('_', ' ').title() for name, _ in items]
+    means = [v['mean'] for _, v in items]
+    stds = [v['std'] for _, v in items]
+    
+    fig, ax = plt.subplots(figsize=(10, max(3, 0.4 * len(items) + 1)))
+    ax.barh(names, means, xerr=stds, alpha=0.8, capsize=3)
+    ax.axvline(0, color='black', linewidth=0.8)
+    ax.set_xlabel(f"RMSE increase (baseline {importance['baseline_rmse']:.3f}, "
+                  f"{importance['n_repeats']} repeats)")
+    ax.set_title(title)
+    ax.grid(True, alpha=0.3, axis='x')
+    
+    plt.tight_layout()
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    plt.savefig(out_path, dpi=150, bbox_inches='tight')
+    plt.close()
+    print(f"Saved permutation importance plot to {out_path}")
+
+
+def pdp_ice_plot(
+    result: Dict[str, Any],
+    out_path: str,
+    max_ice_lines: int = 50,
+    title: Optional[str] = None
+) -> None:
+    """
+    Plot partial dependence with ICE curves (one feature) or as a heatmap (two features).
+    
+    Args:
+        result: Result of whatif.partial_dependence
+        out_path: Output file path
+        max_ice_lines: Maximum number of individual curves drawn
+        title: Plot title
+    """
+    features = result['features']
+    names = [f.replace('_', ' ').title() for f in features]
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
+    if len(features) == 1:
+        grid = result['grids'][0]
+        ice = result['ice']
+        step = max(1, len(ice) // max_ice_lines)
+        for curve in ice[::step]:
+            ax.plot(grid, curve, color='gray', alpha=0.25, linewidth=0.8)
+        ax.plot(grid, result['pd'], color='red', linewidth=2.5, label='Partial dependence')
+        ax.set_xlabel(names[0])
+        ax.set_ylabel('Predicted score')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    else:
+        mesh = ax.pcolormesh(result['grids'][1], result['grids'][0], result['pd'],
+                             shading='auto', cmap='viridis')
+        fig.colorbar(mesh, ax=ax, label='Predicted score')
+        ax.set_xlabel(names[1])
+        ax.set_ylabel(names[0])
+    
+    ax.set_title(title or f"Partial Dependence: {' x '.join(names)}")
+    plt.tight_layout()
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    plt.savefig(out_path, dpi=150, bbox_inches='tight')
+    plt.close()
+    print(f"Saved partial dependence plot to {out_path}")
@@ -0,0 +1,217 @@
+"""
+Single-pass streaming dataset profile.
+
+Chunks are read with ``iter_partitions`` and folded into mergeable summaries
+(running moments, KLL quantile sketches, heavy-hitter counts and pairwise
+co-moments for correlations), so the profile of a file far larger than
+memory is computed in one pass with bounded memory.
+"""
+import argparse
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .config import PROFILE_QUANTILES, PROFILE_SKETCH_K, PROFILE_TOP_K, METRICS_DIR
+from .data import Filter, iter_partitions, parse_filter
+from .sketches import FrequentItems, KLLSketch, RunningMoments
+from .utils import save_json
+
+
+class CorrelationAccumulator:
+    """
+    Pairwise-complete Pearson correlations accumulated chunk by chunk.
+
+    Values are shifted by a reference point (the first chunk's means) before
+    the sums are taken, which keeps the one-pass formula numerically stable.
+    """
+
+    def __init__(self, n_columns: int):
+        self.shift: Optional[np.ndarray] = None
+        self.n = np.zeros((n_columns, n_columns))
+        self.sx = np.zeros((n_columns, n_columns))
+        self.sxx = np.zeros((n_columns, n_columns))
+        self.sxy = np.zeros((n_columns, n_columns))
+
+    def update(self, X: np.ndarray) -> "CorrelationAccumulator":
+        """
+        Fold a chunk of rows into the co-moment sums.
+
+        Args:
+            X: Numeric array of shape (n_rows, n_columns), NaN for missing
+
+        Returns:
+            self
+        """
+        X = np.asarray(X, dtype=float)
+        present = (~np.isnan(X)).astype(float)
+        if self.shift is None:
+            self.shift = RunningMoments(X.shape[1]).update(X).mean
+        Z = np.where(present > 0, X - self.shift, 0.0)
+        # Entry (i, j) sums over rows where both column i and column j are observed
+        self.n += present.T @ present
+        self.sx += Z.T @ present
+        self.sxx += (Z ** 2).T @ present
+        self.sxy += Z.T @ Z
+        return self
+
+    def correlation(self) -> np.ndarray:
+        """
+        Correlation matrix (NaN where a pair has fewer than two rows or no variance).
+
+        Returns:
+            Array of shape (n_columns, n_columns)
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            n = np.where(self.n > 1, self.n, np.nan)
+            mean_x, mean_y = self.sx / n, self.sx.T / n
+            cov = self.sxy / n - mean_x * mean_y
+            var_x = self.sxx / n - mean_x ** 2
+            var_y = self.sxx.T / n - mean_y ** 2
+            corr = cov / np.sqrt(var_x * var_y)
+        return np.clip(corr, -1.0, 1.0)
+
+
+def _json_value(value: Any) -> Any:
+    """Convert NumPy scalars and non-finite floats to JSON-friendly values."""
+    if isinstance(value, (np.integer,)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value) if np.isfinite(value) else None
+    return value
+
+
+def profile_dataset(
+    path: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Sequence[Filter]] = None,
+    n_jobs: Optional[int] = None,
+    quantiles: Sequence[float] = PROFILE_QUANTILES,
+    sketch_k: int = PROFILE_SKETCH_K,
+    top_k: int = PROFILE_TOP_K
+) -> Dict[str, Any]:
+    """
+    Profile a dataset in one streaming pass.
+
+    Numeric columns get count, missing rate, min/max, mean/std and approximate
+    quantiles; categorical columns get count, missing rate and their most
+    frequent values. A pairwise correlation matrix of the numeric columns is
+    merged across chunks.
+
+    Args:
+        path: A CSV file, a directory of CSV files, or a glob pattern
+        columns: Normalized columns to profile (None profiles all)
+        filters: Row predicates applied while reading
+        n_jobs: Number of parallel partition readers
+        quantiles: Quantiles to report for numeric columns
+        sketch_k: KLL sketch size (rank error roughly 1.7 / k)
+        top_k: Number of heavy hitters tracked per categorical column
+
+    Returns:
+        Profile dictionary (JSON-serializable)
+    """
+    n_rows = 0
+    numeric: List[str] = []
+    categorical: List[str] = []
+    missing: Dict[str, int] = {}
+    moments: Optional[RunningMoments] = None
+    corr: Optional[CorrelationAccumulator] = None
+    kll: List[KLLSketch] = []
+    freq: Dict[str, FrequentItems] = {}
+
+    for chunk in iter_partitions(path, n_jobs=n_jobs, columns=columns, filters=filters,
+                                 coerce_numeric=False):
+        if moments is None:
+            numeric = [c for c in chunk.columns if pd.api.types.is_numeric_dtype(chunk[c])]
+            categorical = [c for c in chunk.columns if c not in numeric]
+            missing = {c: 0 for c in chunk.columns}
+            moments = RunningMoments(len(numeric))
+            corr = CorrelationAccumulator(len(numeric))
+            kll = [KLLSketch(sketch_k, seed=j) for j in range(len(numeric))]
+            freq = {c: FrequentItems(top_k) for c in categorical}
+
+        n_rows += len(chunk)
+        for c, n_missing in chunk.isna().sum().items():
+            missing[c] += int(n_missing)
+
+        X = chunk[numeric].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        moments.update(X)
+        corr.update(X)
+        for j, sketch in enumerate(kll):
+            sketch.update(X[:, j])
+        for c in categorical:
+            freq[c].update(chunk[c].astype(object).to_numpy())
+
+    if moments is None:
+        raise ValueError(f"No rows to profile at {path}")
+
+    profile: Dict[str, Any] = {'n_rows': n_rows, 'numeric': {}, 'categorical': {}}
+    std = np.sqrt(moments.variance)
+    for j, c in enumerate(numeric):
+        qs = kll[j].quantile(quantiles)
+        profile['numeric'][c] = {
+            'count': int(moments.count[j]),
+            'missing_rate': missing[c] / n_rows if n_rows else 0.0,
+            'mean': _json_value(moments.mean[j]) if moments.count[j] else None,
+            'std': _json_value(std[j]),
+            'min': _json_value(moments.min[j]),
+            'max': _json_value(moments.max[j]),
+            'quantiles': {str(q): _json_value(v) for q, v in zip(quantiles, qs)},
+        }
+    for c in categorical:
+        profile['categorical'][c] = {
+            'count': freq[c].n,
+            'missing_rate': missing[c] / n_rows if n_rows else 0.0,
+            'top': [{'value': str(v), 'count': int(n)} for v, n in freq[c].top()],
+        }
+    matrix = corr.correlation()
+    profile['correlation'] = {
+        'columns': numeric,
+        'matrix': [[_json_value(v) for v in row] for row in matrix],
+    }
+    return profile
+
+
+def print_profile(profile: Dict[str, Any]) -> None:
+    """
+    Print a short summary of a dataset profile.
+
+    Args:
+        profile: Profile from profile_dataset
+    """
+    print(f"Rows profiled: {profile['n_rows']}")
+    for c, p in profile['numeric'].items():
+        mean = 'n/a' if p['mean'] is None else f"{p['mean']:.3f}"
+        print(f"  {c}: mean={mean}, missing={p['missing_rate']:.1%}, "
+              f"range=[{p['min']}, {p['max']}]")
+    for c, p in profile['categorical'].items():
+        top = ', '.join(t['value'] for t in p['top'][:3])
+        print(f"  {c}: missing={p['missing_rate']:.1%}, top=[{top}]")
+
+
+def main():
+    """CLI for writing a dataset profile to JSON."""
+    parser = argparse.ArgumentParser(description='Streaming Dataset Profile')
+    parser.add_argument('--data-path', type=str, required=True,
+                        help='CSV file, directory of CSV partitions, or glob pattern')
+    parser.add_argument('--output', type=str, default=os.path.join(METRICS_DIR, "data_profile.json"),
+                        help='Output JSON path')
+    parser.add_argument('--columns', type=str, default=None,
+                        help='Comma-separated columns to profile (default: all)')
+    parser.add_argument('--filter', type=str, action='append', default=[],
+                        help="Row filter such as 'school_type==Public' (repeatable)")
+    parser.add_argument('--n-jobs', type=int, default=None,
+                        help='Number of parallel partition readers')
+    args = parser.parse_args()
+
+    columns = [c.strip() for c in args.columns.split(',')] if args.columns else None
+    filters = [parse_filter(f) for f in args.filter]
+    profile = profile_dataset(args.data_path, columns=columns, filters=filters, n_jobs=args.n_jobs)
+    print_profile(profile)
+    save_json(args.output, profile)
+    print(f"Profile saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""
+Batch scoring with a saved model artifact.
+
+Partitions are streamed from disk, imputed with the imputer fit at training
+time, expanded into polynomial terms if needed and predicted in one
+vectorized call per chunk. Optionally, exact additive per-feature
+contributions of every prediction are written alongside.
+"""
+import argparse
+import importlib.util
+import os
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .artifacts import load_model_artifact
+from .data import iter_partitions
+from .features import poly_term_index
+from .intervals import prediction_interval
+
+
+def design_from_array(artifact: Dict[str, Any], X: np.ndarray) -> np.ndarray:
+    """
+    Build the model's design matrix from a base feature matrix.
+
+    Args:
+        artifact: Model artifact from load_model_artifact
+        X: Base features in the artifact's feature order (may contain NaNs)
+
+    Returns:
+        Design matrix (imputed, polynomial-expanded if the model has a degree,
+        restricted to the selected terms)
+    """
+    X = np.asarray(X, dtype=float)
+    if artifact['imputer'] is not None:
+        X = artifact['imputer'].transform(X)
+    if artifact['degree'] is not None:
+        X = poly_term_index(tuple(artifact['features']), artifact['degree']).expand(X)
+    if artifact['terms'] is not None:
+        X = X[:, artifact['terms']]
+    return X
+
+
+def design_matrix(artifact: Dict[str, Any], df: pd.DataFrame) -> np.ndarray:
+    """
+    Build the model's design matrix for a frame of raw records.
+
+    Args:
+        artifact: Model artifact from load_model_artifact
+        df: Records containing the artifact's feature columns
+
+    Returns:
+        Design matrix, as built by design_from_array
+    """
+    features = artifact['features']
+    if features is None:
+        raise ValueError("Model artifact does not record its feature columns; retrain it")
+    missing = [f for f in features if f not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {missing}")
+    return design_from_array(artifact, df[features].to_numpy(dtype=float))
+
+
+def predict_array(
+    artifact: Dict[str, Any],
+    X: np.ndarray,
+    groups: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Predict scores from a base feature matrix.
+
+    Args:
+        artifact: Model artifact from load_model_artifact
+        X: Base features in the artifact's feature order
+        groups: Group label per row (per-cohort models only)
+
+    Returns:
+        Predicted scores
+    """
+    design = design_from_array(artifact, X)
+    if artifact['group_by'] is not None:
+        return artifact['model'].predict(design, groups)
+    return artifact['model'].predict(design)
+
+
+def predict_frame(artifact: Dict[str, Any], df: pd.DataFrame) -> np.ndarray:
+    """
+    Predict scores for a frame of raw records.
+
+    Per-cohort models route each row to the model of its group.
+
+    Args:
+        artifact: Model artifact from load_model_artifact
+        df: Records containing the artifact's feature (and group) columns
+
+    Returns:
+        Predicted scores
+    """
+    X = design_matrix(artifact, df)
+    if artifact['group_by'] is not None:
+        return artifact['model'].predict(X, df[artifact['group_by']].to_numpy())
+    return artifact['model'].predict(X)
+
+
+def design_powers(artifact: Dict[str, Any]) -> np.ndarray:
+    """
+    Exponent of every base feature in every design column.
+
+    Args:
+        artifact: Model artifact
+
+    Returns:
+        Integer array of shape (n_terms, n_features); a linear model is the identity
+    """
+    n_features = len(artifact['features'])
+    if artifact['degree'] is not None:
+        powers = poly_term_index(tuple(artifact['features']), artifact['degree']).powers
+    else:
+        powers = np.eye(n_features, dtype=int)
+    if artifact['terms'] is not None:
+        powers = powers[artifact['terms']]
+    return powers
+
+
+def contribution_map(artifact: Dict[str, Any]) -> np.ndarray:
+    """
+    Matrix aggregating design-term contributions back to base features.
+
+    A term's contribution is shared among the features it contains in
+    proportion to their powers (``x1^2 x2`` gives 2/3 to x1, 1/3 to x2).
+
+    Args:
+        artifact: Model artifact
+
+    Returns:
+        Array of shape (n_terms, n_features) whose rows sum to 1
+    """
+    powers = design_powers(artifact).astype(float)
+    return powers / powers.sum(axis=1, keepdims=True)
+
+
+def check_explainable(artifact: Dict[str, Any]) -> None:
+    """
+    Raise ValueError for models without coefficients (e.g. hgb or spline models).
+
+    Args:
+        artifact: Model artifact
+    """
+    if not hasattr(artifact['model'], 'coef_'):
+        raise ValueError("Additive explanations need a linear or polynomial model")
+
+
+def check_intervals(artifact: Dict[str, Any]) -> None:
+    """
+    Raise ValueError, saying why, for models saved without interval statistics.
+
+    Args:
+        artifact: Model artifact
+    """
+    if artifact['intervals'] is not None:
+        return
+    reason = artifact['intervals_unavailable']
+    if reason:
+        raise ValueError(f"The model has no interval statistics: OLS prediction intervals "
+                         f"do not hold for {reason}")
+    raise ValueError("The model has no interval statistics; retrain it as a linear or "
+                     "polynomial model")
+
+
+def explain_design(
+    artifact: Dict[str, Any],
+    design: np.ndarray,
+    groups: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact additive per-feature contributions of a linear or polynomial model.
+
+    Each design term contributes coef * (term - training mean of the term);
+    terms are aggregated to base features with contribution_map. For every
+    row, base value + contributions.sum() equals the prediction. All rows
+    are explained with two matrix operations.
+
+    Args:
+        artifact: Model artifact (trained models store the design means;
+            older artifacts explain relative to an all-zero design)
+        design: Design matrix, as built by design_from_array
+        groups: Group label per row (per-cohort models only)
+
+    Returns:
+        Tuple of (base values of shape (n_rows,), contributions of shape
+        (n_rows, n_features))
+    """
+    check_explainable(artifact)
+    model = artifact['model']
+    means = artifact['design_means']
+    if means is None:
+        means = np.zeros(design.shape[1])
+
+    if artifact['group_by'] is not None:
+        coef, intercept = model.row_coef(groups)
+        base = intercept + coef @ means
+    else:
+        coef, intercept = np.asarray(model.coef_, dtype=float), float(model.intercept_)
+        base = np.full(len(design), intercept + coef @ means)
+    contributions = ((design - means) * coef) @ contribution_map(artifact)
+    return base, contributions
+
+
+def explain_array(
+    artifact: Dict[str, Any],
+    X: np.ndarray,
+    groups: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-feature contributions for a base feature matrix (see explain_design).
+
+    Args:
+        artifact: Model artifact
+        X: Base features in the artifact's feature order
+        groups: Group label per row (per-cohort models only)
+
+    Returns:
+        Tuple of (base values, contributions)
+    """
+    return explain_design(artifact, design_from_array(artifact, X), groups)
+
+
+def _write_explanations(path: str, part: int, columns: Dict[str, np.ndarray]) -> None:
+    """Write one chunk of explanations as a columnar part file (Parquet or .npz)."""
+    os.makedirs(path, exist_ok=True)
+    if importlib.util.find_spec('pyarrow') is not None:
+        pd.DataFrame(columns).to_parquet(os.path.join(path, f"part-{part:05d}.parquet"), index=False)
+    else:
+        np.savez_compressed(os.path.join(path, f"part-{part:05d}.npz"), **columns)
+
+
+def score_file(
+    model_path: str,
+    data_path: str,
+    output_path: str,
+    id_column: Optional[str] = None,
+    n_jobs: Optional[int] = None,
+    explain_path: Optional[str] = None,
+    interval: Optional[float] = None
+) -> int:
+    """
+    Score every record of a CSV file, directory or glob and write the predictions.
+
+    Args:
+        model_path: Path of the saved model artifact
+        data_path: CSV partition(s) to score
+        output_path: Output CSV path
+        id_column: Optional identifier column copied to the output
+        n_jobs: Number of parallel partition readers
+        explain_path: If given, per-feature contributions are written to this
+            directory as columnar part files (Parquet with pyarrow, else .npz)
+        interval: If given (e.g. 0.95), prediction interval bounds at this
+            level are written as extra columns
+
+    Returns:
+        Number of scored rows
+    """
+    artifact = load_model_artifact(model_path)
+    if interval:
+        check_intervals(artifact)
+    if explain_path:
+        # Before any output is written, so a rejected model leaves no partial file
+        check_explainable(artifact)
+    columns = list(artifact['features'] or [])
+    labels = [c for c in [id_column, artifact['group_by']] if c]
+    if columns:
+        columns = list(dict.fromkeys(labels + columns))
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    n_rows = 0
+    header = True
+    for part, df in enumerate(iter_partitions(data_path, n_jobs=n_jobs, columns=columns or None,
+                                              label_columns=labels)):
+        # The design is built once and shared by the prediction, its interval
+        # and its explanation
+        design = design_matrix(artifact, df)
+        groups = df[artifact['group_by']].to_numpy() if artifact['group_by'] else None
+        if groups is not None:
+            pred = artifact['model'].predict(design, groups)
+        else:
+            pred = artifact['model'].predict(design)
+        out = pd.DataFrame({'predicted_score': pred})
+        if interval:
+            out['lower_bound'], out['upper_bound'] = prediction_interval(artifact, design, pred,
+                                                                         interval)
+        if id_column:
+            out.insert(0, id_column, df[id_column].to_numpy())
+        out.to_csv(output_path, mode='w' if header else 'a', header=header, index=False)
+        header = False
+        n_rows += len(out)
+        
+        if explain_path:
+            base, contrib = explain_design(artifact, design, groups)
+            cols = {c: out[c].to_numpy() for c in out.columns}
+            cols['base_value'] = base.astype(np.float32)
+            cols.update({f"contrib_{f}": contrib[:, j].astype(np.float32)
+                         for j, f in enumerate(artifact['features'])})
+            _write_explanations(explain_path, part, cols)
+
+    print(f"Scored {n_rows} rows -> {output_path}")
+    if explain_path:
+        print(f"Explanations written to {explain_path}")
+    return n_rows
+
+
+def main():
+    """CLI for batch scoring with a saved model."""
+    parser = argparse.ArgumentParser(description='Batch Student Score Prediction')
+    parser.add_argument('--model-path', type=str, required=True,
+                        help='Path of the saved model')
+    parser.add_argument('--data-path', type=str, required=True,
+                        help='CSV partition (file, directory or glob) to score')
+    parser.add_argument('--output', type=str, required=True,
+                        help='Output CSV path')
+    parser.add_argument('--id-column', type=str, default=None,
+                        help='Identifier column to copy to the output')
+    parser.add_argument('--n-jobs', type=int, default=None,
+                        help='Number of parallel partition readers')
+    parser.add_argument('--explain', type=str, default=None,
+                        help='Directory for per-feature contribution files (columnar)')
+    parser.add_argument('--interval', type=float, default=None,
+                        help='Add prediction interval bounds at this level (e.g. 0.95)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model_path):
+        print(f"Error: model not found at {args.model_path}")
+        sys.exit(1)
+    if args.explain or args.interval:
+        artifact = load_model_artifact(args.model_path)
+        try:
+            if args.explain:
+                check_explainable(artifact)
+            if args.interval:
+                check_intervals(artifact)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+    score_file(args.model_path, args.data_path, args.output,
+               id_column=args.id_column, n_jobs=args.n_jobs, explain_path=args.explain,
+               interval=args.interval)
+
+
+if __name__ == "__main__":
+    main()
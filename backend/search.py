@@ -0,0 +1,166 @@
+"""
+Budgeted model search by successive halving.
+
+Every configuration (polynomial degree, ridge strength, feature subset) is
+first scored on a small row subsample against a fixed validation split;
+only the best 1/eta advance to a rung with eta times more rows. Clearly
+worse configurations are therefore never fit on the full training data,
+and the search stops early when its time budget runs out. Configurations
+that share a degree and feature subset share one design expansion and one
+eigendecomposition, from which every ridge strength is solved at once.
+"""
+import math
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config import (
+    RANDOM_STATE, SEARCH_ALPHAS, SEARCH_ETA, SEARCH_MIN_ROWS, SEARCH_VALIDATION_FRACTION
+)
+from .features import poly_term_index
+
+
+def ridge_path(
+    X: np.ndarray,
+    y: np.ndarray,
+    alphas: Sequence[float]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ridge solutions for several strengths from one eigendecomposition.
+
+    Columns are standardized and the penalty applies to the Gram matrix
+    divided by the number of rows, so a strength means the same at every
+    sample size. alpha=0 is ordinary least squares (minimum-norm if singular).
+
+    Args:
+        X: Design matrix (without intercept)
+        y: Targets
+        alphas: Ridge strengths
+
+    Returns:
+        Tuple of (coefficients of shape (n_alphas, n_columns) and intercepts
+        of shape (n_alphas,)), on the original column scale
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    mean = X.mean(axis=0)
+    std = X.std(axis=0)
+    std[std == 0] = 1.0
+    Z = (X - mean) / std
+    y_mean = y.mean()
+
+    eigvals, V = np.linalg.eigh(Z.T @ Z / len(X))
+    c = V.T @ (Z.T @ (y - y_mean)) / len(X)
+    shifted = eigvals[None, :] + np.asarray(alphas, dtype=float)[:, None]
+    tol = max(eigvals.max(), 0.0) * len(eigvals) * np.finfo(float).eps
+    inverse = np.where(shifted > tol, 1.0 / np.where(shifted > tol, shifted, 1.0), 0.0)
+
+    coef = ((inverse * c) @ V.T) / std
+    return coef, y_mean - coef @ mean
+
+
+def _design(X: np.ndarray, subset: Tuple[str, ...], degree: int) -> np.ndarray:
+    """Base columns of a subset, expanded if the degree is above 1."""
+    return X if degree == 1 else poly_term_index(subset, degree).expand(X)
+
+
+def successive_halving(
+    X: np.ndarray,
+    y: np.ndarray,
+    features: List[str],
+    degrees: Sequence[int],
+    alphas: Sequence[float] = SEARCH_ALPHAS,
+    time_budget: Optional[float] = None,
+    eta: int = SEARCH_ETA,
+    min_rows: int = SEARCH_MIN_ROWS,
+    validation_fraction: float = SEARCH_VALIDATION_FRACTION,
+    random_state: int = RANDOM_STATE
+) -> Dict[str, Any]:
+    """
+    Search degree, ridge strength and feature subset by successive halving.
+
+    Feature subsets are all features and every drop-one subset.
+
+    Args:
+        X: Training feature matrix (imputed)
+        y: Training targets
+        features: Feature names of the columns of X
+        degrees: Polynomial degrees to try (1 is the linear model)
+        alphas: Ridge strengths to try (0 is ordinary least squares)
+        time_budget: Seconds after which no further configurations are
+            evaluated (None for no limit)
+        eta: Fraction of configurations (1/eta) kept per rung, and the
+            growth factor of the rung's rows
+        min_rows: Rows of the first rung
+        validation_fraction: Share of the rows held out for scoring
+        random_state: Seed of the row order and validation split
+
+    Returns:
+        Dictionary with the best configuration, the search trace (one entry
+        per evaluated configuration and rung) and timing information
+    """
+    start = time.perf_counter()
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    order = np.random.default_rng(random_state).permutation(len(X))
+    n_val = max(1, int(round(len(X) * validation_fraction)))
+    val, fit = order[:n_val], order[n_val:]
+
+    subsets = [tuple(features)]
+    if len(features) > 1:
+        subsets += [tuple(f for f in features if f != dropped) for dropped in features]
+    configs = [(d, s, a) for d in degrees for s in subsets for a in alphas]
+    n_configs = len(configs)
+    print(f"Successive halving over {n_configs} configurations"
+          + (f" (budget {time_budget:g}s)" if time_budget else ""))
+
+    trace: List[Dict[str, Any]] = []
+    n_rows = min(min_rows, len(fit))
+    rung = 0
+    timed_out = False
+    while True:
+        rows = fit[:n_rows]
+        scored: List[Tuple[Tuple[int, Tuple[str, ...], float], float]] = []
+        groups: Dict[Tuple[int, Tuple[str, ...]], List[float]] = {}
+        for d, s, a in configs:
+            groups.setdefault((d, s), []).append(a)
+
+        for (degree, subset), group_alphas in groups.items():
+            if time_budget and scored and time.perf_counter() - start > time_budget:
+                timed_out = True
+                break
+            cols = [features.index(f) for f in subset]
+            coef, intercept = ridge_path(_design(X[np.ix_(rows, cols)], subset, degree), y[rows],
+                                         group_alphas)
+            pred = _design(X[np.ix_(val, cols)], subset, degree) @ coef.T + intercept
+            rmse = np.sqrt(np.mean((y[val, None] - pred) ** 2, axis=0))
+            scored += [((degree, subset, a), float(r)) for a, r in zip(group_alphas, rmse)]
+
+        scored.sort(key=lambda item: item[1] if np.isfinite(item[1]) else np.inf)
+        for (degree, subset, alpha), rmse in scored:
+            trace.append({'rung': rung, 'n_rows': int(n_rows), 'degree': degree,
+                          'features': list(subset), 'alpha': alpha, 'val_rmse': rmse})
+        print(f"  Rung {rung}: {len(scored)} configuration(s) on {n_rows} rows, "
+              f"best validation RMSE = {scored[0][1]:.4f}")
+
+        if timed_out or n_rows >= len(fit) or len(scored) == 1:
+            break
+        configs = [config for config, _ in scored[:max(1, math.ceil(len(scored) / eta))]]
+        n_rows = min(n_rows * eta, len(fit))
+        rung += 1
+
+    (degree, subset, alpha), rmse = scored[0]
+    elapsed = time.perf_counter() - start
+    if timed_out:
+        print(f"Time budget reached after {elapsed:.1f}s; keeping the best of rung {rung}")
+    return {
+        'best': {'degree': degree, 'features': list(subset), 'alpha': alpha, 'val_rmse': rmse},
+        'n_configs': n_configs,
+        'n_rungs': rung + 1,
+        'n_fits': len(trace),
+        'elapsed': elapsed,
+        'time_budget': time_budget,
+        'timed_out': timed_out,
+        'trace': trace,
+    }
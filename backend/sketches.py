@@ -0,0 +1,237 @@
+"""
+Mergeable streaming summaries used by imputation and profiling.
+
+Each summary is updated chunk by chunk with vectorized NumPy operations and
+can be merged with another summary of the same kind, so statistics of files
+far larger than memory (or of partitions parsed in parallel) can be combined.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class RunningMoments:
+    """
+    Per-column count, mean, variance (Welford/Chan), min and max, ignoring NaNs.
+    """
+
+    def __init__(self, n_columns: int):
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+
+    def update(self, X: np.ndarray) -> "RunningMoments":
+        """
+        Fold a chunk of rows into the moments.
+
+        Args:
+            X: Numeric array of shape (n_rows, n_columns)
+
+        Returns:
+            self
+        """
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            X = X[:, None]
+        present = ~np.isnan(X)
+        count = present.sum(axis=0).astype(float)
+        filled = np.where(present, X, 0.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, filled.sum(axis=0) / count, 0.0)
+        m2 = np.where(present, (X - mean) ** 2, 0.0).sum(axis=0)
+
+        chunk = RunningMoments(X.shape[1])
+        chunk.count, chunk.mean, chunk.m2 = count, mean, m2
+        chunk.min = np.where(count > 0, np.where(present, X, np.inf).min(axis=0), np.inf)
+        chunk.max = np.where(count > 0, np.where(present, X, -np.inf).max(axis=0), -np.inf)
+        return self.merge(chunk)
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """
+        Combine with moments of another chunk (Chan et al. parallel update).
+
+        Args:
+            other: Moments over the same columns
+
+        Returns:
+            self
+        """
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(total > 0, other.count / total, 0.0)
+            self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * weight
+        self.mean = self.mean + delta * weight
+        self.count = total
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Sample variance (ddof=1) per column."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 1, self.m2 / (self.count - 1), np.nan)
+
+
+class KLLSketch:
+    """
+    Approximate quantiles of a numeric stream (KLL compactor hierarchy).
+
+    Level h holds items of weight 2**h; a full level is sorted and every other
+    item (random offset) is promoted. Memory is O(k) items and the rank error
+    is roughly 1.7 / k. Streams shorter than k are summarized exactly.
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        self.k = k
+        self.n = 0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            buf = self.levels[level]
+            if len(buf) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                buf = np.sort(buf)
+                leftover = buf[len(buf) - len(buf) % 2:]
+                promoted = buf[self._rng.integers(2):len(buf) - len(buf) % 2:2]
+                self.levels[level] = leftover
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values: np.ndarray) -> "KLLSketch":
+        """
+        Add a batch of values (NaNs are ignored).
+
+        Args:
+            values: 1-D numeric array
+
+        Returns:
+            self
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Combine with another sketch.
+
+        Args:
+            other: Sketch of another part of the stream
+
+        Returns:
+            self
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, buf in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], buf])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantile(self, q: Any) -> np.ndarray:
+        """
+        Approximate quantiles.
+
+        Args:
+            q: Quantile or array of quantiles in [0, 1]
+
+        Returns:
+            Quantile estimates (NaN for an empty sketch)
+        """
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(b), 2.0 ** h) for h, b in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cum = items[order], np.cumsum(weights[order])
+        idx = np.searchsorted(cum, q * cum[-1], side='left')
+        return items[np.clip(idx, 0, len(items) - 1)]
+
+
+class FrequentItems:
+    """
+    Heavy hitters of a stream of labels (mergeable Misra-Gries summary).
+
+    At most ``k`` counters are kept; any item with frequency above n / (k + 1)
+    is guaranteed to be present, and counts are underestimated by at most
+    that amount.
+    """
+
+    def __init__(self, k: int = 64):
+        self.k = k
+        self.n = 0
+        self.counts: Dict[Any, int] = {}
+
+    def _merge_counts(self, counts: Dict[Any, int]) -> None:
+        for item, c in counts.items():
+            self.counts[item] = self.counts.get(item, 0) + c
+        if len(self.counts) > self.k:
+            threshold = sorted(self.counts.values(), reverse=True)[self.k]
+            self.counts = {item: c - threshold for item, c in self.counts.items()
+                           if c > threshold}
+
+    def update(self, values: Any) -> "FrequentItems":
+        """
+        Add a batch of labels (missing values are ignored).
+
+        Args:
+            values: 1-D array-like of labels
+
+        Returns:
+            self
+        """
+        series = pd.Series(np.asarray(values).ravel()).dropna()
+        counts = series.value_counts(sort=False)
+        self.n += len(series)
+        self._merge_counts(dict(zip(counts.index.tolist(), counts.to_numpy().tolist())))
+        return self
+
+    def merge(self, other: "FrequentItems") -> "FrequentItems":
+        """
+        Combine with another summary.
+
+        Args:
+            other: Summary of another part of the stream
+
+        Returns:
+            self
+        """
+        self.n += other.n
+        self._merge_counts(other.counts)
+        return self
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """
+        Most frequent items with their (lower-bound) counts.
+
+        Args:
+            n: Number of items (None for all tracked items)
+
+        Returns:
+            List of (item, count), most frequent first
+        """
+        ranked = sorted(self.counts.items(), key=lambda kv: -kv[1])
+        return ranked if n is None else ranked[:n]
+
+    def mode(self) -> Any:
+        """Most frequent item (None for an empty summary)."""
+        ranked = self.top(1)
+        return ranked[0][0] if ranked else None
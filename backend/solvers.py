@@ -0,0 +1,181 @@
+"""
+Least-squares solvers chosen by the conditioning of the design.
+
+Columns are centered (the intercept is recovered afterwards) and scaled to
+unit standard deviation, and the Gram matrix of the scaled design is
+factored by Cholesky. LAPACK's condition estimator on that factor costs
+O(p^2), so the conditioning is known before any more expensive
+factorization is attempted:
+
+    well conditioned        Cholesky on the normal equations (fastest)
+    moderately conditioned  Householder QR of the design (error ~ cond, not cond^2)
+    ill conditioned         SVD, small singular values truncated (minimum norm)
+
+Polynomial models are fit on features standardized before expansion, which
+keeps powers of large-valued features (attendance^5) from dominating the
+conditioning. Their coefficients are then mapped back exactly to monomials
+of the raw features, so saved models keep their usual form.
+"""
+import math
+import time
+from itertools import product
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from scipy.linalg import cho_solve, lapack, qr, solve_triangular
+
+from .config import SOLVER_CHOLESKY_MAX_COND, SOLVER_QR_MAX_COND
+from .features import PolyTermIndex, default_feature_names, poly_term_index
+
+SOLVERS = ['auto', 'cholesky', 'qr', 'svd']
+
+
+def condition_number(chol: np.ndarray, gram_norm: float) -> float:
+    """
+    Estimated condition number of a design from the Cholesky factor of its Gram matrix.
+
+    Args:
+        chol: Lower Cholesky factor of the Gram matrix
+        gram_norm: 1-norm of the Gram matrix
+
+    Returns:
+        Square root of the Gram matrix's estimated 1-norm condition number
+    """
+    rcond, info = lapack.dpocon(chol, gram_norm, uplo='L')
+    if info != 0 or rcond <= 0:
+        return math.inf
+    return float(np.sqrt(1.0 / rcond))
+
+
+def least_squares(
+    X: np.ndarray,
+    y: np.ndarray,
+    solver: str = 'auto'
+) -> Tuple[np.ndarray, float, Dict[str, Any]]:
+    """
+    Ordinary least squares with an intercept, solved by Cholesky, QR or SVD.
+
+    Args:
+        X: Design matrix (without intercept)
+        y: Targets
+        solver: 'auto' picks by the estimated condition number; 'cholesky'
+            and 'qr' fall back to SVD if the design is rank deficient
+
+    Returns:
+        Tuple of (coefficients, intercept, diagnostics with the solver used,
+        the estimated condition number and the solve time in seconds)
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver '{solver}'. Choose from {SOLVERS}")
+    start = time.perf_counter()
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    mean = X.mean(axis=0)
+    scale = X.std(axis=0)
+    scale[scale == 0] = 1.0
+    Z = (X - mean) / scale
+    y_mean = y.mean()
+    yc = y - y_mean
+
+    gram = Z.T @ Z
+    chol = None
+    cond = math.inf
+    try:
+        chol = np.linalg.cholesky(gram)
+        cond = condition_number(chol, float(np.abs(gram).sum(axis=0).max()))
+    except np.linalg.LinAlgError:
+        pass
+
+    chosen = solver
+    if solver == 'auto':
+        if cond <= SOLVER_CHOLESKY_MAX_COND:
+            chosen = 'cholesky'
+        elif cond <= SOLVER_QR_MAX_COND:
+            chosen = 'qr'
+        else:
+            chosen = 'svd'
+    elif not math.isfinite(cond):
+        print(f"Design is rank deficient; using SVD instead of {solver}")
+        chosen = 'svd'
+
+    if chosen == 'cholesky':
+        beta = cho_solve((chol, True), Z.T @ yc)
+    elif chosen == 'qr':
+        Q, R = qr(Z, mode='economic')
+        beta = solve_triangular(R, Q.T @ yc)
+    else:
+        U, sv, Vt = np.linalg.svd(Z, full_matrices=False)
+        keep = sv > sv[0] * max(Z.shape) * np.finfo(float).eps
+        beta = Vt[keep].T @ ((U[:, keep].T @ yc) / sv[keep])
+
+    coef = beta / scale
+    info = {'solver': chosen, 'requested': solver, 'condition_number': cond,
+            'seconds': time.perf_counter() - start}
+    return coef, float(y_mean - coef @ mean), info
+
+
+def raw_poly_coefficients(
+    index: PolyTermIndex,
+    coef: np.ndarray,
+    intercept: float,
+    mean: np.ndarray,
+    scale: np.ndarray
+) -> Tuple[np.ndarray, float]:
+    """
+    Map coefficients on an expansion of standardized features to raw monomials.
+
+    Every term prod_f ((x_f - mean_f) / scale_f) ** p_f is expanded
+    binomially into the monomials of x it contains.
+
+    Args:
+        index: Term index of the expansion
+        coef: Coefficients of the standardized expansion
+        intercept: Intercept of the standardized expansion
+        mean: Feature means used for standardization
+        scale: Feature standard deviations used for standardization
+
+    Returns:
+        Tuple of (coefficients of the raw expansion, intercept)
+    """
+    position = {tuple(int(p) for p in powers): t for t, powers in enumerate(index.powers)}
+    raw = np.zeros(index.n_terms)
+    for t, powers in enumerate(index.powers):
+        base = coef[t] / np.prod(scale ** powers)
+        for lowered in product(*(range(p + 1) for p in powers)):
+            weight = base * np.prod([math.comb(p, q) * (-m) ** (p - q)
+                                     for p, q, m in zip(powers, lowered, mean)])
+            if any(lowered):
+                raw[position[lowered]] += weight
+            else:
+                intercept += weight
+    return raw, float(intercept)
+
+
+def fit_poly_standardized(
+    X: np.ndarray,
+    y: np.ndarray,
+    degree: int,
+    solver: str = 'auto'
+) -> Tuple[np.ndarray, float, Dict[str, Any]]:
+    """
+    Polynomial least squares on features standardized before expansion.
+
+    Args:
+        X: Base feature matrix
+        y: Targets
+        degree: Polynomial degree
+        solver: See least_squares
+
+    Returns:
+        Tuple of (coefficients of the raw polynomial expansion as built by
+        build_poly, intercept, solver diagnostics)
+    """
+    X = np.asarray(X, dtype=float)
+    mean = X.mean(axis=0)
+    scale = X.std(axis=0)
+    scale[scale == 0] = 1.0
+    index = poly_term_index(default_feature_names(X.shape[1]), degree)
+    coef, intercept, info = least_squares(index.expand((X - mean) / scale), y, solver)
+    coef, intercept = raw_poly_coefficients(index, coef, intercept, mean, scale)
+    info['standardized'] = True
+    return coef, intercept, info
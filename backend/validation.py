@@ -0,0 +1,184 @@
+"""
+Schema-driven, vectorized data validation.
+
+Rows are checked against ``config.DATA_SCHEMA`` with one boolean mask per
+rule. Failing rows are quarantined (with the rules they broke) instead of
+being dropped silently or coerced, and a compact report counts violations.
+"""
+import os
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import DATA_SCHEMA
+
+VIOLATIONS_COLUMN = "_violations"
+
+
+def rule_masks(df: pd.DataFrame, schema: Dict[str, Dict[str, Any]] = DATA_SCHEMA) -> Dict[str, np.ndarray]:
+    """
+    Evaluate every schema rule on a raw (uncoerced) chunk.
+    
+    Missing values are not violations; they are handled by cleaning and
+    imputation. Category labels are matched case- and whitespace-insensitively,
+    like encode_category does when they are encoded. Uniqueness is checked within the chunk only here; see
+    ValidationReport for uniqueness across chunks.
+    
+    Args:
+        df: DataFrame with normalized column names
+        schema: Column rules
+        
+    Returns:
+        Mapping of 'column:rule' to a boolean mask of violating rows
+    """
+    masks = {}
+    for col, rule in schema.items():
+        if col not in df.columns:
+            continue
+        raw = df[col]
+        present = raw.notna().to_numpy()
+        
+        if rule['type'] == 'numeric':
+            values = pd.to_numeric(raw, errors='coerce').to_numpy(dtype=float)
+            masks[f"{col}:type"] = present & np.isnan(values)
+            if 'min' in rule:
+                masks[f"{col}:min"] = values < rule['min']
+            if 'max' in rule:
+                masks[f"{col}:max"] = values > rule['max']
+        else:
+            lookup = {label.strip().lower() for label in rule['allowed']}
+            known = {u: str(u).strip().lower() in lookup for u in pd.unique(raw.dropna())}
+            allowed = raw.astype(object).map(known).fillna(False).to_numpy(dtype=bool)
+            masks[f"{col}:category"] = present & ~allowed
+        
+        if rule.get('unique'):
+            masks[f"{col}:unique"] = present & raw.duplicated(keep='first').to_numpy()
+    return masks
+
+
+def split_valid(
+    df: pd.DataFrame, 
+    schema: Dict[str, Dict[str, Any]] = DATA_SCHEMA
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, int]]:
+    """
+    Split a chunk into valid rows and quarantined rows in one vectorized pass.
+    
+    Args:
+        df: DataFrame with normalized column names (before numeric coercion)
+        schema: Column rules
+        
+    Returns:
+        Tuple of (valid rows, quarantined rows with a '_violations' column,
+        violation counts per 'column:rule')
+    """
+    masks = rule_masks(df, schema)
+    if not masks:
+        return df, df.iloc[:0], {}
+    
+    stacked = np.column_stack(list(masks.values()))
+    bad = stacked.any(axis=1)
+    counts = {name: int(n) for name, n in zip(masks, stacked.sum(axis=0)) if n}
+    
+    quarantined = df[bad].copy()
+    if len(quarantined):
+        names = np.array(list(masks), dtype=object)
+        bad_rules = stacked[bad]
+        quarantined[VIOLATIONS_COLUMN] = [";".join(names[row]) for row in bad_rules]
+    return df[~bad], quarantined, counts
+
+
+class ValidationReport:
+    """
+    Accumulates violation counts and quarantined rows across chunks.
+    
+    Also enforces uniqueness of 'unique' columns across chunks and partitions,
+    which a single chunk cannot see.
+    """
+    
+    def __init__(
+        self, 
+        quarantine_path: Optional[str] = None, 
+        schema: Dict[str, Dict[str, Any]] = DATA_SCHEMA
+    ):
+        self.schema = schema
+        self.quarantine_path = quarantine_path
+        self.rows_checked = 0
+        self.rows_quarantined = 0
+        self.counts: Dict[str, int] = {}
+        self._seen: Dict[str, set] = {
+            col: set() for col, rule in schema.items() if rule.get('unique')
+        }
+        self._quarantine_started = False
+        if quarantine_path and os.path.exists(quarantine_path):
+            os.remove(quarantine_path)
+    
+    def _quarantine(self, rows: Optional[pd.DataFrame]) -> None:
+        if rows is None or rows.empty:
+            return
+        self.rows_quarantined += len(rows)
+        if self.quarantine_path:
+            os.makedirs(os.path.dirname(self.quarantine_path) or ".", exist_ok=True)
+            rows.to_csv(self.quarantine_path, mode='a', index=False,
+                        header=not self._quarantine_started)
+            self._quarantine_started = True
+    
+    def add(
+        self, 
+        n_checked: int, 
+        quarantined: Optional[pd.DataFrame], 
+        counts: Dict[str, int]
+    ) -> None:
+        """
+        Record the outcome of split_valid on one chunk.
+        
+        Args:
+            n_checked: Rows in the chunk
+            quarantined: Quarantined rows (None if there were none)
+            counts: Violation counts per rule
+        """
+        self.rows_checked += n_checked
+        for name, n in counts.items():
+            self.counts[name] = self.counts.get(name, 0) + n
+        self._quarantine(quarantined)
+    
+    def check_unique(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Quarantine rows whose unique keys were already seen in earlier chunks.
+        
+        Args:
+            df: Valid rows of the current chunk
+            
+        Returns:
+            Rows with keys not seen before
+        """
+        for col, seen in self._seen.items():
+            if col not in df.columns or df.empty:
+                continue
+            keys = df[col]
+            dup = keys.isin(seen).to_numpy() & keys.notna().to_numpy()
+            if dup.any():
+                rows = df[dup].copy()
+                rows[VIOLATIONS_COLUMN] = f"{col}:unique"
+                self.counts[f"{col}:unique"] = self.counts.get(f"{col}:unique", 0) + int(dup.sum())
+                self._quarantine(rows)
+                df = df[~dup]
+            seen.update(keys.dropna().tolist())
+        return df
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact JSON-serializable summary."""
+        return {
+            'rows_checked': self.rows_checked,
+            'rows_quarantined': self.rows_quarantined,
+            'violations': dict(sorted(self.counts.items(), key=lambda kv: -kv[1])),
+            'quarantine_path': self.quarantine_path if self._quarantine_started else None,
+        }
+    
+    def print_summary(self) -> None:
+        """Print the violation report."""
+        print(f"Validation: {self.rows_quarantined} of {self.rows_checked} rows quarantined")
+        for name, n in sorted(self.counts.items(), key=lambda kv: -kv[1]):
+            print(f"  {name}: {n}")
+        if self._quarantine_started:
+            print(f"Quarantined rows written to {self.quarantine_path}")
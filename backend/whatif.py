@@ -0,0 +1,180 @@
+"""
+What-if prediction surfaces, partial dependence and ICE curves.
+
+For N students and a grid of values for one or two features, every
+combination is laid out as one broadcast (N x G1 [x G2], n_features) array
+and predicted in a single vectorized call (in row blocks for very large
+requests). ICE curves are the per-student rows of the surface and partial
+dependence is their mean.
+"""
+import argparse
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .artifacts import load_model_artifact
+from .config import FIGURES_DIR, METRICS_DIR, WHATIF_GRID_POINTS, WHATIF_MAX_ROWS, WHATIF_MAX_STUDENTS
+from .data import load_data
+from .plots import pdp_ice_plot
+from .scoring import predict_array
+from .utils import save_json
+
+
+def default_grid(values: np.ndarray, n_points: int = WHATIF_GRID_POINTS) -> np.ndarray:
+    """
+    Evenly spaced grid between the 5th and 95th percentiles of a feature.
+
+    Args:
+        values: Observed values of the feature
+        n_points: Number of grid points
+
+    Returns:
+        Grid values (the distinct values if the feature has fewer)
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    distinct = np.unique(values)
+    if len(distinct) <= n_points:
+        return distinct
+    low, high = np.percentile(values, [5, 95])
+    return np.linspace(low, high, n_points)
+
+
+def prediction_surface(
+    artifact: Dict[str, Any],
+    X: np.ndarray,
+    features: Sequence[str],
+    grids: Sequence[np.ndarray],
+    groups: Optional[np.ndarray] = None,
+    max_rows: int = WHATIF_MAX_ROWS
+) -> np.ndarray:
+    """
+    Predictions for every student at every grid combination of one or two features.
+
+    Args:
+        artifact: Model artifact
+        X: Base features of the students, in the artifact's feature order
+        features: One or two feature names to vary
+        grids: Grid of values for each varied feature
+        groups: Group label per student (per-cohort models only)
+        max_rows: Maximum rows predicted per vectorized call
+
+    Returns:
+        Array of shape (n_students, len(grids[0])[, len(grids[1])])
+    """
+    if len(features) not in (1, 2) or len(features) != len(grids):
+        raise ValueError("Vary one or two features, with one grid per feature")
+    missing = [f for f in features if f not in artifact['features']]
+    if missing:
+        raise ValueError(f"Features not in the model: {missing}")
+
+    X = np.asarray(X, dtype=float)
+    n, p = X.shape
+    grids = [np.asarray(g, dtype=float) for g in grids]
+    shape = tuple(len(g) for g in grids)
+    cells = int(np.prod(shape))
+    mesh = [m.ravel() for m in np.meshgrid(*grids, indexing='ij')]
+    columns = [artifact['features'].index(f) for f in features]
+
+    surface = np.empty((n, cells))
+    block = max(1, max_rows // cells)
+    for start in range(0, n, block):
+        rows = X[start:start + block]
+        batch = np.repeat(rows[:, None, :], cells, axis=1)  # (students, cells, features)
+        for col, values in zip(columns, mesh):
+            batch[:, :, col] = values
+        batch_groups = None if groups is None else np.repeat(groups[start:start + block], cells)
+        pred = predict_array(artifact, batch.reshape(-1, p), batch_groups)
+        surface[start:start + block] = pred.reshape(len(rows), cells)
+    return surface.reshape((n,) + shape)
+
+
+def partial_dependence(
+    artifact: Dict[str, Any],
+    X: np.ndarray,
+    features: Sequence[str],
+    grids: Optional[Sequence[np.ndarray]] = None,
+    groups: Optional[np.ndarray] = None,
+    n_points: int = WHATIF_GRID_POINTS
+) -> Dict[str, Any]:
+    """
+    Partial dependence and ICE curves of one or two features.
+
+    Args:
+        artifact: Model artifact
+        X: Base features of the students, in the artifact's feature order
+        features: One or two feature names
+        grids: Grid per feature (default: default_grid of the observed values)
+        groups: Group label per student (per-cohort models only)
+        n_points: Grid points per feature when grids are not given
+
+    Returns:
+        Dictionary with the grids, the ICE surface (one curve per student)
+        and the partial dependence (mean over students)
+    """
+    X = np.asarray(X, dtype=float)
+    if grids is None:
+        grids = [default_grid(X[:, artifact['features'].index(f)], n_points) for f in features]
+    ice = prediction_surface(artifact, X, features, grids, groups)
+    return {
+        'features': list(features),
+        'grids': [np.asarray(g, dtype=float) for g in grids],
+        'ice': ice,
+        'pd': ice.mean(axis=0),
+    }
+
+
+def _to_json(result: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-friendly result; ICE curves are kept for one-feature curves only."""
+    out = {
+        'features': result['features'],
+        'grids': [g.tolist() for g in result['grids']],
+        'pd': result['pd'].tolist(),
+    }
+    if len(result['features']) == 1:
+        out['ice'] = result['ice'].tolist()
+    return out
+
+
+def main():
+    """CLI for partial dependence / ICE curves of a saved model."""
+    parser = argparse.ArgumentParser(description='What-if Analysis for Student Scores')
+    parser.add_argument('--model-path', type=str, required=True,
+                        help='Path of the saved model')
+    parser.add_argument('--data-path', type=str, required=True,
+                        help='CSV of students to analyse (file, directory or glob)')
+    parser.add_argument('--features', type=str, required=True,
+                        help='One or two comma-separated features to vary')
+    parser.add_argument('--grid-points', type=int, default=WHATIF_GRID_POINTS,
+                        help='Grid points per feature')
+    parser.add_argument('--max-students', type=int, default=WHATIF_MAX_STUDENTS,
+                        help='Students sampled for the curves')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Output JSON path (default: outputs/whatif_<features>.json)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model_path):
+        print(f"Error: model not found at {args.model_path}")
+        sys.exit(1)
+
+    artifact = load_model_artifact(args.model_path)
+    features: List[str] = [f.strip() for f in args.features.split(',')]
+    labels = [artifact['group_by']] if artifact['group_by'] else []
+    df = load_data(args.data_path, columns=artifact['features'] + labels, label_columns=labels)
+    if len(df) > args.max_students:
+        df = df.sample(args.max_students, random_state=0)
+    groups = df[artifact['group_by']].to_numpy() if labels else None
+
+    result = partial_dependence(artifact, df[artifact['features']].to_numpy(dtype=float),
+                                features, groups=groups, n_points=args.grid_points)
+    name = "_".join(features)
+    output = args.output or os.path.join(METRICS_DIR, f"whatif_{name}.json")
+    save_json(output, _to_json(result))
+    print(f"What-if curves saved to {output}")
+    pdp_ice_plot(result, os.path.join(FIGURES_DIR, f"pdp_{name}.png"))
+
+
+if __name__ == "__main__":
+    main()
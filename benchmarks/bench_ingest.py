@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+CSV ingestion throughput benchmark.
+
+Compares plain ``pd.read_csv`` against the byte-range parallel reader in
+``backend/data.py`` and reports MB/s for each.
+
+Usage:
+    python benchmarks/bench_ingest.py --size-mb 256 --workers 8
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Optional
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.data import read_csv_parallel, write_synthetic_dataset  # noqa: E402
+
+# Average bytes per synthetic CSV row, used to size the input
+BYTES_PER_ROW = 110
+
+
+def make_input(path: str, size_mb: float, workers: Optional[int] = None) -> None:
+    """
+    Write a synthetic CSV of roughly ``size_mb`` megabytes.
+    
+    Args:
+        path: Output CSV path
+        size_mb: Target file size in megabytes
+        workers: Worker processes for the generator
+    """
+    n_rows = max(1, int(size_mb * 1024 * 1024 / BYTES_PER_ROW))
+    write_synthetic_dataset(path, n_rows, missing_rate=0.01, n_jobs=workers)
+
+
+def time_reader(name: str, fn, path: str, repeat: int) -> float:
+    """
+    Time a reader and print its best throughput.
+    
+    Args:
+        name: Label for the reader
+        fn: Callable taking the CSV path
+        path: CSV path
+        repeat: Number of timed runs (best is reported)
+        
+    Returns:
+        Best throughput in MB/s
+    """
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = fn(path)
+        best = min(best, time.perf_counter() - start)
+    throughput = size_mb / best
+    print(f"{name:<24} {best:8.3f} s  {throughput:8.1f} MB/s  ({len(df)} rows)")
+    return throughput
+
+
+def main():
+    """Run the ingestion benchmark."""
+    parser = argparse.ArgumentParser(description='CSV ingestion benchmark')
+    parser.add_argument('--data-path', type=str, default=None,
+                        help='Existing CSV to read (a synthetic file is written otherwise)')
+    parser.add_argument('--size-mb', type=float, default=128,
+                        help='Size of the synthetic CSV in MB')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for the parallel reader')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timed runs per reader')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = args.data_path
+        if path is None:
+            path = os.path.join(temp_dir, "bench.csv")
+            make_input(path, args.size_mb, args.workers)
+
+        print(f"Input: {path} ({os.path.getsize(path) / (1024 * 1024):.1f} MB)")
+        base = time_reader("pd.read_csv", pd.read_csv, path, args.repeat)
+        fast = time_reader("read_csv_parallel",
+                           lambda p: read_csv_parallel(p, n_jobs=args.workers),
+                           path, args.repeat)
+        print(f"Speedup: {fast / base:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
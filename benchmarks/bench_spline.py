@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Spline versus polynomial regression benchmark.
+
+Fits dense polynomial designs (the build_poly expansion + least squares)
+and sparse B-spline designs (additive, and with pairwise tensor terms) on
+synthetic records, and reports test RMSE, fit time and design memory.
+With --curvature the target gets smooth non-linear effects that a linear
+model cannot capture.
+
+Usage:
+    python benchmarks/bench_spline.py --rows 200000 --curvature
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.config import POLY_DEGREES, RANDOM_STATE, SPLINE_KNOTS  # noqa: E402
+from backend.data import generate_synthetic_data  # noqa: E402
+from backend.features import default_feature_names, poly_term_index  # noqa: E402
+from backend.modeling import train_linear, train_spline  # noqa: E402
+
+FEATURES = ['Hours_Studied', 'Attendance', 'Previous_Scores', 'Tutoring_Sessions',
+            'Sleep_Hours', 'Physical_Activity']
+
+
+def make_data(n_rows: int, curvature: bool, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Synthetic feature matrix and target.
+
+    Args:
+        n_rows: Number of records
+        curvature: Add smooth non-linear effects to the target
+        seed: Random seed
+
+    Returns:
+        Tuple of (X, y)
+    """
+    df = generate_synthetic_data(n_rows, seed=seed)
+    X = df[FEATURES].to_numpy(dtype=float)
+    y = df['Exam_Score'].to_numpy(dtype=float)
+    if curvature:
+        y = y + 3.0 * np.sin(X[:, 0] / 4.0) + 0.01 * (X[:, 1] - 80.0) ** 2 \
+            - 2.0 * np.abs(X[:, 4] - 7.0)
+    return X, y
+
+
+def design_bytes(design) -> int:
+    """Memory of a dense array or of a CSR matrix's data, indices and indptr."""
+    if hasattr(design, 'indptr'):
+        return design.data.nbytes + design.indices.nbytes + design.indptr.nbytes
+    return design.nbytes
+
+
+def run(name: str, fit: Callable[[], Tuple[Callable[[np.ndarray], np.ndarray], Callable]],
+        X_test: np.ndarray, y_test: np.ndarray, repeat: int) -> None:
+    """
+    Time a fit and print its test RMSE and design size.
+
+    Args:
+        name: Label for the model
+        fit: Callable returning (predict function, callable returning the training design)
+        X_test: Test features
+        y_test: Test targets
+        repeat: Number of timed fits (best is reported)
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        predict, design = fit()
+        best = min(best, time.perf_counter() - start)
+    design = design()
+    rmse = np.sqrt(np.mean((y_test - predict(X_test)) ** 2))
+    print(f"{name:<24} {design.shape[1]:6d} cols  {best:8.3f} s  "
+          f"{design_bytes(design) / 2 ** 20:9.1f} MB  RMSE {rmse:.4f}")
+
+
+def main():
+    """Run the spline benchmark."""
+    parser = argparse.ArgumentParser(description='Spline vs polynomial benchmark')
+    parser.add_argument('--rows', type=int, default=100000,
+                        help='Number of synthetic records (80%% are used for fitting)')
+    parser.add_argument('--knots', type=int, default=SPLINE_KNOTS,
+                        help='Knots per feature of the spline models')
+    parser.add_argument('--curvature', action='store_true',
+                        help='Add non-linear effects to the synthetic target')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timed fits per model')
+    args = parser.parse_args()
+
+    X, y = make_data(args.rows, args.curvature, RANDOM_STATE)
+    n_train = int(0.8 * len(X))
+    X_train, X_test, y_train, y_test = X[:n_train], X[n_train:], y[:n_train], y[n_train:]
+    print(f"{len(X_train)} training rows, {len(X_test)} test rows, {len(FEATURES)} features")
+
+    for degree in POLY_DEGREES:
+        index = poly_term_index(default_feature_names(len(FEATURES)), degree)
+
+        def fit_poly(index=index):
+            design = index.expand(X_train)
+            model = train_linear(design, y_train)
+            return lambda X_new: model.predict(index.expand(X_new)), lambda: design
+        run(f"poly degree {degree}", fit_poly, X_test, y_test, args.repeat)
+
+    for interactions in (False, True):
+        def fit_spline(interactions=interactions):
+            model = train_spline(X_train, y_train, n_knots=args.knots, interactions=interactions)
+            return model.predict, lambda: model.basis.transform(X_train)
+        run("spline + tensor" if interactions else "spline additive", fit_spline,
+            X_test, y_test, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
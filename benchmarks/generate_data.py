@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Synthetic dataset generator for load testing.
+
+Writes records with the full StudentPerformanceFactors schema, generated
+in parallel, deterministic chunks.
+
+Usage:
+    python benchmarks/generate_data.py --rows 100000000 --output data/synthetic
+    python benchmarks/generate_data.py --rows 1000000 --output data/synthetic.csv
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.config import RANDOM_STATE, SYNTH_CHUNK_ROWS  # noqa: E402
+from backend.data import write_synthetic_dataset  # noqa: E402
+
+
+def main():
+    """Generate a synthetic dataset."""
+    parser = argparse.ArgumentParser(description='Synthetic student dataset generator')
+    parser.add_argument('--rows', type=int, required=True,
+                        help='Number of records to generate')
+    parser.add_argument('--output', type=str, required=True,
+                        help='Output .csv file, or a directory of partition files')
+    parser.add_argument('--format', type=str, choices=['csv', 'parquet'], default='csv',
+                        help='Output format (parquet requires pyarrow)')
+    parser.add_argument('--seed', type=int, default=RANDOM_STATE,
+                        help='Base random seed')
+    parser.add_argument('--chunk-rows', type=int, default=SYNTH_CHUNK_ROWS,
+                        help='Records per independently seeded chunk')
+    parser.add_argument('--missing-rate', type=float, default=0.0,
+                        help='Fraction of feature values to blank out')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: one per CPU)')
+    args = parser.parse_args()
+
+    write_synthetic_dataset(
+        args.output, args.rows, seed=args.seed, fmt=args.format,
+        chunk_rows=args.chunk_rows, missing_rate=args.missing_rate, n_jobs=args.workers
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -141,4 +141,267 @@ def test_resolve_data_path():
         resolved = resolve_data_path(nonexistent_path, demo_path)
         
         assert resolved == demo_path
-        assert os.path.exists(demo_path)  # Should be created
\ No newline at end of file
+        assert os.path.exists(demo_path)  # Should be created
+
+def test_load_data_partitions():
+    """Test loading a directory of CSV partitions with a schema mismatch."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pd.DataFrame({'Study Hours': [1, 2], 'Final Score': [60, 70]}).to_csv(
+            os.path.join(temp_dir, 'school_a.csv'), index=False)
+        pd.DataFrame({'Study Hours': [3], 'Final Score': [80], 'Attendance': [95]}).to_csv(
+            os.path.join(temp_dir, 'school_b.csv'), index=False)
+
+        df = load_data(temp_dir, n_jobs=2)
+
+        assert list(df.columns) == ['study_hours', 'final_score', 'attendance']
+        assert len(df) == 3
+        assert df['attendance'].isna().sum() == 2
+
+        df_glob = load_data(os.path.join(temp_dir, 'school_*.csv'), n_jobs=1)
+        pd.testing.assert_frame_equal(df, df_glob)
+
+
+def test_read_csv_parallel_matches_read_csv():
+    """Test that byte-range parsing reassembles the same frame."""
+    from src.data import csv_byte_ranges, read_csv_parallel
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'big.csv')
+        rng = np.random.RandomState(0)
+        pd.DataFrame({
+            'study_hours': rng.randint(0, 40, 500),
+            'school_type': rng.choice(['Public', 'Private'], 500),
+            'final_score': rng.uniform(50, 100, 500).round(2),
+        }).to_csv(path, index=False)
+
+        names, ranges = csv_byte_ranges(path, 7)
+        assert names == ['study_hours', 'school_type', 'final_score']
+        assert ranges[0][0] > 0 and ranges[-1][1] == os.path.getsize(path)
+
+        expected = pd.read_csv(path)
+        result = read_csv_parallel(path, n_jobs=2)
+        assert len(result) == len(expected)
+        np.testing.assert_allclose(result['final_score'], expected['final_score'])
+        assert result['school_type'].tolist() == expected['school_type'].tolist()
+
+
+def test_read_csv_parallel_coerces_values_past_dtype_sample():
+    """Test that a bad cell after the dtype inference sample does not fail the parallel read."""
+    from src.data import iter_csv_parallel, read_csv_parallel
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'big.csv')
+        n = 12000
+        df = pd.DataFrame({
+            'study_hours': np.arange(n) % 40,
+            'final_score': np.linspace(50, 100, n).round(2).astype(object),
+        })
+        df.loc[11000, 'final_score'] = 'abc'
+        df.to_csv(path, index=False)
+
+        result = read_csv_parallel(path, n_jobs=2)
+        assert len(result) == n
+        assert result['final_score'].dtype == float
+        assert np.isnan(result.loc[11000, 'final_score'])
+        assert result['final_score'].notna().sum() == n - 1
+
+        projected = pd.concat(iter_csv_parallel(path, n_jobs=1, usecols=['final_score']),
+                              ignore_index=True)
+        assert list(projected.columns) == ['final_score']
+        assert np.isnan(projected.loc[11000, 'final_score'])
+
+def test_load_data_projection_and_filters():
+    """Test reading only requested columns with row predicates pushed down."""
+    from src.data import parse_filter
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'students.csv')
+        pd.DataFrame({
+            'Study Hours': [1, 2, 3, 4],
+            'School Type': ['Public', 'Private', 'Public', 'Public'],
+            'Attendance': [80, 85, 90, 95],
+            'Final Score': [60, 70, 80, 90],
+        }).to_csv(path, index=False)
+
+        filters = [parse_filter('school_type==Public'), parse_filter('final_score>=70')]
+        df = load_data(path, columns=['study_hours', 'final_score'], filters=filters)
+
+        assert list(df.columns) == ['study_hours', 'final_score']
+        assert df['study_hours'].tolist() == [3, 4]
+
+        with pytest.raises(ValueError, match="Missing columns"):
+            load_data(path, columns=['nonexistent'])
+
+
+def test_load_data_validation_quarantine():
+    """Test schema validation quarantines violations instead of loading them."""
+    from src.validation import ValidationReport
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pd.DataFrame({
+            'id': [1, 2, 3],
+            'study_hours': [5, 30, 4],
+            'school_type': ['Public', 'Public', 'Boarding'],
+            'final_score': [70, 80, 90],
+        }).to_csv(os.path.join(temp_dir, 'a.csv'), index=False)
+        pd.DataFrame({
+            'id': [1, 4],
+            'study_hours': [6, 7],
+            'school_type': ['Private', 'Public'],
+            'final_score': [75, 85],
+        }).to_csv(os.path.join(temp_dir, 'b.csv'), index=False)
+
+        quarantine_path = os.path.join(temp_dir, 'quarantine.csv')
+        report = ValidationReport(quarantine_path)
+        df = load_data(temp_dir, n_jobs=1, report=report)
+
+        assert df['id'].tolist() == [1, 4]
+        summary = report.to_dict()
+        assert summary['rows_checked'] == 5
+        assert summary['violations'] == {
+            'study_hours:max': 1, 'school_type:category': 1, 'id:unique': 1
+        }
+        quarantined = pd.read_csv(quarantine_path)
+        assert len(quarantined) == 3
+        assert '_violations' in quarantined.columns
+
+
+def test_load_data_schema_dtype_fallback_matches_serial(monkeypatch):
+    """Test that both read paths quarantine numeric text that does not fit the schema dtypes."""
+    import src.data
+    from src.validation import ValidationReport
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'students.csv')
+        df = pd.DataFrame({
+            'study_hours': (np.arange(400) % 20).astype(object),
+            'school_type': ['Public', 'Private'] * 200,
+            'final_score': np.linspace(50, 100, 400).round(2),
+        })
+        df.loc[350, 'study_hours'] = 'abc'
+        df.to_csv(path, index=False)
+
+        results = []
+        for n_jobs, min_bytes in [(1, 64 * 1024 * 1024), (2, 0)]:
+            monkeypatch.setattr(src.data, 'PARALLEL_READ_MIN_BYTES', min_bytes)
+            report = ValidationReport()
+            loaded = load_data(path, n_jobs=n_jobs, columns=['study_hours', 'final_score'],
+                               report=report)
+            assert report.to_dict()['violations'] == {'study_hours:type': 1}
+            results.append(loaded)
+
+        assert len(results[0]) == 399
+        pd.testing.assert_frame_equal(results[0].reset_index(drop=True),
+                                      results[1].reset_index(drop=True), check_dtype=False)
+
+def test_rule_masks_category_ignores_case():
+    """Test that category labels accepted by encode_category are not quarantined."""
+    from src.data import encode_category
+    from src.validation import rule_masks
+
+    labels = pd.Series(['Public', 'public', ' PRIVATE ', 'Boarding', None])
+    masks = rule_masks(pd.DataFrame({'school_type': labels}))
+
+    assert masks['school_type:category'].tolist() == [False, False, False, True, False]
+    codes = encode_category(labels, ['Public', 'Private'])
+    assert codes.notna().tolist() == [True, True, True, False, False]
+
+def test_load_data_dedup_exact_and_bloom():
+    """Test hash-based duplicate elimination across partitions."""
+    from src.data import Deduplicator
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pd.DataFrame({
+            'Study Hours': [1, 2, 2, 3],
+            'Gender': ['Male', 'Female', 'Female', 'Male'],
+            'Final Score': [60, 70, 70, 80],
+        }).to_csv(os.path.join(temp_dir, 'a.csv'), index=False)
+        pd.DataFrame({
+            'Study Hours': [3, 4],
+            'Gender': [' male', 'Female'],
+            'Final Score': [80, 90],
+        }).to_csv(os.path.join(temp_dir, 'b.csv'), index=False)
+
+        for method in ['exact', 'bloom']:
+            dedup = Deduplicator(method=method, capacity=1000)
+            df = load_data(temp_dir, n_jobs=1, dedup=dedup)
+
+            assert df['study_hours'].tolist() == [1, 2, 3, 4]
+            assert dedup.duplicates == 2
+
+
+def test_split_data_imputes_from_training_split_only():
+    """Test that fill values come from the training rows and persist with the imputer."""
+    import pickle
+    from src.imputation import StreamingImputer
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(10, 2, 200)
+    x[::7] = np.nan
+    df = pd.DataFrame({'x': x, 'z': rng.normal(size=200), 'y': rng.normal(size=200)})
+
+    imputer = StreamingImputer(strategy='median')
+    X_train, X_test, _, _ = split_data(df, ['x', 'z'], 'y', test_size=0.25,
+                                       random_state=1, imputer=imputer)
+
+    assert not np.isnan(X_train).any() and not np.isnan(X_test).any()
+    from sklearn.model_selection import train_test_split
+    raw_train, _ = train_test_split(df[['x', 'z']].values, test_size=0.25, random_state=1)
+    train_median = np.nanmedian(raw_train[:, 0])
+    assert abs(imputer.statistics_[0] - train_median) < 1e-12
+
+    restored = pickle.loads(pickle.dumps(imputer))
+    np.testing.assert_array_equal(restored.transform(df[['x', 'z']].values),
+                                  imputer.transform(df[['x', 'z']].values))
+
+
+def test_profile_dataset_matches_pandas():
+    """Test the streaming profile against in-memory pandas statistics."""
+    from src.profiling import profile_dataset
+
+    rng = np.random.default_rng(3)
+    n = 3000
+    a = rng.normal(50, 10, n)
+    b = 0.5 * a + rng.normal(0, 5, n)
+    b[::11] = np.nan
+    df = pd.DataFrame({
+        'Study Hours': a,
+        'Attendance': b,
+        'School Type': rng.choice(['Public', 'Private'], n, p=[0.7, 0.3]),
+    })
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for i in range(3):
+            df.iloc[i * 1000:(i + 1) * 1000].to_csv(os.path.join(temp_dir, f'p{i}.csv'), index=False)
+        profile = profile_dataset(temp_dir, n_jobs=1)
+
+    assert profile['n_rows'] == n
+    hours = profile['numeric']['study_hours']
+    assert abs(hours['mean'] - a.mean()) < 1e-9
+    assert abs(hours['std'] - a.std(ddof=1)) < 1e-9
+    assert abs(hours['quantiles']['0.5'] - np.median(a)) < 1.0
+    assert abs(profile['numeric']['attendance']['missing_rate'] - np.isnan(b).mean()) < 1e-12
+
+    expected = pd.Series(a).corr(pd.Series(b))
+    assert abs(profile['correlation']['matrix'][0][1] - expected) < 1e-9
+    assert profile['categorical']['school_type']['top'][0]['value'] == 'Public'
+
+
+def test_write_synthetic_dataset_is_deterministic():
+    """Test that synthetic data matches the schema and does not depend on worker count."""
+    from src.data import write_synthetic_dataset
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        single = os.path.join(temp_dir, 'one.csv')
+        parts = os.path.join(temp_dir, 'parts')
+        write_synthetic_dataset(single, 2500, seed=7, chunk_rows=1000, missing_rate=0.05, n_jobs=2)
+        write_synthetic_dataset(parts, 2500, seed=7, chunk_rows=1000, missing_rate=0.05, n_jobs=1)
+
+        a = load_data(single, n_jobs=1)
+        b = load_data(parts, n_jobs=1)
+
+    assert len(a) == 2500 and len(a.columns) == 20
+    pd.testing.assert_frame_equal(a, b)
+    assert a['hours_studied'].isna().mean() > 0
+    assert a['exam_score'].notna().all()
+    assert a['hours_studied'].corr(a['exam_score']) > 0.3
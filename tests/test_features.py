@@ -98,4 +98,31 @@ def test_get_feature_names_multiple():
     # Should have: study_hours, sleep_hours, study_hours^2, study_hours*sleep_hours, sleep_hours^2
     assert len(names_deg2) == 5
     assert 'study_hours' in names_deg2
-    assert 'sleep_hours' in names_deg2
\ No newline at end of file
+    assert 'sleep_hours' in names_deg2
+
+def test_poly_term_index_matches_sklearn():
+    """Test that the cached term index reproduces PolynomialFeatures."""
+    from sklearn.preprocessing import PolynomialFeatures
+    from src.features import poly_term_index
+
+    features = ('study_hours', 'sleep_hours', 'attendance')
+    X = np.random.RandomState(0).uniform(0, 10, (20, 3))
+
+    index = poly_term_index(features, 3)
+    reference = PolynomialFeatures(degree=3, include_bias=False).fit(X)
+
+    assert list(index.names) == reference.get_feature_names_out(list(features)).tolist()
+    np.testing.assert_array_equal(index.powers, reference.powers_)
+    np.testing.assert_allclose(index.expand(X), reference.transform(X))
+
+
+def test_poly_term_index_column_map_and_cache():
+    """Test that lower-degree designs are column prefixes and indexes are cached."""
+    from src.features import poly_term_index
+
+    X = np.array([[1.0, 2.0], [3.0, 4.0]])
+    index = poly_term_index(('a', 'b'), 3)
+
+    cols = index.column_map(2)
+    np.testing.assert_allclose(index.expand(X)[:, cols], build_poly(X, 2))
+    assert poly_term_index(('a', 'b'), 3) is index
@@ -162,4 +162,551 @@ def test_demo_data_performance():
     metrics = compute_metrics(y_test, y_pred)
     
     # Should achieve reasonable performance on synthetic data
-    assert metrics['r2'] > 0.5  # At least moderate correlation
\ No newline at end of file
+    assert metrics['r2'] > 0.5  # At least moderate correlation
+
+def test_analytic_kfold_matches_refit():
+    """Test closed-form k-fold CV against refitting on every fold."""
+    from sklearn.linear_model import LinearRegression
+    from sklearn.model_selection import KFold, cross_val_score
+    from src.modeling import analytic_kfold_rmse
+    from src.features import build_poly
+
+    X, y = create_quadratic_data(n_samples=60)
+    X_poly = build_poly(X, 3)
+
+    analytic = analytic_kfold_rmse(X_poly, y, k=4)
+    refit = -cross_val_score(LinearRegression(), X_poly, y, cv=KFold(n_splits=4),
+                             scoring='neg_root_mean_squared_error')
+
+    np.testing.assert_allclose(analytic, refit, rtol=1e-6)
+
+
+def test_loo_residuals_match_refit():
+    """Test PRESS residuals against explicit leave-one-out refits."""
+    from src.modeling import loo_residuals
+
+    X, y = create_linear_data(n_samples=30, noise=1.0)
+    press = loo_residuals(X, y)
+
+    for i in [0, 7, 29]:
+        mask = np.arange(len(y)) != i
+        model = train_linear(X[mask], y[mask])
+        expected = y[i] - predict(model, X[i:i + 1])[0]
+        assert press[i] == pytest.approx(expected, rel=1e-6)
+
+
+def test_cv_select_poly_degree_loo():
+    """Test leave-one-out degree selection."""
+    X, y = create_quadratic_data(n_samples=40)
+
+    result = cv_select_poly_degree(X, y, degrees=[2, 3], method='loo')
+
+    assert result['best_degree'] in [2, 3]
+    assert 'press' in result['cv_results'][2]
+
+
+def test_incremental_update_and_forget():
+    """Test that folding in and forgetting partitions matches full refits."""
+    from src.incremental import init_stats, update_stats, forget_stats, solve_stats
+
+    X, y = create_quadratic_data(n_samples=90, noise=1.0)
+    features = ['study_hours']
+
+    stats = init_stats(X[:60], y[:60], features, 'final_score', degree=2)
+    update_stats(stats, X[60:], y[60:])
+
+    from src.features import build_poly
+    full = train_linear(build_poly(X, 2), y)
+    updated = solve_stats(stats)
+    np.testing.assert_allclose(updated.coef_, full.coef_, rtol=1e-6)
+    assert updated.intercept_ == pytest.approx(full.intercept_, rel=1e-6)
+
+    forget_stats(stats, X[:30], y[:30])
+    partial = train_linear(build_poly(X[30:], 2), y[30:])
+    np.testing.assert_allclose(solve_stats(stats).coef_, partial.coef_, rtol=1e-6)
+    assert stats.n == 60
+
+
+def test_incremental_forget_skips_rows_never_folded_in():
+    """Test that forgetting rows outside the training split leaves the statistics intact."""
+    from src.data import row_hashes
+    from src.features import build_poly
+    from src.incremental import forget_stats, init_stats, solve_stats
+
+    X, y = create_quadratic_data(n_samples=90, noise=1.0)
+    hashes = row_hashes(pd.DataFrame({'study_hours': X[:, 0], 'final_score': y}))
+    stats = init_stats(X[:60], y[:60], ['study_hours'], 'final_score', degree=2,
+                       hashes=hashes[:60])
+
+    # Rows 40-59 were folded in; rows 60-79 (say, the test split) never were
+    forget_stats(stats, X[40:80], y[40:80], hashes=hashes[40:80])
+
+    assert stats.n == 40 and len(stats.row_hashes) == 40
+    refit = train_linear(build_poly(X[:40], 2), y[:40])
+    np.testing.assert_allclose(solve_stats(stats).coef_, refit.coef_, rtol=1e-6)
+    assert solve_stats(stats).intercept_ == pytest.approx(refit.intercept_, rel=1e-6)
+
+def test_incremental_forget_drops_neighbor_index(monkeypatch):
+    """Test that forgetting rows does not keep them in a saved similar-student index."""
+    import sys
+    from src.artifacts import load_model_artifact, save_model_artifact
+    from src.incremental import (
+        init_stats, load_stats, main, save_stats, solve_stats, stats_path_for
+    )
+    from src.neighbors import SimilarStudents
+
+    from src.data import row_hashes
+
+    X, y = create_quadratic_data(n_samples=60, noise=1.0)
+    features = ['study_hours']
+    df = pd.DataFrame({'study_hours': X[:, 0], 'final_score': y})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        model_path = os.path.join(temp_dir, 'linear_model.pkl')
+        stats = init_stats(X, y, features, 'final_score', hashes=row_hashes(df))
+        save_model_artifact(model_path, {'model': solve_stats(stats), 'features': features,
+                                         'target': 'final_score',
+                                         'neighbors': SimilarStudents(X, y)})
+        save_stats(stats_path_for(model_path), stats)
+        data_path = os.path.join(temp_dir, 'delete.csv')
+        df[:10].to_csv(data_path, index=False)
+
+        monkeypatch.setattr(sys, 'argv', ['incremental', 'forget', '--model-path', model_path,
+                                          '--data-path', data_path])
+        main()
+
+        artifact = load_model_artifact(model_path)
+        assert artifact['neighbors'] is None
+        assert load_stats(stats_path_for(model_path)).n == 50
+
+def test_fit_group_models_matches_per_group_fits():
+    """Test batched per-group solves against separate fits, with pooled fallback."""
+    from sklearn.linear_model import LinearRegression
+    from src.cohorts import fit_group_models
+
+    rng = np.random.default_rng(5)
+    n = 600
+    X = rng.normal(size=(n, 3))
+    groups = rng.choice(['A', 'B', 'C'], n).astype(object)
+    groups[:5] = 'tiny'
+    slopes = {'A': [1, 2, 3], 'B': [-1, 0, 1], 'C': [0.5, 0.5, 0.5], 'tiny': [9, 9, 9]}
+    y = np.array([X[i] @ slopes[g] for i, g in enumerate(groups)]) + rng.normal(0, 0.1, n)
+
+    model = fit_group_models(X, y, groups, 'cohort', min_rows=10)
+
+    for g in ['A', 'B', 'C']:
+        mask = groups == g
+        ref = LinearRegression().fit(X[mask], y[mask])
+        np.testing.assert_allclose(model.predict(X[mask], groups[mask]), ref.predict(X[mask]),
+                                   atol=1e-8)
+
+    pooled = LinearRegression().fit(X, y)
+    np.testing.assert_allclose(model.predict(X[:5], groups[:5]), pooled.predict(X[:5]), atol=1e-8)
+    np.testing.assert_allclose(model.predict(X[:2], ['unseen', None]), pooled.predict(X[:2]),
+                               atol=1e-8)
+
+
+def test_grouped_gram_matches_weighted_gram():
+    """Test per-group BLAS Gram matrices against the weighted reduction, skipping code -1."""
+    from src.cohorts import grouped_gram, weighted_gram
+
+    rng = np.random.default_rng(10)
+    A = np.column_stack([np.ones(400), rng.normal(size=(400, 4))])
+    y = rng.normal(size=400)
+    codes = rng.integers(-1, 3, 400)
+    codes[codes == 1] = 2  # group 1 is empty
+
+    W = np.zeros((3, 400))
+    W[codes[codes >= 0], np.flatnonzero(codes >= 0)] = 1.0
+    grouped, weighted = grouped_gram(A, y, codes, 3), weighted_gram(A, y, W, chunk_rows=7)
+    for key in ['xtx', 'xty', 'n']:
+        np.testing.assert_allclose(grouped[key], weighted[key], atol=1e-10)
+    assert grouped['n'][1] == 0
+
+
+def test_stepwise_select_recovers_true_terms():
+    """Test that QR-updated stepwise selection matches refit LOO error and finds the signal."""
+    from src.modeling import stepwise_select, loo_residuals
+
+    rng = np.random.default_rng(11)
+    X = rng.normal(size=(400, 12))
+    X[:, 7] = X[:, 2] + 1e-12 * rng.normal(size=400)  # near-duplicate column
+    y = 3 * X[:, 0] - 2 * X[:, 4] + X[:, 9] + rng.normal(0, 0.5, 400)
+
+    for direction in ['forward', 'backward', 'both']:
+        result = stepwise_select(X, y, direction=direction)
+        assert {0, 4, 9} <= set(result['selected'])
+        refit = loo_residuals(X[:, result['selected']], y)
+        assert abs(result['loo_rmse'] - np.sqrt(np.mean(refit ** 2))) < 1e-8
+
+    capped = stepwise_select(X, y, direction='forward', max_terms=2)
+    assert capped['selected'] == [0, 4]
+
+
+def test_permutation_importance_incremental_matches_repredict():
+    """Test that delta-y importance updates equal re-predicting the permuted data."""
+    from sklearn.linear_model import LinearRegression
+    from src.features import poly_term_index
+    from src.importance import permutation_importance
+
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(300, 3))
+    y = X[:, 0] ** 2 + 2 * X[:, 1] * X[:, 2] + rng.normal(0, 0.1, 300)
+    features = ['a', 'b', 'c']
+    model = LinearRegression().fit(poly_term_index(tuple(features), 2).expand(X), y)
+    artifact = {'model': model, 'degree': 2, 'features': features, 'imputer': None,
+                'terms': None, 'group_by': None}
+
+    class PredictOnly:
+        def predict(self, design):
+            return model.predict(design)
+
+    fast = permutation_importance(artifact, X, y, n_repeats=20, random_state=0)
+    slow = permutation_importance(dict(artifact, model=PredictOnly()), X, y,
+                                  n_repeats=20, random_state=0)
+
+    for f in features:
+        assert abs(fast['importances'][f]['mean'] - slow['importances'][f]['mean']) < 1e-9
+    assert all(fast['importances'][f]['mean'] > 0.1 for f in features)
+
+
+def test_explain_array_is_additive():
+    """Test that base value plus per-feature contributions reproduces predictions."""
+    from sklearn.linear_model import LinearRegression
+    from src.features import poly_term_index
+    from src.scoring import explain_array, predict_array
+
+    rng = np.random.default_rng(4)
+    X = rng.normal(size=(200, 3))
+    y = X[:, 0] + X[:, 1] * X[:, 2] + rng.normal(0, 0.1, 200)
+    design = poly_term_index(('a', 'b', 'c'), 2).expand(X)
+    artifact = {'model': LinearRegression().fit(design, y), 'degree': 2,
+                'features': ['a', 'b', 'c'], 'imputer': None, 'terms': None,
+                'group_by': None, 'design_means': design.mean(axis=0)}
+
+    base, contrib = explain_array(artifact, X)
+
+    np.testing.assert_allclose(base + contrib.sum(axis=1), predict_array(artifact, X), atol=1e-10)
+    np.testing.assert_allclose(contrib.mean(axis=0), 0, atol=1e-10)
+    # The b*c interaction is split evenly between b and c
+    assert abs(contrib[:, 1].std() - contrib[:, 2].std()) < 0.2
+
+
+def test_score_file_explain_builds_design_once(monkeypatch):
+    """Test that scoring with explanations builds each chunk's design only once."""
+    import src.scoring
+    from src.artifacts import save_model_artifact
+    from src.features import poly_term_index
+    from src.scoring import score_file
+
+    rng = np.random.default_rng(5)
+    X = rng.uniform(0, 10, size=(120, 2))
+    y = X[:, 0] * X[:, 1] + rng.normal(0, 0.1, 120)
+    model = train_poly(X, y, 2)
+    design = poly_term_index(('a', 'b'), 2).expand(X)
+    artifact = {'model': model, 'degree': 2, 'features': ['a', 'b'], 'imputer': None,
+                'terms': None, 'group_by': None, 'design_means': design.mean(axis=0)}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        model_path = os.path.join(temp_dir, 'poly_degree_2.pkl')
+        save_model_artifact(model_path, artifact)
+        data_path = os.path.join(temp_dir, 'students.csv')
+        pd.DataFrame(X, columns=['a', 'b']).to_csv(data_path, index=False)
+
+        calls = []
+        build = src.scoring.design_from_array
+        monkeypatch.setattr(src.scoring, 'design_from_array',
+                            lambda *a, **k: calls.append(1) or build(*a, **k))
+        score_file(model_path, data_path, os.path.join(temp_dir, 'scores.csv'),
+                   explain_path=os.path.join(temp_dir, 'explain'))
+        assert len(calls) == 1
+
+def test_score_file_rejects_explain_before_writing():
+    """Test that --explain on a model without coefficients fails before any output."""
+    from src.artifacts import save_model_artifact
+    from src.modeling import train_spline
+    from src.scoring import score_file
+
+    rng = np.random.default_rng(6)
+    X = rng.uniform(0, 10, size=(200, 2))
+    y = np.sin(X[:, 0]) + X[:, 1]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        model_path = os.path.join(temp_dir, 'spline_model.pkl')
+        save_model_artifact(model_path, {'model': train_spline(X, y, n_knots=6),
+                                         'features': ['a', 'b']})
+        data_path = os.path.join(temp_dir, 'students.csv')
+        pd.DataFrame(X, columns=['a', 'b']).to_csv(data_path, index=False)
+        output_path = os.path.join(temp_dir, 'scores.csv')
+
+        with pytest.raises(ValueError, match="linear or polynomial"):
+            score_file(model_path, data_path, output_path,
+                       explain_path=os.path.join(temp_dir, 'explain'))
+        assert not os.path.exists(output_path)
+
+def test_prediction_surface_matches_pointwise_predictions():
+    """Test the broadcast what-if surface against one-at-a-time predictions."""
+    from src.scoring import predict_array
+    from src.whatif import partial_dependence, prediction_surface
+
+    rng = np.random.default_rng(8)
+    X = rng.normal(size=(50, 3))
+    y = X[:, 0] + X[:, 1] * X[:, 2]
+    model = train_poly(X, y, 2)
+    artifact = {'model': model, 'degree': 2, 'features': ['a', 'b', 'c'], 'imputer': None,
+                'terms': None, 'group_by': None}
+    grid_a, grid_b = np.linspace(-1, 1, 4), np.array([0.0, 2.0])
+
+    surface = prediction_surface(artifact, X, ['a', 'b'], [grid_a, grid_b], max_rows=16)
+
+    assert surface.shape == (50, 4, 2)
+    X_point = X[7].copy()
+    X_point[0], X_point[1] = grid_a[3], grid_b[1]
+    assert abs(surface[7, 3, 1] - predict_array(artifact, X_point[None])[0]) < 1e-9
+
+    result = partial_dependence(artifact, X, ['a'], grids=[grid_a])
+    np.testing.assert_allclose(result['pd'], result['ice'].mean(axis=0))
+
+
+def test_counterfactuals_reach_target_within_bounds():
+    """Test batched counterfactuals for linear (closed form) and polynomial models."""
+    from src.counterfactual import counterfactuals
+
+    rng = np.random.default_rng(3)
+    X = np.column_stack([rng.uniform(0, 10, 200), rng.uniform(50, 100, 200),
+                         rng.uniform(40, 100, 200)])
+    y = 2 * X[:, 0] + 0.3 * X[:, 1] + 0.2 * X[:, 2] + 0.05 * X[:, 0] * X[:, 1]
+    features = ['study_hours', 'attendance', 'previous_scores']
+    target = np.percentile(y, 60)
+
+    for model, degree in [(train_linear(X, y), None), (train_poly(X, y, 2), 2)]:
+        artifact = {'model': model, 'degree': degree, 'features': features, 'imputer': None,
+                    'terms': None, 'group_by': None}
+        result = counterfactuals(artifact, X, target, bounds={'study_hours': (0, 12)})
+        below = result['predicted'] < target
+
+        assert np.all(result['delta'][:, 2] == 0)  # immutable
+        assert np.all(result['delta'][~below] == 0)
+        assert np.all(result['X'][:, 0] <= 12 + 1e-9) and np.all(result['X'][:, 1] <= 100 + 1e-9)
+        reached = below & result['feasible']
+        assert reached.any()
+        np.testing.assert_allclose(result['achieved'][reached], target, atol=1e-4)
+
+    # Unbounded linear case: the minimum-norm step is along the coefficients
+    artifact['model'], artifact['degree'] = train_linear(X, y), None
+    result = counterfactuals(artifact, X[:1], artifact['model'].predict(X[:1])[0] + 1.0,
+                             bounds={'study_hours': (-np.inf, np.inf),
+                                     'attendance': (-np.inf, np.inf)})
+    w = artifact['model'].coef_[:2]
+    np.testing.assert_allclose(result['delta'][0, :2], w / (w @ w), rtol=1e-6)
+
+
+def test_similar_students_kdtree_and_brute_match_full_scan():
+    """Test batched k-NN lookups against a full scan, including after pickling."""
+    import pickle
+    from src.neighbors import SimilarStudents
+
+    rng = np.random.default_rng(5)
+    X = rng.normal(size=(300, 4)) * [1, 10, 100, 0.1]
+    y = rng.uniform(50, 100, 300)
+    queries = rng.normal(size=(40, 4)) * [1, 10, 100, 0.1]
+
+    Z, Q = (X - X.mean(axis=0)) / X.std(axis=0), (queries - X.mean(axis=0)) / X.std(axis=0)
+    expected = np.argsort(((Q[:, None, :] - Z[None]) ** 2).sum(axis=2), axis=1)[:, :5]
+
+    for method in ['kdtree', 'brute']:
+        index = pickle.loads(pickle.dumps(SimilarStudents(X, y, ids=np.arange(300) + 1000,
+                                                          method=method)))
+        found = index.lookup(queries, k=5)
+        np.testing.assert_array_equal(found['ids'], expected + 1000)
+        np.testing.assert_allclose(found['scores'], y[expected])
+        assert np.all(np.diff(found['distances'], axis=1) >= 0)
+
+
+def test_prediction_interval_matches_explicit_inverse():
+    """Test blocked Cholesky prediction intervals against the textbook formula."""
+    from scipy import stats
+    from src.intervals import fit_interval_stats, prediction_interval
+
+    rng = np.random.default_rng(11)
+    X = rng.uniform(0, 10, size=(80, 3))
+    y = X @ [1.0, -2.0, 0.5] + rng.normal(0, 1.5, 80)
+    model = train_linear(X, y)
+    artifact = {'intervals': fit_interval_stats(X, y - model.predict(X))}
+    X_new = rng.uniform(0, 12, size=(25, 3))
+    pred = model.predict(X_new)
+
+    lower, upper = prediction_interval(artifact, X_new, pred, level=0.9, block_rows=7)
+
+    A, A_new = np.column_stack([np.ones(80), X]), np.column_stack([np.ones(25), X_new])
+    sigma2 = np.sum((y - model.predict(X)) ** 2) / (80 - 4)
+    leverage = np.einsum('ij,jk,ik->i', A_new, np.linalg.inv(A.T @ A), A_new)
+    half = stats.t.ppf(0.95, 76) * np.sqrt(sigma2 * (1 + leverage))
+    np.testing.assert_allclose(lower, pred - half, rtol=1e-8)
+    np.testing.assert_allclose(upper, pred + half, rtol=1e-8)
+
+
+def test_score_file_interval_says_why_unavailable():
+    """Test that scoring with --interval names the reason a model has no intervals."""
+    from src.artifacts import save_model_artifact
+    from src.scoring import score_file
+
+    rng = np.random.default_rng(12)
+    X = rng.uniform(0, 10, size=(50, 2))
+    model = train_linear(X, X @ [1.0, 2.0])
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        model_path = os.path.join(temp_dir, 'linear_model.pkl')
+        save_model_artifact(model_path, {'model': model, 'features': ['a', 'b'],
+                                         'intervals': None,
+                                         'intervals_unavailable': "bagged ensembles (--bagging)"})
+        data_path = os.path.join(temp_dir, 'students.csv')
+        pd.DataFrame(X, columns=['a', 'b']).to_csv(data_path, index=False)
+
+        with pytest.raises(ValueError, match="bagged ensembles"):
+            score_file(model_path, data_path, os.path.join(temp_dir, 'scores.csv'),
+                       interval=0.95)
+
+def test_bootstrap_intervals_are_reproducible_and_cover_estimates():
+    """Test batched bootstrap metric and coefficient intervals."""
+    from src.bootstrap import bootstrap_coefficients, bootstrap_metrics
+
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(150, 2))
+    y = 1.0 + X @ [2.0, -1.0] + rng.normal(0, 0.5, 150)
+    model = train_linear(X, y)
+    y_pred = model.predict(X)
+
+    serial = bootstrap_metrics(y, y_pred, n_resamples=250, random_state=0, n_jobs=1)
+    parallel = bootstrap_metrics(y, y_pred, n_resamples=250, random_state=0, n_jobs=2)
+    assert serial == parallel
+    rmse = compute_metrics(y, y_pred)['rmse']
+    assert serial['rmse']['lower'] < rmse < serial['rmse']['upper']
+
+    coefs = bootstrap_coefficients(X, y, names=['a', 'b'], n_resamples=250)
+    for name, value in zip(['intercept', 'a', 'b'], [model.intercept_, *model.coef_]):
+        assert coefs[name]['lower'] < value < coefs[name]['upper']
+        assert abs(coefs[name]['mean'] - value) < 3 * coefs[name]['std'] / np.sqrt(250) + 0.02
+
+
+def test_successive_halving_prunes_and_finds_the_true_degree():
+    """Test ridge paths against OLS and the budgeted successive-halving search."""
+    from src.search import ridge_path, successive_halving
+
+    rng = np.random.default_rng(4)
+    X = rng.uniform(-2, 2, size=(900, 3))
+    y = X[:, 0] ** 2 + X[:, 1] + rng.normal(0, 0.1, 900)
+
+    coef, intercept = ridge_path(X, y, [0.0, 10.0])
+    ols = train_linear(X, y)
+    np.testing.assert_allclose(coef[0], ols.coef_, atol=1e-8)
+    np.testing.assert_allclose(intercept[0], ols.intercept_, atol=1e-8)
+    assert np.linalg.norm(coef[1]) < np.linalg.norm(coef[0])
+
+    result = successive_halving(X, y, ['a', 'b', 'c'], degrees=[1, 2, 3], alphas=[0.0, 1.0],
+                                min_rows=50)
+    assert result['best']['degree'] == 2
+    assert {'a', 'b'} <= set(result['best']['features'])
+    rungs = [t['rung'] for t in result['trace']]
+    assert rungs.count(0) == result['n_configs'] == 24
+    assert rungs.count(max(rungs)) < rungs.count(0)
+
+
+def test_hgb_bins_are_cached_and_model_predicts_raw_features():
+    """Test uint8 feature binning, the bin cache and the boosting wrapper."""
+    from src.boosting import FeatureBinner, binned_training_data
+    from src.modeling import train_hgb
+
+    rng = np.random.default_rng(6)
+    X = np.column_stack([rng.normal(size=600), rng.integers(0, 3, 600)])
+    y = np.sin(X[:, 0]) * (1 + X[:, 1]) + rng.normal(0, 0.05, 600)
+
+    codes = FeatureBinner(max_bins=16).fit(X).transform(X)
+    assert codes.dtype == np.uint8
+    assert len(np.unique(codes[:, 0])) == 16 and set(np.unique(codes[:, 1])) == {0, 1, 2}
+    assert np.all(np.diff(codes[np.argsort(X[:, 0]), 0].astype(int)) >= 0)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        binner, first = binned_training_data(X, ['a', 'b'], cache_dir=cache_dir)
+        _, second = binned_training_data(X, ['a', 'b'], cache_dir=cache_dir)
+        assert len(os.listdir(cache_dir)) == 1
+        np.testing.assert_array_equal(first, second)
+
+    model = train_hgb(X, y, max_leaf_nodes=15, features=['a', 'b'], cache_dir=None)
+    assert r2_score(y, model.predict(X)) > 0.95
+
+
+def test_spline_basis_is_sparse_partition_of_unity_and_fits_curves():
+    """Test the sparse B-spline design and the spline model on a non-linear target."""
+    from src.features import SplineBasis
+    from src.modeling import train_spline
+
+    rng = np.random.default_rng(7)
+    X = np.column_stack([rng.uniform(0, 10, 800), rng.uniform(-1, 1, 800), np.ones(800)])
+    y = np.sin(X[:, 0]) + X[:, 1] ** 2 + rng.normal(0, 0.05, 800)
+
+    basis = SplineBasis(n_knots=8, interactions=True, tensor_knots=4).fit(X)
+    B = basis.transform(np.vstack([X, [[-5.0, 3.0, 1.0]]]))
+    n_main = 2 * (8 + 3 - 1)
+    assert B.shape == (801, basis.n_columns) == (801, n_main + (4 + 3 - 1) ** 2)
+    assert basis.pairs == [(0, 1)] and len(basis.names(['a', 'b', 'c'])) == B.shape[1]
+    assert np.all(np.diff(B.indptr) == 2 * 4 + 16)
+    dense = B.toarray()
+    np.testing.assert_allclose(dense[:, :10].sum(axis=1), 1.0)
+    np.testing.assert_allclose(dense[:, n_main:].sum(axis=1), 1.0)
+
+    model = train_spline(X, y, n_knots=12)
+    assert r2_score(y, model.predict(X)) > 0.99
+    assert r2_score(y, train_linear(X, y).predict(X)) < 0.5
+
+
+def test_solver_selection_and_standardized_poly_fit():
+    """Test conditioning-based solver choice and the raw-coefficient mapping of train_poly."""
+    from src.features import build_poly
+    from src.solvers import least_squares
+
+    rng = np.random.default_rng(8)
+    X = np.column_stack([rng.uniform(60, 100, 2000), rng.uniform(0, 10, 2000)])
+    y = 0.02 * (X[:, 0] - 80) ** 2 + np.sin(X[:, 1]) + rng.normal(0, 0.1, 2000)
+
+    fits = {s: least_squares(X, y, s) for s in ['auto', 'cholesky', 'qr', 'svd']}
+    assert fits['auto'][2]['solver'] == 'cholesky'
+    for coef, intercept, _ in fits.values():
+        np.testing.assert_allclose(coef, fits['svd'][0], rtol=1e-8)
+
+    X_poly = build_poly(X, 5)
+    raw_coef, raw_intercept, raw_info = least_squares(X_poly, y)
+    assert raw_info['solver'] in ('qr', 'svd') and raw_info['condition_number'] > 1e5
+
+    model = train_poly(X, y, degree=5)
+    assert model.solver_info_['solver'] == 'cholesky' and model.solver_info_['standardized']
+    X_new = np.column_stack([rng.uniform(60, 100, 50), rng.uniform(0, 10, 50)])
+    np.testing.assert_allclose(predict(model, build_poly(X_new, 5)),
+                               build_poly(X_new, 5) @ raw_coef + raw_intercept, atol=1e-6)
+
+    duplicated = np.column_stack([X, X[:, 0]])
+    _, _, info = least_squares(duplicated, y, 'cholesky')
+    assert info['solver'] == 'svd'
+
+
+def test_bagged_ensemble_collapses_to_one_model_and_uses_shared_memory_workers():
+    """Test block-Gram bagging: worker-count independence and the averaged model."""
+    from src.bagging import fit_bagged
+    from src.features import build_poly
+    from src.modeling import train_bagged
+
+    rng = np.random.default_rng(9)
+    X = np.column_stack([rng.uniform(60, 100, 3000), rng.uniform(0, 10, 3000)])
+    y = 0.05 * X[:, 0] + 0.3 * X[:, 1] ** 2 + rng.normal(0, 0.5, 3000)
+
+    serial = fit_bagged(X, y, 40, degree=2, n_jobs=1)
+    shared = fit_bagged(X, y, 40, degree=2, n_jobs=2)
+    np.testing.assert_allclose(serial[0], shared[0], rtol=1e-10)
+    assert serial[2]['n_members'] == 40 and 0.4 < serial[2]['oob_rmse'] < 0.6
+
+    model = train_bagged(X, y, 40, degree=2, method='subsample', n_jobs=1)
+    reference = train_poly(X, y, degree=2)
+    X_poly = build_poly(X, 2)
+    assert model.coef_.shape == reference.coef_.shape
+    np.testing.assert_allclose(predict(model, X_poly), predict(reference, X_poly), atol=0.1)
+    assert model.bagging_info_['method'] == 'subsample'